@@ -46,6 +46,7 @@ class LoadedLayer(TypedDict):
     name: str
     type: str
     dataset_id: NotRequired[str]
+    stats: NotRequired[dict[str, Any]]
 
 
 class PendingProcessingTool(TypedDict):
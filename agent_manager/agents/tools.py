@@ -36,7 +36,8 @@ def list_loaded_vector_layers(
 
     Use this to resolve a user's layer reference (e.g. "the buildings layer")
     to a concrete dataset id before invoking a processing tool.
-    Returns a list of objects with id, name, type, and dataset_id.
+    Returns a list of objects with id, name, type, dataset_id and, when known,
+    stats (feature_count, extent, geometry_types and property fields).
     """
     layers = state.get("loaded_layers") or []
 
@@ -82,7 +82,9 @@ class ChatConsumer(AsyncWebsocketConsumer):
             await self.send(text_data=json.dumps({"error": "Message content is required."}))
             return
 
-        loaded_layers = self._parse_loaded_layers(payload.get("context"))
+        loaded_layers = await self.attach_dataset_stats(
+            self._parse_loaded_layers(payload.get("context"))
+        )
 
         if len(message) > MAX_MESSAGE_LENGTH:
             await self.send(
@@ -342,6 +344,46 @@ class ChatConsumer(AsyncWebsocketConsumer):
         except ObjectDoesNotExist:
             return None
 
+    @sync_to_async
+    def attach_dataset_stats(self, loaded_layers: list[dict]) -> list[dict]:
+        """Add the materialized stats of each vector layer's dataset."""
+        from web_gis_app.constants import DatasetType
+        from web_gis_app.models import Dataset
+        from web_gis_app.services import DatasetStatsService
+
+        dataset_ids = set()
+
+        for layer in loaded_layers:
+            try:
+                dataset_ids.add(UUID(layer.get("dataset_id", "")))
+            except ValueError:
+                continue
+
+        if not dataset_ids:
+            return loaded_layers
+
+        datasets = Dataset.objects.filter(
+            pk__in=dataset_ids,
+            type=DatasetType.VECTOR,
+            dataset_node__user=self.user,
+        ).select_related("stats")
+        stats_by_dataset = {}
+
+        for dataset in datasets:
+            stats = DatasetStatsService.get_fresh_stats(dataset=dataset)
+            stats_by_dataset[str(dataset.pk)] = {
+                "feature_count": stats.feature_count,
+                "extent": stats.extent,
+                "geometry_types": stats.geometry_types,
+                "fields": stats.property_schema,
+            }
+
+        for layer in loaded_layers:
+            if stats := stats_by_dataset.get(layer.get("dataset_id", "").lower()):
+                layer["stats"] = stats
+
+        return loaded_layers
+
     @sync_to_async
     def create_message(self, session_id, user_id, content, role, status=MessageStatus.COMPLETE):
         return Message.objects.create(
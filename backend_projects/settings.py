@@ -195,6 +195,98 @@ CELERY_BEAT_SCHEDULE = {
     },
 }
 
+# Task queues, each consumed by its own worker pool (see celeryWorkers in
+# k8s/apps/backend/values.yaml) so short tasks never wait behind long ones:
+# raster — memory-heavy raster processing, vector — DB-bound vector ops,
+# light — image variants and periodic housekeeping.
+RASTER_TASK_QUEUE = "raster"
+VECTOR_TASK_QUEUE = "vector"
+LIGHT_TASK_QUEUE = "light"
+
+# Soft/hard time limits (seconds) of tasks by the queue they run on.
+TASK_QUEUE_TIME_LIMITS = {
+    RASTER_TASK_QUEUE: {"soft_time_limit": 7200, "time_limit": 7800},
+    VECTOR_TASK_QUEUE: {"soft_time_limit": 1800, "time_limit": 2100},
+    LIGHT_TASK_QUEUE: {"soft_time_limit": 300, "time_limit": 360},
+}
+
+_TASK_QUEUES = {
+    "web_gis_app.tasks.generate_cog_task": RASTER_TASK_QUEUE,
+    # Default only; jobs are sent to a queue picked from their input size.
+    "web_gis_app.tasks.run_processing_tool": RASTER_TASK_QUEUE,
+    "dead_stock_app.tasks.generate_image_variants": LIGHT_TASK_QUEUE,
+    "dead_stock_app.tasks.sweep_stale_items": LIGHT_TASK_QUEUE,
+    "agent_manager.tasks.cleanup_stale_pending_messages": LIGHT_TASK_QUEUE,
+    "web_gis_app.tasks.monitor_batch_job": LIGHT_TASK_QUEUE,
+}
+
+CELERY_TASK_DEFAULT_QUEUE = LIGHT_TASK_QUEUE
+CELERY_TASK_ROUTES = {task: {"queue": queue} for task, queue in _TASK_QUEUES.items()}
+CELERY_TASK_ANNOTATIONS = {
+    task: TASK_QUEUE_TIME_LIMITS[queue] for task, queue in _TASK_QUEUES.items()
+}
+# Ack after the task finishes so a crashed worker's task is redelivered; the
+# visibility timeout must outlive the longest hard time limit.
+CELERY_TASK_ACKS_LATE = True
+CELERY_BROKER_TRANSPORT_OPTIONS = {"visibility_timeout": 10800}
+
+# Processing jobs whose inputs are at most this size run on the light queue.
+WEB_GIS_LIGHT_JOB_MAX_BYTES = int(
+    os.environ.get("WEB_GIS_LIGHT_JOB_MAX_BYTES", str(5 * 1024 * 1024))
+)
+
+# Web GIS — read source rasters straight from object storage (/vsis3/) for
+# tools that support it instead of downloading them first.
+WEB_GIS_RASTER_REMOTE_READ = (
+    os.environ.get("WEB_GIS_RASTER_REMOTE_READ", "true").lower() == "true"
+)
+# Web GIS — threads GDAL's warper uses when raster ops reproject windows on the fly.
+WEB_GIS_WARP_THREADS = os.environ.get("WEB_GIS_WARP_THREADS", "ALL_CPUS")
+
+# Web GIS — raster processing jobs with inputs above WEB_GIS_BATCH_JOB_MIN_BYTES
+# run as their own Kubernetes Job, sized from the input, instead of inside the
+# shared workers. Disabled while no image is configured.
+WEB_GIS_BATCH_JOB_IMAGE = os.environ.get("WEB_GIS_BATCH_JOB_IMAGE", "")
+WEB_GIS_BATCH_JOB_MIN_BYTES = int(
+    os.environ.get("WEB_GIS_BATCH_JOB_MIN_BYTES", str(1024**3))
+)
+# Memory limit = input size x factor, clamped to [MIN, MAX] MiB.
+WEB_GIS_BATCH_JOB_MEMORY_FACTOR = float(
+    os.environ.get("WEB_GIS_BATCH_JOB_MEMORY_FACTOR", "6")
+)
+WEB_GIS_BATCH_JOB_MIN_MEMORY_MB = int(
+    os.environ.get("WEB_GIS_BATCH_JOB_MIN_MEMORY_MB", "2048")
+)
+WEB_GIS_BATCH_JOB_MAX_MEMORY_MB = int(
+    os.environ.get("WEB_GIS_BATCH_JOB_MAX_MEMORY_MB", "32768")
+)
+WEB_GIS_BATCH_JOB_CPU = os.environ.get("WEB_GIS_BATCH_JOB_CPU", "2")
+WEB_GIS_BATCH_JOB_POLL_SECONDS = 30
+
+# Workflows — let cacheable operations reuse results of identical earlier runs.
+WORKFLOW_RESULT_CACHE_ENABLED = (
+    os.environ.get("WORKFLOW_RESULT_CACHE_ENABLED", "true").lower() == "true"
+)
+
+# Server-sent events — one Redis subscription per process fans out to clients.
+SSE_HEARTBEAT_SECONDS = float(os.environ.get("SSE_HEARTBEAT_SECONDS", "15"))
+# Events buffered per client; the oldest are dropped for slow consumers.
+SSE_CLIENT_QUEUE_SIZE = int(os.environ.get("SSE_CLIENT_QUEUE_SIZE", "100"))
+# Per-user notification streams replayed to clients reconnecting with
+# Last-Event-ID: approximate number of events kept and idle lifetime in seconds.
+NOTIFICATIONS_STREAM_MAXLEN = int(os.environ.get("NOTIFICATIONS_STREAM_MAXLEN", "500"))
+NOTIFICATIONS_STREAM_TTL = int(
+    os.environ.get("NOTIFICATIONS_STREAM_TTL", str(7 * 24 * 60 * 60))
+)
+# Notifications sent from Celery tasks are inserted in bulk: pending ones are
+# flushed this many seconds after the first is queued (0 writes each
+# immediately), or at once when NOTIFICATIONS_BUFFER_SIZE are pending. Requests
+# write theirs when their transaction commits.
+NOTIFICATIONS_FLUSH_INTERVAL = float(
+    os.environ.get("NOTIFICATIONS_FLUSH_INTERVAL", "0.2")
+)
+NOTIFICATIONS_BUFFER_SIZE = int(os.environ.get("NOTIFICATIONS_BUFFER_SIZE", "100"))
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -35,8 +35,30 @@ def presign_put(item_id, content_type: str) -> dict:
     }
 
 
+def build_variants_prefix(original_key: str) -> str:
+    return f"{original_key.rsplit('/originals/', 1)[0]}/variants/"
+
+
 def delete_object(key: str) -> bool:
     try:
         return InfraManager.object_storage.delete_object(key=key)
     except Exception:
         return False
+
+
+def delete_objects(keys: list[str]) -> bool:
+    try:
+        result = InfraManager.object_storage.delete_objects(keys=keys)
+    except Exception:
+        return False
+
+    return not result["errors"]
+
+
+def delete_prefix(prefix: str) -> bool:
+    try:
+        result = InfraManager.object_storage.delete_prefix(prefix=prefix)
+    except Exception:
+        return False
+
+    return not result["errors"]
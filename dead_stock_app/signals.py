@@ -1,26 +1,18 @@
-import json
 import logging
 import unicodedata
 from datetime import timedelta
 
-import redis
-from django.conf import settings
 from django.db.models.signals import post_save, pre_save
 from django.dispatch import receiver
 from django.utils import timezone
 
-from shared.utils.redis import get_notifications_channel
+from shared.notifications import publish_event
 
 from .models import InventoryItem, Lead, Shop
 from .services.cache import nearby_cache_invalidate_all
 
 logger = logging.getLogger(__name__)
 
-_redis_client = redis.from_url(
-    settings.CACHES["default"]["LOCATION"],
-    decode_responses=True,
-)
-
 
 def normalize_name(text: str) -> str:
     """Lowercase + strip diacritics so trigram search matches across scripts."""
@@ -44,14 +36,13 @@ def notify_shop_owner_on_lead(sender, instance, created, **kwargs):
 
     try:
         owner = instance.shop.user
-        channel = get_notifications_channel(owner)
         payload = {
             "type": "dead_stock.lead_created",
             "lead_id": str(instance.pk),
             "shop_id": str(instance.shop_id),
             "buyer_name": instance.buyer.first_name or instance.buyer.username,
         }
-        _redis_client.publish(channel, json.dumps(payload))
+        publish_event(payload, user=owner)
     except Exception:
         logger.exception("Failed to publish lead SSE event for lead %s.", instance.pk)
 
@@ -8,6 +8,8 @@ from PIL import Image
 
 from shared.infrastructure import InfraManager
 
+from .services.images import build_variants_prefix
+
 logger = logging.getLogger(__name__)
 
 VARIANT_SIZES = {
@@ -18,8 +20,7 @@ VARIANT_SIZES = {
 
 
 def _variant_key(original_key: str, size_name: str) -> str:
-    prefix = original_key.rsplit("/originals/", 1)[0]
-    return f"{prefix}/variants/{size_name}.webp"
+    return f"{build_variants_prefix(original_key)}{size_name}.webp"
 
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=30)
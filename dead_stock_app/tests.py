@@ -364,8 +364,9 @@ class TestInventoryItemViewSet(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(data["name"], "New Name")
 
-    @patch("dead_stock_app.views.items.delete_object")
-    def test_delete_item(self, mock_delete, _mock_cache):
+    @patch("dead_stock_app.views.items.delete_prefix")
+    @patch("dead_stock_app.views.items.delete_objects")
+    def test_delete_item(self, mock_delete, _mock_delete_prefix, _mock_cache):
         item = make_item(self.user, self.shop)
         url = reverse("ds-items-detail", kwargs={"pk": item.pk})
 
@@ -374,15 +375,32 @@ class TestInventoryItemViewSet(TestCase):
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertFalse(InventoryItem.objects.filter(pk=item.pk).exists())
 
-    @patch("dead_stock_app.views.items.delete_object")
-    def test_delete_item_removes_images_from_s3(self, mock_delete, _mock_cache):
+    @patch("dead_stock_app.views.items.delete_prefix")
+    @patch("dead_stock_app.views.items.delete_objects")
+    def test_delete_item_removes_images_from_s3(
+        self, mock_delete, mock_delete_prefix, _mock_cache
+    ):
         item = make_item(self.user, self.shop)
         make_image(item, s3_key="some/key.jpg")
+        make_image(
+            item,
+            position=1,
+            is_primary=False,
+            s3_key=f"dead-stock/items/{item.pk}/originals/a.jpg",
+        )
         url = reverse("ds-items-detail", kwargs={"pk": item.pk})
 
         self.client.delete(url)
 
-        mock_delete.assert_called_once_with("some/key.jpg")
+        mock_delete.assert_called_once()
+        self.assertCountEqual(
+            mock_delete.call_args.args[0],
+            ["some/key.jpg", f"dead-stock/items/{item.pk}/originals/a.jpg"],
+        )
+        self.assertCountEqual(
+            [call.args[0] for call in mock_delete_prefix.call_args_list],
+            ["some/key.jpg/variants/", f"dead-stock/items/{item.pk}/variants/"],
+        )
 
     def test_refresh_extends_stale_at(self, _mock_cache):
         item = make_item(self.user, self.shop)
@@ -660,7 +678,7 @@ class TestItemImageActions(TestCase):
 # ---------------------------------------------------------------------------
 
 
-@patch("dead_stock_app.signals._redis_client")
+@patch("dead_stock_app.signals.publish_event")
 @patch("dead_stock_app.signals.nearby_cache_invalidate_all")
 class TestLeadViews(TestCase):
     def setUp(self):
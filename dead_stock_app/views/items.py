@@ -19,7 +19,13 @@ from ..serializers import (
     ItemImageSerializer,
     PresignImageRequestSerializer,
 )
-from ..services.images import delete_object, presign_put
+from ..services.images import (
+    build_variants_prefix,
+    delete_object,
+    delete_objects,
+    delete_prefix,
+    presign_put,
+)
 from ..tasks import generate_image_variants
 
 logger = logging.getLogger(__name__)
@@ -67,13 +73,20 @@ class InventoryItemViewSet(viewsets.ModelViewSet):
         image_keys = list(instance.images.values_list("s3_key", flat=True))
         instance.delete()
 
-        for image_key in image_keys:
-            try:
-                delete_object(image_key)
-            except Exception:
-                logger.exception(
-                    "Failed to delete inventory item image from object storage",
-                    extra={"item_id": str(instance.id), "s3_key": image_key},
+        if not image_keys:
+            return
+
+        if not delete_objects(image_keys):
+            logger.error(
+                "Failed to delete inventory item images from object storage",
+                extra={"item_id": str(instance.id), "s3_keys": image_keys},
+            )
+
+        for variants_prefix in dict.fromkeys(map(build_variants_prefix, image_keys)):
+            if not delete_prefix(variants_prefix):
+                logger.error(
+                    "Failed to delete inventory item image variants from object storage",
+                    extra={"item_id": str(instance.id), "prefix": variants_prefix},
                 )
 
     @action(
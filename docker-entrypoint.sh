@@ -1,6 +1,9 @@
 #!/bin/bash -x
 python manage.py migrate --noinput || exit 1
 
+# Computes missing dataset stats once, instead of on the first layer list.
+python manage.py backfill_dataset_stats || true
+
 # Adds reference/link of all static files to a single file.
 python3 manage.py collectstatic --noinput --clear --link
 
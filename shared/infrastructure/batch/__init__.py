@@ -1,6 +1,13 @@
 """Batch compute implementations package."""
 
-from .base import BatchComputeAbstract, JobStatus
+from .base import BatchComputeAbstract, JobAlreadyExistsError, JobStatus
+from .in_process_batch_compute import InProcessBatchCompute
 from .k8s_batch_compute import K8sBatchCompute
 
-__all__ = ["BatchComputeAbstract", "JobStatus", "K8sBatchCompute"]
+__all__ = [
+    "BatchComputeAbstract",
+    "InProcessBatchCompute",
+    "JobAlreadyExistsError",
+    "JobStatus",
+    "K8sBatchCompute",
+]
@@ -13,6 +13,14 @@ class JobStatus(Enum):
     CANCELLED = "cancelled"
 
 
+class JobAlreadyExistsError(RuntimeError):
+    """Raised by submit_job when a job with the same name was already submitted."""
+
+    def __init__(self, job_id: str):
+        super().__init__(f"Job {job_id} already exists")
+        self.job_id = job_id
+
+
 class BatchComputeAbstract(ABC):
     """Abstract base class for batch compute implementations across different cloud providers."""
 
@@ -43,6 +51,9 @@ class BatchComputeAbstract(ABC):
 
         Returns:
             Job ID
+
+        Raises:
+            JobAlreadyExistsError: If a job with this name was already submitted
         """
         raise NotImplementedError
 
@@ -0,0 +1,119 @@
+"""
+In-process batch compute backend for tests and local development.
+
+Jobs are kept in memory. With a runner, a submitted job runs synchronously
+in the calling process; without one it stays pending until a test moves it
+along with `set_job_status`.
+"""
+
+import itertools
+from typing import Any, Callable, Dict, List, Optional
+
+from .base import BatchComputeAbstract, JobAlreadyExistsError, JobStatus
+
+Runner = Callable[[List[str], Dict[str, str]], Optional[str]]
+
+
+class InProcessBatchCompute(BatchComputeAbstract):
+    """Batch compute backend that keeps jobs in memory instead of a cluster."""
+
+    def __init__(self, runner: Optional[Runner] = None):
+        """
+        Args:
+            runner: Optional callable receiving (command, environment) that runs
+                the job and returns its logs; raising marks the job failed
+        """
+        self.runner = runner
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self._ids = itertools.count(1)
+
+    def submit_job(
+        self,
+        job_name: str,
+        image: str,
+        command: List[str],
+        environment: Optional[Dict[str, str]] = None,
+        resources: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> str:
+        """Record the job and run it right away when a runner is configured.
+
+        Like Kubernetes, a job name can only be submitted once.
+        """
+        for existing in self.jobs.values():
+            if existing["name"] == job_name:
+                raise JobAlreadyExistsError(existing["job_id"])
+
+        job_id = f"{job_name}-{next(self._ids)}"
+        job = {
+            "job_id": job_id,
+            "name": job_name,
+            "image": image,
+            "command": command,
+            "environment": environment or {},
+            "resources": resources or {},
+            "labels": kwargs.get("labels", {}),
+            "status": JobStatus.PENDING,
+            "logs": "",
+        }
+        self.jobs[job_id] = job
+
+        if self.runner is not None:
+            job["status"] = JobStatus.RUNNING
+
+            try:
+                job["logs"] = self.runner(command, job["environment"]) or ""
+            except Exception as e:
+                job["status"] = JobStatus.FAILED
+                job["logs"] = str(e)
+            else:
+                job["status"] = JobStatus.SUCCEEDED
+
+        return job_id
+
+    def set_job_status(self, job_id: str, status: JobStatus, logs: str = "") -> None:
+        """Move a job to another status, as the cluster would."""
+        self.jobs[job_id]["status"] = status
+        self.jobs[job_id]["logs"] += logs
+
+    def get_job_status(self, job_id: str) -> JobStatus:
+        """Get the status of a job; unknown jobs count as cancelled."""
+        job = self.jobs.get(job_id)
+
+        return job["status"] if job else JobStatus.CANCELLED
+
+    def get_job_details(self, job_id: str) -> Dict[str, Any]:
+        """Get the recorded job."""
+        if job_id not in self.jobs:
+            raise RuntimeError(f"Failed to get job details: unknown job {job_id}")
+
+        return {**self.jobs[job_id], "status": self.jobs[job_id]["status"].value}
+
+    def cancel_job(self, job_id: str) -> bool:
+        """Cancel a pending or running job."""
+        job = self.jobs.get(job_id)
+
+        if job is None or job["status"] not in (JobStatus.PENDING, JobStatus.RUNNING):
+            return False
+
+        job["status"] = JobStatus.CANCELLED
+
+        return True
+
+    def list_jobs(
+        self, status: Optional[JobStatus] = None, max_results: int = 100
+    ) -> List[Dict[str, Any]]:
+        """List recorded jobs."""
+        jobs = [
+            self.get_job_details(job_id)
+            for job_id, job in self.jobs.items()
+            if status is None or job["status"] == status
+        ]
+
+        return jobs[:max_results]
+
+    def get_job_logs(self, job_id: str) -> str:
+        """Get the logs returned by the runner."""
+        job = self.jobs.get(job_id)
+
+        return job["logs"] if job else ""
@@ -5,26 +5,67 @@ This module provides Kubernetes Job-based batch compute implementation.
 """
 
 import os
+import re
 from typing import Any, Dict, List, Optional
 
-from .base import BatchComputeAbstract, JobStatus
+from .base import BatchComputeAbstract, JobAlreadyExistsError, JobStatus
+
+# Label put on every Job submitted from here, used to list them back.
+MANAGED_BY_LABEL = "app.kubernetes.io/managed-by"
+MANAGED_BY_VALUE = "backend-projects"
 
 
 class K8sBatchCompute(BatchComputeAbstract):
     """
     Kubernetes batch compute implementation using Kubernetes Jobs.
-    Configuration is loaded from environment variables.
+    Configuration is loaded from environment variables:
+    - K8S_NAMESPACE: Namespace Jobs are created in (default: 'default')
+    - K8S_BATCH_SERVICE_ACCOUNT: Service account of Job pods (optional)
+    - K8S_BATCH_ENV_SECRET: Secret whose keys become the environment of Job
+      pods, so credentials are not copied into Job specs (optional)
+    - K8S_BATCH_TTL_SECONDS: Seconds finished Jobs are kept (default: 3600)
     """
 
     def __init__(self):
         """Initialize Kubernetes client from environment variables."""
         self.namespace = os.getenv("K8S_NAMESPACE", "default")
+        self.service_account = os.getenv("K8S_BATCH_SERVICE_ACCOUNT", "")
+        self.env_secret = os.getenv("K8S_BATCH_ENV_SECRET", "")
+        self.ttl_seconds_after_finished = int(
+            os.getenv("K8S_BATCH_TTL_SECONDS", "3600")
+        )
+
+        # Clients are created on first use so importing this module does not
+        # require cluster credentials.
+        self._batch_client = None
+        self._core_client = None
+
+    @property
+    def client(self):
+        """BatchV1Api client for Jobs."""
+        if self._batch_client is None:
+            self._load_clients()
+
+        return self._batch_client
+
+    @property
+    def core_client(self):
+        """CoreV1Api client for the pods of Jobs."""
+        if self._core_client is None:
+            self._load_clients()
 
-        # TODO: Initialize Kubernetes client
-        # from kubernetes import client, config
-        # config.load_incluster_config() or config.load_kube_config()
-        # self.client = client.BatchV1Api()
-        self.client = None  # Placeholder until K8s client is implemented
+        return self._core_client
+
+    def _load_clients(self) -> None:
+        from kubernetes import client, config
+
+        try:
+            config.load_incluster_config()
+        except config.ConfigException:
+            config.load_kube_config()
+
+        self._batch_client = client.BatchV1Api()
+        self._core_client = client.CoreV1Api()
 
     def submit_job(
         self,
@@ -35,33 +76,199 @@ class K8sBatchCompute(BatchComputeAbstract):
         resources: Optional[Dict[str, Any]] = None,
         **kwargs,
     ) -> str:
-        """Submit a Kubernetes Job."""
-        # TODO: Implement K8s Job submission using self.client
-        raise NotImplementedError("K8s batch job submission not yet implemented")
+        """Submit a Kubernetes Job.
+
+        Extra kwargs: labels, backoff_limit (default 0), active_deadline_seconds,
+        service_account and env_secret. Returns the Job name.
+        """
+        from kubernetes import client
+        from kubernetes.client.rest import ApiException
+
+        name = self._job_name(job_name)
+        labels = {
+            **kwargs.get("labels", {}),
+            MANAGED_BY_LABEL: MANAGED_BY_VALUE,
+        }
+        service_account = kwargs.get("service_account") or self.service_account
+        env_secret = kwargs.get("env_secret") or self.env_secret
+
+        container = client.V1Container(
+            name="job",
+            image=image,
+            command=command,
+            env=[
+                client.V1EnvVar(name=key, value=str(value))
+                for key, value in (environment or {}).items()
+            ],
+            env_from=(
+                [
+                    client.V1EnvFromSource(
+                        secret_ref=client.V1SecretEnvSource(name=env_secret)
+                    )
+                ]
+                if env_secret
+                else None
+            ),
+            resources=client.V1ResourceRequirements(
+                requests=(resources or {}).get("requests"),
+                limits=(resources or {}).get("limits"),
+            ),
+        )
+        job = client.V1Job(
+            metadata=client.V1ObjectMeta(name=name, labels=labels),
+            spec=client.V1JobSpec(
+                backoff_limit=kwargs.get("backoff_limit", 0),
+                active_deadline_seconds=kwargs.get("active_deadline_seconds"),
+                ttl_seconds_after_finished=self.ttl_seconds_after_finished,
+                template=client.V1PodTemplateSpec(
+                    metadata=client.V1ObjectMeta(labels=labels),
+                    spec=client.V1PodSpec(
+                        restart_policy="Never",
+                        containers=[container],
+                        service_account_name=service_account or None,
+                    ),
+                ),
+            ),
+        )
+
+        try:
+            self.client.create_namespaced_job(namespace=self.namespace, body=job)
+        except ApiException as e:
+            if e.status == 409:
+                raise JobAlreadyExistsError(name) from e
+
+            raise RuntimeError(f"Failed to submit job: {e}")
+
+        return name
 
     def get_job_status(self, job_id: str) -> JobStatus:
-        """Get the status of a Kubernetes Job."""
-        # TODO: Implement K8s Job status check using self.client
-        raise NotImplementedError("K8s batch job status not yet implemented")
+        """Get the status of a Kubernetes Job; deleted Jobs count as cancelled."""
+        from kubernetes.client.rest import ApiException
+
+        try:
+            job = self.client.read_namespaced_job_status(
+                name=job_id, namespace=self.namespace
+            )
+        except ApiException as e:
+            if e.status == 404:
+                return JobStatus.CANCELLED
+
+            raise RuntimeError(f"Failed to get job status: {e}")
+
+        return self._status_of(job)
 
     def get_job_details(self, job_id: str) -> Dict[str, Any]:
         """Get detailed information about a Kubernetes Job."""
-        # TODO: Implement K8s Job details using self.client
-        raise NotImplementedError("K8s batch job details not yet implemented")
+        from kubernetes.client.rest import ApiException
+
+        try:
+            job = self.client.read_namespaced_job(name=job_id, namespace=self.namespace)
+        except ApiException as e:
+            raise RuntimeError(f"Failed to get job details: {e}")
+
+        return self._details_of(job)
 
     def cancel_job(self, job_id: str) -> bool:
-        """Cancel a Kubernetes Job."""
-        # TODO: Implement K8s Job cancellation using self.client
-        raise NotImplementedError("K8s batch job cancellation not yet implemented")
+        """Cancel a Kubernetes Job by deleting it together with its pods."""
+        from kubernetes.client.rest import ApiException
+
+        try:
+            self.client.delete_namespaced_job(
+                name=job_id,
+                namespace=self.namespace,
+                propagation_policy="Background",
+            )
+        except ApiException as e:
+            if e.status == 404:
+                return False
+
+            raise RuntimeError(f"Failed to cancel job: {e}")
+
+        return True
 
     def list_jobs(
         self, status: Optional[JobStatus] = None, max_results: int = 100
     ) -> List[Dict[str, Any]]:
-        """List Kubernetes Jobs."""
-        # TODO: Implement K8s Job listing using self.client
-        raise NotImplementedError("K8s batch job listing not yet implemented")
+        """List Kubernetes Jobs submitted through this class."""
+        from kubernetes.client.rest import ApiException
+
+        try:
+            response = self.client.list_namespaced_job(
+                namespace=self.namespace,
+                label_selector=f"{MANAGED_BY_LABEL}={MANAGED_BY_VALUE}",
+            )
+        except ApiException as e:
+            raise RuntimeError(f"Failed to list jobs: {e}")
+
+        jobs = [self._details_of(job) for job in response.items]
+
+        if status is not None:
+            jobs = [job for job in jobs if job["status"] == status.value]
+
+        return jobs[:max_results]
 
     def get_job_logs(self, job_id: str) -> str:
-        """Get logs from a Kubernetes Job."""
-        # TODO: Implement K8s Job logs retrieval using self.client
-        raise NotImplementedError("K8s batch job logs not yet implemented")
+        """Get logs from the pods of a Kubernetes Job."""
+        from kubernetes.client.rest import ApiException
+
+        try:
+            pods = self.core_client.list_namespaced_pod(
+                namespace=self.namespace, label_selector=f"job-name={job_id}"
+            )
+            logs = [
+                self.core_client.read_namespaced_pod_log(
+                    name=pod.metadata.name, namespace=self.namespace
+                )
+                for pod in pods.items
+            ]
+        except ApiException as e:
+            raise RuntimeError(f"Failed to get job logs: {e}")
+
+        return "\n".join(logs)
+
+    @staticmethod
+    def _job_name(job_name: str) -> str:
+        """Turn a name into a valid Job name (DNS-1123 label, at most 63 chars)."""
+        name = re.sub(r"[^a-z0-9-]+", "-", job_name.lower()).strip("-")
+
+        return name[:63].rstrip("-")
+
+    @staticmethod
+    def _status_of(job) -> JobStatus:
+        job_status = job.status
+
+        for condition in job_status.conditions or []:
+            if condition.status != "True":
+                continue
+
+            if condition.type == "Complete":
+                return JobStatus.SUCCEEDED
+
+            if condition.type == "Failed":
+                return JobStatus.FAILED
+
+        if job_status.active:
+            return JobStatus.RUNNING
+
+        return JobStatus.PENDING
+
+    def _details_of(self, job) -> Dict[str, Any]:
+        job_status = job.status
+
+        return {
+            "job_id": job.metadata.name,
+            "namespace": job.metadata.namespace,
+            "labels": job.metadata.labels or {},
+            "status": self._status_of(job).value,
+            "active": job_status.active or 0,
+            "succeeded": job_status.succeeded or 0,
+            "failed": job_status.failed or 0,
+            "start_time": (
+                job_status.start_time.isoformat() if job_status.start_time else None
+            ),
+            "completion_time": (
+                job_status.completion_time.isoformat()
+                if job_status.completion_time
+                else None
+            ),
+        }
@@ -1,6 +1,12 @@
 """Storage implementations package."""
 
 from .base import ObjectStorageAbstract
+from .disk_cache import ObjectDiskCache, object_disk_cache
 from .k8s_object_storage import K8sObjectStorage
 
-__all__ = ["ObjectStorageAbstract", "K8sObjectStorage"]
+__all__ = [
+    "ObjectStorageAbstract",
+    "K8sObjectStorage",
+    "ObjectDiskCache",
+    "object_disk_cache",
+]
@@ -31,6 +31,80 @@ class ObjectStorageAbstract(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def upload_file(
+        self,
+        path: str,
+        key: str,
+        bucket: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None,
+        part_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Upload a local file, splitting it into parts sent concurrently.
+
+        Args:
+            path: Local file path
+            key: Object key/path
+            bucket: Optional bucket/container name (uses default if not specified)
+            metadata: Optional metadata to attach to the object
+            part_size: Part size in bytes (uses the storage default if not specified)
+            max_concurrency: Number of parts in flight at once
+
+        Returns:
+            Dict containing upload result information and transfer metrics
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def copy_object(
+        self,
+        source_key: str,
+        key: str,
+        source_bucket: Optional[str] = None,
+        bucket: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Copy an object inside storage without downloading it.
+
+        Args:
+            source_key: Key of the object to copy
+            key: Destination object key/path
+            source_bucket: Optional source bucket (uses default if not specified)
+            bucket: Optional destination bucket (uses default if not specified)
+
+        Returns:
+            Dict containing the destination 'bucket', 'key', 'etag' and 'size'
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def download_file(
+        self,
+        key: str,
+        path: str,
+        bucket: Optional[str] = None,
+        part_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        etag: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Download an object to a local file using concurrent byte-range requests.
+
+        Args:
+            key: Object key/path
+            path: Local file path to write to
+            bucket: Optional bucket/container name (uses default if not specified)
+            part_size: Range size in bytes (uses the storage default if not specified)
+            max_concurrency: Number of ranges in flight at once
+            etag: Only download this version of the object; fails if it changed
+
+        Returns:
+            Dict containing download result information and transfer metrics
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def download_object(self, key: str, bucket: Optional[str] = None) -> BinaryIO:
         """
@@ -59,6 +133,30 @@ class ObjectStorageAbstract(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_gdal_path(self, key: str, bucket: Optional[str] = None) -> str:
+        """
+        Build a GDAL virtual file system path for reading an object in place.
+
+        Args:
+            key: Object key/path
+            bucket: Optional bucket/container name (uses default if not specified)
+
+        Returns:
+            GDAL path (e.g. /vsis3/bucket/key)
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_gdal_config(self) -> Dict[str, str]:
+        """
+        Get the GDAL configuration options needed to read paths from get_gdal_path.
+
+        Returns:
+            Dict of GDAL config option names to values
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def generate_presigned_url(
         self,
@@ -95,6 +193,36 @@ class ObjectStorageAbstract(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def delete_objects(
+        self, keys: list[str], bucket: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Delete many objects using batch delete requests.
+
+        Args:
+            keys: Object keys/paths to delete
+            bucket: Optional bucket/container name (uses default if not specified)
+
+        Returns:
+            Dict with the number of 'deleted' objects and per-key 'errors'
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str, bucket: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Delete every object whose key starts with a prefix ("folder" delete).
+
+        Args:
+            prefix: Non-empty key prefix, e.g. 'tilesets/<id>/'
+            bucket: Optional bucket/container name (uses default if not specified)
+
+        Returns:
+            Dict with the number of 'deleted' objects and per-key 'errors'
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def list_objects(
         self,
@@ -0,0 +1,239 @@
+"""
+Worker-local disk cache for objects downloaded from object storage.
+
+Entries are content-addressed by bucket/key/etag, filled through an atomic
+rename and guarded by a per-entry file lock so concurrent tasks on one node
+fetch an object once and eviction skips entries in use. The cache is bounded
+by total bytes and evicts the least recently used entries first.
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from filelock import FileLock, Timeout
+
+from .base import ObjectStorageAbstract
+
+logger = logging.getLogger(__name__)
+
+ENTRY_SUFFIX = ".obj"
+
+
+class ObjectDiskCache:
+    """Size-bounded LRU cache of object storage downloads on local disk."""
+
+    def __init__(self, root: str, max_bytes: int, enabled: bool = True):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+
+    @classmethod
+    def from_env(cls) -> "ObjectDiskCache":
+        """Build the cache from OBJECT_CACHE_* environment variables."""
+        return cls(
+            root=os.environ.get(
+                "OBJECT_CACHE_DIR",
+                os.path.join(tempfile.gettempdir(), "object-cache"),
+            ),
+            max_bytes=int(os.environ.get("OBJECT_CACHE_MAX_GB", "20")) * 1024**3,
+            enabled=os.environ.get("OBJECT_CACHE_ENABLED", "true").lower() == "true",
+        )
+
+    def fetch(
+        self,
+        storage: ObjectStorageAbstract,
+        key: str,
+        bucket: Optional[str] = None,
+        **download_kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Return a local path for an object, downloading it only on a cache miss.
+
+        The entry may be evicted once this returns; use materialize to get a
+        copy that stays put.
+
+        Args:
+            storage: Object storage used for the HEAD request and the download
+            key: Object key/path
+            bucket: Optional bucket/container name
+            **download_kwargs: Extra arguments passed to storage.download_file
+
+        Returns:
+            Dict with 'bucket', 'key', the cached 'path', 'etag', 'size' and
+            'cache_hit'
+        """
+        with self._locked_entry(storage, key, bucket, **download_kwargs) as result:
+            pass
+
+        self.evict(keep=Path(result["path"]))
+
+        return result
+
+    def materialize(
+        self,
+        storage: ObjectStorageAbstract,
+        key: str,
+        path: str,
+        bucket: Optional[str] = None,
+        **download_kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Place an object at a local path, going through the cache when enabled.
+
+        Args:
+            storage: Object storage used for the HEAD request and the download
+            key: Object key/path
+            path: Destination path; cache entries are hardlinked when possible
+            bucket: Optional bucket/container name
+            **download_kwargs: Extra arguments passed to storage.download_file
+
+        Returns:
+            Dict with 'bucket', 'key', 'path', 'etag', 'size' and transfer details
+        """
+        if not self.enabled:
+            return storage.download_file(
+                key=key, path=path, bucket=bucket, **download_kwargs
+            )
+
+        destination = Path(path)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        destination.unlink(missing_ok=True)
+
+        # The entry lock keeps evict() from deleting the entry before it is linked.
+        with self._locked_entry(storage, key, bucket, **download_kwargs) as result:
+            try:
+                os.link(result["path"], destination)
+            except OSError:
+                # Different filesystem: fall back to a (writable) copy.
+                shutil.copyfile(result["path"], destination)
+
+        self.evict(keep=Path(result["path"]))
+
+        return {**result, "path": str(destination)}
+
+    def evict(self, keep: Optional[Path] = None) -> int:
+        """Delete least recently used entries until the cache fits in max_bytes.
+
+        Entries locked by a task that is filling or linking them are skipped.
+        """
+        if not self.root.exists():
+            return 0
+
+        with FileLock(str(self.root / ".evict.lock")):
+            entries = []
+            total_bytes = 0
+
+            for entry in self.root.rglob(f"*{ENTRY_SUFFIX}"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+
+                entries.append((stat.st_mtime, stat.st_size, entry))
+                total_bytes += stat.st_size
+
+            evicted = 0
+
+            for _mtime, size, entry in sorted(entries, key=lambda item: item[0]):
+                if total_bytes <= self.max_bytes:
+                    break
+
+                if keep is not None and entry == keep:
+                    continue
+
+                try:
+                    with FileLock(f"{entry}.lock", timeout=0):
+                        entry.unlink(missing_ok=True)
+                except Timeout:
+                    continue
+
+                total_bytes -= size
+                evicted += 1
+
+        if evicted:
+            logger.info("Evicted %d entries from object cache %s.", evicted, self.root)
+
+        return evicted
+
+    @contextmanager
+    def _locked_entry(
+        self,
+        storage: ObjectStorageAbstract,
+        key: str,
+        bucket: Optional[str] = None,
+        **download_kwargs,
+    ) -> Iterator[Dict[str, Any]]:
+        """Fill the entry of an object if needed and hold its lock while in use."""
+        info = storage.get_object_info(key=key, bucket=bucket)
+        bucket = info.get("bucket") or bucket
+        etag = info.get("etag") or ""
+        entry_path = self._entry_path(bucket, key, etag)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with FileLock(f"{entry_path}.lock"):
+            if self._touch(entry_path):
+                yield self._result(entry_path, info, cache_hit=True)
+                return
+
+            partial_path = entry_path.with_name(
+                f"{entry_path.name}.{uuid.uuid4().hex}.part"
+            )
+
+            try:
+                # Pinned to the ETag of the entry, so it never holds other bytes.
+                download_result = storage.download_file(
+                    key=key,
+                    path=str(partial_path),
+                    bucket=bucket,
+                    etag=etag or None,
+                    **download_kwargs,
+                )
+                # Entries are immutable; consumers hardlink them into work dirs.
+                os.chmod(partial_path, 0o444)
+                os.replace(partial_path, entry_path)
+            finally:
+                partial_path.unlink(missing_ok=True)
+
+            yield {
+                **self._result(entry_path, info, cache_hit=False),
+                **{
+                    name: value
+                    for name, value in download_result.items()
+                    if name not in ("path", "key", "bucket")
+                },
+            }
+
+    def _entry_path(self, bucket: str, key: str, etag: str) -> Path:
+        digest = hashlib.sha256(f"{bucket}/{key}@{etag}".encode()).hexdigest()
+        return self.root / digest[:2] / f"{digest}{ENTRY_SUFFIX}"
+
+    @staticmethod
+    def _touch(entry_path: Path) -> bool:
+        """Mark an entry as recently used; False if it does not exist."""
+        try:
+            os.utime(entry_path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def _result(entry_path: Path, info: Dict[str, Any], cache_hit: bool):
+        return {
+            "bucket": info.get("bucket"),
+            "key": info.get("key"),
+            "path": str(entry_path),
+            "etag": info.get("etag"),
+            "size": info.get("size"),
+            "cache_hit": cache_hit,
+        }
+
+
+# Per-process handle; the directory itself is shared by all workers on the node.
+object_disk_cache = ObjectDiskCache.from_env()
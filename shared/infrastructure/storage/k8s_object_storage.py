@@ -1,14 +1,27 @@
 import io
+import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any, BinaryIO, Dict, Optional
+from urllib.parse import urlparse
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore import UNSIGNED
 from botocore.client import Config
 from botocore.exceptions import ClientError
 
 from .base import ObjectStorageAbstract
 
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+# S3 DeleteObjects accepts at most 1000 keys per request.
+DELETE_BATCH_SIZE = 1000
+
 
 class K8sObjectStorage(ObjectStorageAbstract):
     """
@@ -30,6 +43,14 @@ class K8sObjectStorage(ObjectStorageAbstract):
         use_unsigned = os.environ.get("S3_USE_UNSIGNED", "false").lower() == "true"
         self.use_unsigned = use_unsigned
 
+        # Defaults for concurrent file transfers (upload_file / download_file).
+        self.transfer_part_size = (
+            int(os.environ.get("S3_TRANSFER_PART_SIZE_MB", "16")) * MB
+        )
+        self.transfer_max_concurrency = int(
+            os.environ.get("S3_TRANSFER_MAX_CONCURRENCY", "8")
+        )
+
         if not endpoint or not self.default_bucket:
             raise RuntimeError(
                 "Missing required S3 configuration. S3_ENDPOINT and S3_BUCKET are required."
@@ -38,6 +59,10 @@ class K8sObjectStorage(ObjectStorageAbstract):
         self.client = self._build_client(endpoint)
         self.presign_client = self._build_client(public_endpoint or endpoint)
 
+        # Buckets already known to exist in this process, so writes skip the
+        # head_bucket round trip.
+        self._known_buckets: set[str] = set()
+
     def _build_client(self, endpoint: str):
         if self.use_unsigned:
             return boto3.client(
@@ -47,6 +72,7 @@ class K8sObjectStorage(ObjectStorageAbstract):
                 config=Config(
                     signature_version=UNSIGNED,
                     s3={"addressing_style": "path"},
+                    max_pool_connections=max(10, self.transfer_max_concurrency),
                 ),
             )
 
@@ -67,6 +93,7 @@ class K8sObjectStorage(ObjectStorageAbstract):
             config=Config(
                 signature_version="s3v4",
                 s3={"addressing_style": "path"},
+                max_pool_connections=max(10, self.transfer_max_concurrency),
             ),
         )
 
@@ -82,11 +109,7 @@ class K8sObjectStorage(ObjectStorageAbstract):
         upload_bucket = bucket if bucket is not None else self.default_bucket
 
         try:
-            # Ensure bucket exists
-            try:
-                self.client.head_bucket(Bucket=upload_bucket)
-            except ClientError:
-                self.client.create_bucket(Bucket=upload_bucket)
+            self._ensure_bucket(upload_bucket)
 
             # Get file size
             file.seek(0, io.SEEK_END)
@@ -113,6 +136,191 @@ class K8sObjectStorage(ObjectStorageAbstract):
         except ClientError as e:
             raise RuntimeError(f"Failed to upload object: {e}")
 
+    def upload_file(
+        self,
+        path: str,
+        key: str,
+        bucket: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None,
+        part_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Upload a local file with a parallel multipart upload."""
+        upload_bucket = bucket if bucket is not None else self.default_bucket
+        part_size = part_size or self.transfer_part_size
+        max_concurrency = max_concurrency or self.transfer_max_concurrency
+
+        transfer_config = TransferConfig(
+            multipart_threshold=part_size,
+            multipart_chunksize=part_size,
+            max_concurrency=max_concurrency,
+            use_threads=max_concurrency > 1,
+        )
+
+        try:
+            self._ensure_bucket(upload_bucket)
+
+            file_size = os.path.getsize(path)
+            started_at = time.monotonic()
+
+            self.client.upload_file(
+                Filename=path,
+                Bucket=upload_bucket,
+                Key=key,
+                ExtraArgs={"Metadata": metadata or {}},
+                Config=transfer_config,
+            )
+
+            metrics = self._transfer_metrics(file_size, started_at)
+            response = self.client.head_object(Bucket=upload_bucket, Key=key)
+        except ClientError as e:
+            raise RuntimeError(f"Failed to upload file: {e}")
+
+        logger.info(
+            "Uploaded s3://%s/%s (%d bytes) in %.2fs at %.1f MB/s.",
+            upload_bucket,
+            key,
+            file_size,
+            metrics["duration_seconds"],
+            metrics["throughput_bytes_per_second"] / MB,
+        )
+
+        return {
+            "bucket": upload_bucket,
+            "key": key,
+            "etag": response.get("ETag", "").strip('"'),
+            "version_id": response.get("VersionId"),
+            "size": file_size,
+            **metrics,
+        }
+
+    def copy_object(
+        self,
+        source_key: str,
+        key: str,
+        source_bucket: Optional[str] = None,
+        bucket: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Copy an object server-side, as a multipart copy for large objects."""
+        copy_bucket = bucket if bucket is not None else self.default_bucket
+        transfer_config = TransferConfig(
+            multipart_threshold=self.transfer_part_size,
+            multipart_chunksize=self.transfer_part_size,
+            max_concurrency=self.transfer_max_concurrency,
+        )
+
+        try:
+            self._ensure_bucket(copy_bucket)
+            self.client.copy(
+                CopySource={
+                    "Bucket": source_bucket or self.default_bucket,
+                    "Key": source_key,
+                },
+                Bucket=copy_bucket,
+                Key=key,
+                Config=transfer_config,
+            )
+            response = self.client.head_object(Bucket=copy_bucket, Key=key)
+        except ClientError as e:
+            raise RuntimeError(f"Failed to copy object: {e}")
+
+        return {
+            "bucket": copy_bucket,
+            "key": key,
+            "etag": response.get("ETag", "").strip('"'),
+            "version_id": response.get("VersionId"),
+            "size": response.get("ContentLength"),
+        }
+
+    def download_file(
+        self,
+        key: str,
+        path: str,
+        bucket: Optional[str] = None,
+        part_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        etag: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Download an object with parallel byte-range GETs written via pwrite."""
+        download_bucket = bucket if bucket is not None else self.default_bucket
+        part_size = part_size or self.transfer_part_size
+        max_concurrency = max_concurrency or self.transfer_max_concurrency
+        # get_object_info returns ETags without their quotes.
+        if_match = {"IfMatch": f'"{etag}"'} if etag else {}
+
+        try:
+            head = self.client.head_object(Bucket=download_bucket, Key=key, **if_match)
+        except ClientError as e:
+            raise RuntimeError(f"Failed to download object: {e}")
+
+        file_size = head.get("ContentLength", 0)
+        etag = head.get("ETag", "")
+        ranges = [
+            (start, min(start + part_size, file_size) - 1)
+            for start in range(0, file_size, part_size)
+        ]
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        started_at = time.monotonic()
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+
+        def _download_range(byte_range):
+            start, end = byte_range
+            # IfMatch makes every range come from the same object version.
+            response = self.client.get_object(
+                Bucket=download_bucket,
+                Key=key,
+                Range=f"bytes={start}-{end}",
+                IfMatch=etag,
+            )
+            offset = start
+
+            for chunk in response["Body"].iter_chunks(chunk_size=MB):
+                os.pwrite(fd, chunk, offset)
+                offset += len(chunk)
+
+            if offset != end + 1:
+                raise RuntimeError(
+                    f"Short read for bytes {start}-{end} of {key}: got {offset - start}."
+                )
+
+        try:
+            os.ftruncate(fd, file_size)
+
+            if len(ranges) <= 1 or max_concurrency <= 1:
+                for byte_range in ranges:
+                    _download_range(byte_range)
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=min(max_concurrency, len(ranges))
+                ) as pool:
+                    # Consume the iterator so worker exceptions propagate.
+                    list(pool.map(_download_range, ranges))
+        except ClientError as e:
+            raise RuntimeError(f"Failed to download object: {e}")
+        finally:
+            os.close(fd)
+
+        metrics = self._transfer_metrics(file_size, started_at)
+
+        logger.info(
+            "Downloaded s3://%s/%s (%d bytes) in %.2fs at %.1f MB/s.",
+            download_bucket,
+            key,
+            file_size,
+            metrics["duration_seconds"],
+            metrics["throughput_bytes_per_second"] / MB,
+        )
+
+        return {
+            "bucket": download_bucket,
+            "key": key,
+            "etag": etag.strip('"'),
+            "size": file_size,
+            "path": str(path),
+            **metrics,
+        }
+
     def download_object(self, key: str, bucket: Optional[str] = None) -> BinaryIO:
         """Download an object from S3-compatible storage."""
         download_bucket = bucket if bucket is not None else self.default_bucket
@@ -149,6 +357,32 @@ class K8sObjectStorage(ObjectStorageAbstract):
         except ClientError as e:
             raise RuntimeError(f"Failed to get object info: {e}")
 
+    def get_gdal_path(self, key: str, bucket: Optional[str] = None) -> str:
+        """Build a /vsis3/ path so GDAL reads the object with ranged GETs."""
+        gdal_bucket = bucket if bucket is not None else self.default_bucket
+        return f"/vsis3/{gdal_bucket}/{key}"
+
+    def get_gdal_config(self) -> Dict[str, str]:
+        """Get GDAL config options pointing /vsis3/ at the SeaweedFS endpoint."""
+        parsed_endpoint = urlparse(self.endpoint)
+
+        config = {
+            "AWS_S3_ENDPOINT": parsed_endpoint.netloc or parsed_endpoint.path,
+            "AWS_HTTPS": "YES" if parsed_endpoint.scheme == "https" else "NO",
+            "AWS_VIRTUAL_HOSTING": "FALSE",  # Path-style access for SeaweedFS.
+            "AWS_REGION": self.region or "us-east-1",
+            # Avoid listing the "directory" of every object GDAL opens.
+            "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR",
+        }
+
+        if self.use_unsigned:
+            config["AWS_NO_SIGN_REQUEST"] = "YES"
+        else:
+            config["AWS_ACCESS_KEY_ID"] = os.environ.get("S3_ACCESS_KEY", "")
+            config["AWS_SECRET_ACCESS_KEY"] = os.environ.get("S3_SECRET_KEY", "")
+
+        return config
+
     def generate_presigned_url(
         self,
         key: str,
@@ -199,6 +433,67 @@ class K8sObjectStorage(ObjectStorageAbstract):
         except ClientError as e:
             raise RuntimeError(f"Failed to delete object: {e}")
 
+    def delete_objects(
+        self, keys: list[str], bucket: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Delete objects from S3-compatible storage in batches of 1000 keys."""
+        delete_bucket = bucket if bucket is not None else self.default_bucket
+        unique_keys = list(dict.fromkeys(key for key in keys if key))
+        errors = []
+
+        try:
+            for start in range(0, len(unique_keys), DELETE_BATCH_SIZE):
+                batch = unique_keys[start : start + DELETE_BATCH_SIZE]
+                response = self.client.delete_objects(
+                    Bucket=delete_bucket,
+                    Delete={
+                        "Objects": [{"Key": key} for key in batch],
+                        "Quiet": True,
+                    },
+                )
+                errors.extend(
+                    {
+                        "key": error.get("Key"),
+                        "code": error.get("Code"),
+                        "message": error.get("Message"),
+                    }
+                    for error in response.get("Errors", [])
+                )
+        except ClientError as e:
+            raise RuntimeError(f"Failed to delete objects: {e}")
+
+        return {"deleted": len(unique_keys) - len(errors), "errors": errors}
+
+    def delete_prefix(self, prefix: str, bucket: Optional[str] = None) -> Dict[str, Any]:
+        """Delete all objects under a prefix, one batch request per listed page."""
+        if not prefix:
+            raise ValueError("A non-empty prefix is required.")
+
+        delete_bucket = bucket if bucket is not None else self.default_bucket
+        deleted = 0
+        errors = []
+
+        try:
+            paginator = self.client.get_paginator("list_objects_v2")
+
+            for page in paginator.paginate(
+                Bucket=delete_bucket,
+                Prefix=prefix,
+                PaginationConfig={"PageSize": DELETE_BATCH_SIZE},
+            ):
+                keys = [obj["Key"] for obj in page.get("Contents", [])]
+
+                if not keys:
+                    continue
+
+                result = self.delete_objects(keys, bucket=delete_bucket)
+                deleted += result["deleted"]
+                errors.extend(result["errors"])
+        except ClientError as e:
+            raise RuntimeError(f"Failed to delete prefix: {e}")
+
+        return {"deleted": deleted, "errors": errors}
+
     def list_objects(
         self,
         prefix: Optional[str] = None,
@@ -261,10 +556,7 @@ class K8sObjectStorage(ObjectStorageAbstract):
         """Initiate a multipart upload."""
         upload_bucket = bucket if bucket is not None else self.default_bucket
         try:
-            try:
-                self.client.head_bucket(Bucket=upload_bucket)
-            except ClientError:
-                self.client.create_bucket(Bucket=upload_bucket)
+            self._ensure_bucket(upload_bucket)
 
             params = {
                 "Bucket": upload_bucket,
@@ -323,3 +615,24 @@ class K8sObjectStorage(ObjectStorageAbstract):
             return True
         except ClientError as e:
             raise RuntimeError(f"Failed to abort multipart upload: {e}")
+
+    def _ensure_bucket(self, bucket: str) -> None:
+        """Create the bucket if it does not exist yet; memoized per process."""
+        if bucket in self._known_buckets:
+            return
+
+        try:
+            self.client.head_bucket(Bucket=bucket)
+        except ClientError:
+            self.client.create_bucket(Bucket=bucket)
+
+        self._known_buckets.add(bucket)
+
+    @staticmethod
+    def _transfer_metrics(size: int, started_at: float) -> Dict[str, float]:
+        duration = max(time.monotonic() - started_at, 1e-6)
+
+        return {
+            "duration_seconds": round(duration, 3),
+            "throughput_bytes_per_second": round(size / duration, 1),
+        }
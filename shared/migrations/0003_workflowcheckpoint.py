@@ -0,0 +1,56 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:00
+
+import uuid
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shared", "0002_alter_notification_app_name"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WorkflowCheckpoint",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, primary_key=True, serialize=False
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("key", models.CharField(max_length=255, unique=True)),
+                (
+                    "workflow",
+                    models.CharField(blank=True, default="", max_length=255),
+                ),
+                (
+                    "completed",
+                    models.JSONField(
+                        default=list, help_text="Names of operations that finished."
+                    ),
+                ),
+                (
+                    "outputs",
+                    models.JSONField(
+                        default=dict,
+                        help_text="Outputs of finished operations, by name.",
+                    ),
+                ),
+                (
+                    "ctx",
+                    models.JSONField(
+                        default=dict,
+                        help_text="JSON-serializable part of the shared workflow ctx.",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
@@ -1,2 +1,3 @@
 from .base_models import *
 from .notification_models import *
+from .workflow_models import *
@@ -0,0 +1,19 @@
+from django.db import models
+
+from .base_models import BaseModelWithoutUser
+
+
+class WorkflowCheckpoint(BaseModelWithoutUser):
+    """Progress of a workflow run, saved after each operation so retries can resume."""
+
+    key = models.CharField(max_length=255, unique=True)
+    workflow = models.CharField(max_length=255, blank=True, default="")
+    completed = models.JSONField(
+        default=list, help_text="Names of operations that finished."
+    )
+    outputs = models.JSONField(
+        default=dict, help_text="Outputs of finished operations, by name."
+    )
+    ctx = models.JSONField(
+        default=dict, help_text="JSON-serializable part of the shared workflow ctx."
+    )
@@ -1,14 +1,56 @@
+import atexit
 import json
+import logging
+import threading
+from collections import Counter
+from functools import partial
 
 import redis
+from celery import current_task
+from celery.signals import task_postrun
 from django.conf import settings
 from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.utils import timezone
 
 from shared.constants import AppName
 
 from .models import Notification
 from .serializers import NotificationSerializer
-from .utils.redis import get_notifications_channel
+from .utils.redis import get_notifications_channel, get_notifications_stream
+
+logger = logging.getLogger(__name__)
+
+# Appends an event to the user's capped stream and publishes it together with
+# its stream id, so SSE clients can resume from the last id they received.
+_PUBLISH_SCRIPT = """
+local event_id = redis.call(
+    'XADD', KEYS[1], 'MAXLEN', '~', ARGV[1], '*', 'data', ARGV[2]
+)
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+redis.call('PUBLISH', ARGV[4], event_id .. ' ' .. ARGV[2])
+return event_id
+"""
+
+# Moves an unread counter by a delta, only if the counter is known; a missing
+# counter is recomputed from the database on its next read.
+_ADJUST_UNREAD_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return nil
+end
+local count = redis.call('INCRBY', KEYS[1], ARGV[1])
+if count < 0 then
+    redis.call('SET', KEYS[1], 0, 'KEEPTTL')
+    count = 0
+end
+return count
+"""
+
+UNREAD_COUNT_TTL = 24 * 60 * 60
+
+
+def get_unread_count_key(user: User) -> str:
+    return f"notifications_unread:{user.pk}"
 
 
 class NotificationManager:
@@ -16,21 +58,176 @@ class NotificationManager:
         settings.CACHES["default"]["LOCATION"],
         decode_responses=True,
     )
+    _publish_script = _redis_client.register_script(_PUBLISH_SCRIPT)
+    _adjust_unread_script = _redis_client.register_script(_ADJUST_UNREAD_SCRIPT)
     _serializer = NotificationSerializer
 
+    def __init__(self):
+        self._pending = []
+        self._lock = threading.Lock()
+        self._flush_timer = None
+
+    def send_message(self, content: str, app_name: AppName, user: User):
+        """Write a notification once the current transaction commits.
+
+        Nothing is written when the transaction rolls back; outside of one the
+        notification is handled at once. Requests write it synchronously.
+        Celery tasks queue it for one bulk insert, flushed
+        NOTIFICATIONS_FLUSH_INTERVAL seconds after the first one is queued,
+        once NOTIFICATIONS_BUFFER_SIZE are pending or when the task ends. With
+        an interval of 0 tasks write immediately too.
+        """
+        notification = Notification(content=content, app_name=app_name.value, user=user)
+
+        if settings.NOTIFICATIONS_FLUSH_INTERVAL > 0 and current_task:
+            transaction.on_commit(partial(self._enqueue, notification))
+        else:
+            transaction.on_commit(partial(self._write, [notification]))
+
+    def _enqueue(self, notification: Notification) -> None:
+        with self._lock:
+            self._pending.append(notification)
+            flush_now = len(self._pending) >= settings.NOTIFICATIONS_BUFFER_SIZE
+
+            if not flush_now and self._flush_timer is None:
+                self._flush_timer = threading.Timer(
+                    settings.NOTIFICATIONS_FLUSH_INTERVAL, self._flush_in_thread
+                )
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+        if flush_now:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write every pending notification now."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+        if pending:
+            self._write(pending)
+
+    def _flush_in_thread(self) -> None:
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("Failed to flush pending notifications.")
+        finally:
+            # The timer thread has its own database connection.
+            connection.close()
+
+    def _write(self, notifications: list) -> None:
+        Notification.objects.bulk_create(notifications)
+
+        for notification in notifications:
+            serializer = self._serializer(instance=notification)
+            self.publish(payload={**serializer.data}, user=notification.user)
+
+        unread = Counter(notification.user for notification in notifications)
+
+        for user, count in unread.items():
+            self.adjust_unread_count(user, count)
+
+    @classmethod
+    def publish(cls, payload: dict, user: User) -> str:
+        """Push an event to the user's SSE stream without storing a Notification.
+
+        Returns the id of the event in the user's notification stream.
+        """
+        return cls._publish_script(
+            keys=[get_notifications_stream(user)],
+            args=[
+                settings.NOTIFICATIONS_STREAM_MAXLEN,
+                json.dumps(payload),
+                settings.NOTIFICATIONS_STREAM_TTL,
+                get_notifications_channel(user),
+            ],
+        )
+
     @classmethod
-    def send_message(cls, content: str, app_name: AppName, user: User):
-        notification = Notification.objects.create(
-            content=content, app_name=app_name.value, user=user
+    def publish_transient(cls, content: str, app_name: AppName, user: User) -> str:
+        """Publish an event in the Notification envelope without storing it.
+
+        For frequent updates, such as job progress, that clients handle like
+        notifications but that are neither persisted nor counted as unread.
+        """
+        now = timezone.now()
+        notification = Notification(
+            content=content,
+            app_name=app_name.value,
+            user=user,
+            created_at=now,
+            updated_at=now,
         )
         serializer = cls._serializer(instance=notification)
-        channel = get_notifications_channel(user)
-        cls._redis_client.publish(channel, json.dumps({**serializer.data}))
+
+        return cls.publish(payload={**serializer.data}, user=user)
+
+    @classmethod
+    def get_unread_count(cls, user: User) -> int:
+        """Unread notifications of a user, counted in the database on a miss."""
+        key = get_unread_count_key(user)
+
+        try:
+            count = cls._redis_client.get(key)
+
+            if count is not None:
+                return int(count)
+        except redis.RedisError:
+            logger.exception("Failed to read unread count of user %s.", user.pk)
+
+        count = Notification.objects.filter(user=user, seen=False).count()
+
+        try:
+            cls._redis_client.set(key, count, ex=UNREAD_COUNT_TTL, nx=True)
+        except redis.RedisError:
+            logger.exception("Failed to store unread count of user %s.", user.pk)
+
+        return count
+
+    @classmethod
+    def adjust_unread_count(cls, user: User, delta: int) -> None:
+        if not delta:
+            return
+
+        try:
+            cls._adjust_unread_script(keys=[get_unread_count_key(user)], args=[delta])
+        except redis.RedisError:
+            logger.exception("Failed to adjust unread count of user %s.", user.pk)
+            cls.invalidate_unread_count(user)
+
+    @classmethod
+    def invalidate_unread_count(cls, user: User) -> None:
+        try:
+            cls._redis_client.delete(get_unread_count_key(user))
+        except redis.RedisError:
+            logger.exception("Failed to reset unread count of user %s.", user.pk)
 
 
 notification_manager = NotificationManager()
 
+# Do not lose notifications still pending when the process exits.
+atexit.register(notification_manager.flush)
+
+
+@task_postrun.connect
+def flush_notifications_after_task(**kwargs):
+    """Write a Celery task's notifications before the worker moves on."""
+    notification_manager.flush()
 
-# Convenience function.
+
+# Convenience functions.
 def send_notification(content: str, app_name: AppName, user: User):
     notification_manager.send_message(content, app_name, user)
+
+
+def publish_notification(content: str, app_name: AppName, user: User) -> str:
+    return notification_manager.publish_transient(content, app_name, user)
+
+
+def publish_event(payload: dict, user: User) -> str:
+    return notification_manager.publish(payload, user)
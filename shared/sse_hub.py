@@ -0,0 +1,102 @@
+"""
+In-process hub multiplexing notification channels onto one Redis subscription.
+
+Each worker process keeps a single pattern subscription to every user's
+notifications channel and dispatches messages to the bounded asyncio queues of
+the SSE clients connected to it. A slow client loses its oldest events instead
+of holding back the others.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections import defaultdict
+from typing import AsyncIterator, Dict, Optional, Set
+
+import redis.asyncio as redis
+from django.conf import settings
+
+from .utils.redis import NOTIFICATIONS_CHANNEL_PATTERN
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait before subscribing again after losing the Redis connection.
+RECONNECT_DELAY = 1.0
+
+
+class SSEHub:
+    """Fans out messages of one Redis pattern subscription to per-client queues."""
+
+    def __init__(self, redis_url: str, pattern: str, queue_size: int):
+        self.redis_url = redis_url
+        self.pattern = pattern
+        self.queue_size = queue_size
+        self._queues: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+        self._listener: Optional[asyncio.Task] = None
+
+    @contextlib.asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[asyncio.Queue]:
+        """Register a client queue for a channel for the duration of the block."""
+        self._ensure_listener()
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._queues[channel].add(queue)
+
+        try:
+            yield queue
+        finally:
+            queues = self._queues.get(channel)
+
+            if queues is not None:
+                queues.discard(queue)
+
+                if not queues:
+                    del self._queues[channel]
+
+    def dispatch(self, channel: str, data: str) -> None:
+        """Hand a message to every client queue of a channel."""
+        for queue in self._queues.get(channel, ()):
+            if queue.full():
+                # Drop the oldest event rather than blocking the other clients.
+                queue.get_nowait()
+
+            queue.put_nowait(data)
+
+    @property
+    def client_count(self) -> int:
+        return sum(len(queues) for queues in self._queues.values())
+
+    def _ensure_listener(self) -> None:
+        # One listener per event loop; restarted if it ever stopped.
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.get_running_loop().create_task(self._listen())
+
+    async def _listen(self) -> None:
+        while True:
+            connection = redis.from_url(self.redis_url, decode_responses=True)
+            pubsub = connection.pubsub()
+
+            try:
+                await pubsub.psubscribe(self.pattern)
+
+                async for message in pubsub.listen():
+                    if message["type"] == "pmessage":
+                        self.dispatch(message["channel"], message["data"])
+
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("SSE hub lost its Redis subscription; reconnecting.")
+                await asyncio.sleep(RECONNECT_DELAY)
+            finally:
+                with contextlib.suppress(Exception):
+                    await pubsub.aclose()
+
+                with contextlib.suppress(Exception):
+                    await connection.aclose()
+
+
+sse_hub = SSEHub(
+    redis_url=settings.CACHES["default"]["LOCATION"],
+    pattern=NOTIFICATIONS_CHANNEL_PATTERN,
+    queue_size=settings.SSE_CLIENT_QUEUE_SIZE,
+)
@@ -0,0 +1,454 @@
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from filelock import FileLock
+from rest_framework.test import APIClient
+
+from .constants import AppName
+from .infrastructure.storage import ObjectDiskCache
+from .models import Notification
+from .notifications import NotificationManager
+from .schemas import StrictPayload
+from .workflows.base import Operation, OperationCancelled, Workflow
+from .workflows.base.instrumentation import measure_operation
+
+# ---------------------------------------------------------------------------
+# Workflow DAG mode
+# ---------------------------------------------------------------------------
+
+# Fails a test instead of hanging it when operations do not run concurrently.
+BARRIER_TIMEOUT = 5
+
+# Set by DiamondWorkflow.operation_context on the thread running an operation.
+_operation_context = threading.local()
+
+
+class StepPayload(StrictPayload):
+    value: int = 0
+
+
+class _Step:
+    """Test operation: records that it ran and adds up its upstream outputs."""
+
+    upstream = ()
+
+    def execute(self, *args, **kwargs):
+        self.ctx.setdefault("ran", []).append(self.name)
+        self.ctx.setdefault("context", {})[self.name] = getattr(
+            _operation_context, "value", None
+        )
+
+        if self.name in self.ctx.get("barrier_steps", ()):
+            self.ctx["barrier"].wait(timeout=BARRIER_TIMEOUT)
+
+        return self.payload.value + sum(self.outputs[name] for name in self.upstream)
+
+
+class Source(_Step, Operation[StepPayload, int]):
+    name = "source"
+
+
+class Left(_Step, Operation[StepPayload, int]):
+    name = "left"
+    upstream = ("source",)
+
+
+class Right(_Step, Operation[StepPayload, int]):
+    name = "right"
+    upstream = ("source",)
+
+
+class Join(_Step, Operation[StepPayload, int]):
+    name = "join"
+    upstream = ("left", "right")
+
+
+class Failing(Operation[StepPayload, int]):
+    name = "failing"
+
+    def execute(self, *args, **kwargs):
+        self.ctx["started"].wait(timeout=BARRIER_TIMEOUT)
+        raise ValueError("boom")
+
+
+class WaitsForCancel(Operation[StepPayload, int]):
+    name = "waits_for_cancel"
+
+    def execute(self, *args, **kwargs):
+        self.ctx["started"].set()
+        self.cancel_event.wait(timeout=BARRIER_TIMEOUT)
+        self.check_cancelled()
+        return 0
+
+
+class DiamondWorkflow(Workflow):
+    name = "diamond_workflow"
+    operations = (Source, Left, Right, Join)
+    dependencies = {
+        Left: (Source,),
+        Right: (Source,),
+        Join: (Left, Right),
+    }
+
+    @contextmanager
+    def operation_context(self):
+        _operation_context.value = "entered"
+        try:
+            yield
+        finally:
+            del _operation_context.value
+
+
+class FailingWorkflow(Workflow):
+    name = "failing_workflow"
+    operations = (Failing, WaitsForCancel, Join)
+    dependencies = {Join: (Failing, WaitsForCancel)}
+
+
+class CyclicWorkflow(Workflow):
+    name = "cyclic_workflow"
+    operations = (Source, Left, Right)
+    dependencies = {Left: (Right,), Right: (Left,)}
+
+
+class TestWorkflowDependencies(SimpleTestCase):
+    def make_diamond(self):
+        return DiamondWorkflow(
+            payload={
+                "source": {"value": 1},
+                "left": {"value": 10},
+                "right": {"value": 100},
+                "join": {},
+            }
+        )
+
+    def test_operations_run_after_their_dependencies(self):
+        workflow = self.make_diamond()
+
+        result = workflow.execute()
+
+        self.assertEqual(result, 11 + 101)
+        ran = workflow.ctx["ran"]
+        self.assertEqual(ran[0], "source")
+        self.assertEqual(ran[-1], "join")
+        self.assertCountEqual(ran[1:3], ["left", "right"])
+
+    def test_independent_operations_run_concurrently(self):
+        workflow = self.make_diamond()
+        # Left and right only get past the barrier together; run one after the
+        # other, the first would time out.
+        workflow.ctx["barrier"] = threading.Barrier(2)
+        workflow.ctx["barrier_steps"] = ("left", "right")
+
+        self.assertEqual(workflow.execute(), 112)
+
+    def test_operation_context_is_entered_on_pool_threads(self):
+        workflow = self.make_diamond()
+
+        workflow.execute()
+
+        self.assertEqual(
+            workflow.ctx["context"],
+            {
+                "source": "entered",
+                "left": "entered",
+                "right": "entered",
+                "join": "entered",
+            },
+        )
+        self.assertIsNone(getattr(_operation_context, "value", None))
+
+    def test_failure_cancels_running_and_pending_operations(self):
+        workflow = FailingWorkflow(payload={"failing": {}, "waits_for_cancel": {}})
+        workflow.ctx["started"] = threading.Event()
+
+        with self.assertRaisesMessage(ValueError, "boom"):
+            workflow.execute()
+
+        self.assertTrue(workflow.cancel_event.is_set())
+        self.assertEqual(workflow.metrics["waits_for_cancel"]["status"], "error")
+        self.assertNotIn("join", workflow.metrics)
+        self.assertNotIn("join", workflow.outputs)
+
+    def test_cancelled_workflow_does_not_start_operations(self):
+        workflow = self.make_diamond()
+        workflow.cancel_event.set()
+
+        with self.assertRaises(OperationCancelled):
+            workflow.execute()
+
+        self.assertNotIn("ran", workflow.ctx)
+
+    def test_cycle_is_rejected(self):
+        workflow = CyclicWorkflow(payload={"source": {}, "left": {}, "right": {}})
+
+        with self.assertRaisesMessage(ValueError, "contain a cycle: Left, Right"):
+            workflow.execute()
+
+
+# ---------------------------------------------------------------------------
+# Operation measurements
+# ---------------------------------------------------------------------------
+
+
+class TestMeasureOperation(SimpleTestCase):
+    def test_records_resources_of_the_block(self):
+        with (
+            self.assertLogs("shared.workflows.base.instrumentation") as logs,
+            measure_operation("workflow", "operation") as metrics,
+        ):
+            # Held until the block exits so the RSS sampler sees it.
+            allocated = b"x" * 64 * 1024**2
+
+        del allocated
+        self.assertEqual(metrics["status"], "ok")
+        self.assertGreaterEqual(metrics["wall_seconds"], 0)
+        self.assertGreaterEqual(metrics["cpu_seconds"], 0)
+        self.assertGreaterEqual(metrics["peak_rss_delta_bytes"], 32 * 1024**2)
+        self.assertGreaterEqual(
+            metrics["peak_rss_bytes"], metrics["peak_rss_delta_bytes"]
+        )
+        self.assertEqual(logs.records[0].event, "workflow.operation")
+        self.assertEqual(logs.records[0].operation, "operation")
+
+    def test_records_error_status_when_the_block_raises(self):
+        with (
+            self.assertRaises(ValueError),
+            measure_operation("workflow", "operation") as metrics,
+        ):
+            raise ValueError("boom")
+
+        self.assertEqual(metrics["status"], "error")
+        self.assertIn("wall_seconds", metrics)
+
+
+# ---------------------------------------------------------------------------
+# Object disk cache
+# ---------------------------------------------------------------------------
+
+
+def make_storage(objects):
+    """Object storage mock serving `objects`, a dict of key -> (etag, bytes)."""
+    storage = MagicMock()
+
+    def get_object_info(key, bucket=None):
+        etag, data = objects[key]
+        return {"bucket": "data", "key": key, "etag": etag, "size": len(data)}
+
+    def download_file(key, path, bucket=None, etag=None):
+        current_etag, data = objects[key]
+
+        if etag != current_etag:
+            raise RuntimeError("Precondition failed")
+
+        Path(path).write_bytes(data)
+        return {"bucket": bucket, "key": key, "path": path, "etag": etag}
+
+    storage.get_object_info.side_effect = get_object_info
+    storage.download_file.side_effect = download_file
+    return storage
+
+
+class TestObjectDiskCache(SimpleTestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        self.cache = ObjectDiskCache(
+            root=os.path.join(self.dir.name, "cache"), max_bytes=10
+        )
+        self.storage = make_storage(
+            {"a.tif": ("etag-a", b"aaaa"), "b.tif": ("etag-b", b"bbbb")}
+        )
+
+    def materialize(self, key):
+        path = os.path.join(self.dir.name, "work", key)
+        return self.cache.materialize(self.storage, key=key, path=path)
+
+    def test_miss_downloads_and_hit_reuses_the_entry(self):
+        first = self.materialize("a.tif")
+        second = self.materialize("a.tif")
+
+        self.assertFalse(first["cache_hit"])
+        self.assertTrue(second["cache_hit"])
+        self.assertEqual(Path(second["path"]).read_bytes(), b"aaaa")
+        self.storage.download_file.assert_called_once()
+        # The download is pinned to the version the entry is keyed by.
+        self.assertEqual(self.storage.download_file.call_args.kwargs["etag"], "etag-a")
+
+    def test_changed_object_gets_a_new_entry(self):
+        self.materialize("a.tif")
+        self.storage = make_storage({"a.tif": ("etag-a2", b"AAAA")})
+
+        result = self.materialize("a.tif")
+
+        self.assertFalse(result["cache_hit"])
+        self.assertEqual(Path(result["path"]).read_bytes(), b"AAAA")
+
+    def test_eviction_removes_least_recently_used_but_keeps_the_new_entry(self):
+        self.materialize("a.tif")
+        self.materialize("b.tif")
+        self.cache.max_bytes = 4
+
+        entry = self.cache.fetch(self.storage, key="a.tif")["path"]
+
+        # a.tif was just used and is kept even though b.tif is older.
+        self.assertTrue(Path(entry).exists())
+        self.assertEqual(len(list(self.cache.root.rglob("*.obj"))), 1)
+
+    def test_eviction_skips_entries_in_use(self):
+        entry = Path(self.cache.fetch(self.storage, key="a.tif")["path"])
+        self.cache.max_bytes = 0
+
+        with FileLock(f"{entry}.lock"):
+            self.assertEqual(self.cache.evict(), 0)
+
+        self.assertTrue(entry.exists())
+        self.assertEqual(self.cache.evict(), 1)
+
+    def test_copies_when_the_entry_cannot_be_linked(self):
+        with patch("shared.infrastructure.storage.disk_cache.os.link") as link:
+            link.side_effect = OSError("Invalid cross-device link")
+            result = self.materialize("a.tif")
+
+        destination = Path(result["path"])
+        self.assertEqual(destination.read_bytes(), b"aaaa")
+        # The copy is writable, unlike the read-only cache entry.
+        self.assertTrue(os.access(destination, os.W_OK))
+
+
+# ---------------------------------------------------------------------------
+# Notifications
+# ---------------------------------------------------------------------------
+
+
+def make_user(username="notified-user", password="testpass"):
+    return User.objects.create_user(username=username, password=password)
+
+
+@override_settings(NOTIFICATIONS_FLUSH_INTERVAL=60, NOTIFICATIONS_BUFFER_SIZE=3)
+@patch.object(NotificationManager, "adjust_unread_count")
+@patch.object(NotificationManager, "publish")
+class TestNotificationBuffer(TestCase):
+    def setUp(self):
+        self.user = make_user()
+        self.manager = NotificationManager()
+        self.addCleanup(self.manager.flush)
+
+    def send(self, count=1):
+        for index in range(count):
+            self.manager.send_message(f"message {index}", AppName.WEB_GIS, self.user)
+
+    @patch("shared.notifications.current_task", new=MagicMock())
+    def test_task_flushes_when_buffer_is_full(self, publish, adjust_unread_count):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.send(2)
+
+        self.assertEqual(Notification.objects.count(), 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.send()
+
+        self.assertEqual(Notification.objects.count(), 3)
+        self.assertEqual(publish.call_count, 3)
+        adjust_unread_count.assert_called_once_with(self.user, 3)
+        self.assertIsNone(self.manager._flush_timer)
+
+    @patch("shared.notifications.current_task", new=MagicMock())
+    @patch("shared.notifications.threading.Timer")
+    def test_task_flushes_on_timer(self, timer, publish, adjust_unread_count):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.send(2)
+
+        # One timer for the batch, started when the first notification queued.
+        timer.assert_called_once_with(60, self.manager._flush_in_thread)
+        timer.return_value.start.assert_called_once()
+        self.assertEqual(Notification.objects.count(), 0)
+
+        # The timer thread closes its own connection; keep the test's open.
+        with patch("shared.notifications.connection"):
+            self.manager._flush_in_thread()
+
+        self.assertEqual(Notification.objects.count(), 2)
+        adjust_unread_count.assert_called_once_with(self.user, 2)
+
+    def test_request_writes_on_commit(self, publish, adjust_unread_count):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.send()
+
+            self.assertEqual(Notification.objects.count(), 0)
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(Notification.objects.count(), 1)
+        adjust_unread_count.assert_called_once_with(self.user, 1)
+
+    def test_rolled_back_notification_is_not_written(
+        self, publish, adjust_unread_count
+    ):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with self.assertRaises(RuntimeError), transaction.atomic():
+                self.send()
+                raise RuntimeError("rollback")
+
+        self.assertEqual(callbacks, [])
+        self.assertEqual(Notification.objects.count(), 0)
+        publish.assert_not_called()
+
+
+@patch.object(NotificationManager, "adjust_unread_count")
+class TestNotificationBulkUpdate(TestCase):
+    def setUp(self):
+        self.user = make_user()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.notifications = [
+            Notification.objects.create(
+                content=f"message {index}",
+                app_name=AppName.WEB_GIS.value,
+                user=self.user,
+                seen=index == 0,
+            )
+            for index in range(3)
+        ]
+
+    def bulk_update(self, seen, ids=None):
+        data = {"seen": seen}
+
+        if ids is not None:
+            data["ids"] = [str(notification_id) for notification_id in ids]
+
+        return self.client.patch(reverse("notifications-bulk"), data, format="json")
+
+    def test_marking_seen_decrements_by_changed_rows(self, adjust_unread_count):
+        response = self.bulk_update(
+            True, ids=[notification.pk for notification in self.notifications]
+        )
+
+        self.assertEqual(response.status_code, 200)
+        # The first notification was already seen and does not count.
+        adjust_unread_count.assert_called_once_with(self.user, -2)
+        self.assertFalse(Notification.objects.filter(seen=False).exists())
+
+    def test_marking_unseen_increments_by_changed_rows(self, adjust_unread_count):
+        response = self.bulk_update(False)
+
+        self.assertEqual(response.status_code, 200)
+        adjust_unread_count.assert_called_once_with(self.user, 1)
+
+    def test_other_users_notifications_are_not_counted(self, adjust_unread_count):
+        other = make_user("other-user")
+        Notification.objects.create(
+            content="other", app_name=AppName.WEB_GIS.value, user=other
+        )
+
+        self.bulk_update(True)
+
+        adjust_unread_count.assert_called_once_with(self.user, -2)
+        self.assertTrue(Notification.objects.filter(user=other, seen=False).exists())
@@ -1,5 +1,26 @@
+from typing import Tuple
+
 from django.contrib.auth.models import AnonymousUser, User
 
+# Matches the notifications channel of every user.
+NOTIFICATIONS_CHANNEL_PATTERN = "notifications_*"
+
 
 def get_notifications_channel(user: User | AnonymousUser):
     return f"notifications_{user.pk}"
+
+
+def get_notifications_stream(user: User | AnonymousUser):
+    return f"notifications_stream:{user.pk}"
+
+
+def decode_notification_message(message: str) -> Tuple[str, str]:
+    """Split a channel message published as '<stream id> <data>'."""
+    event_id, _, data = message.partition(" ")
+    return event_id, data
+
+
+def parse_stream_id(event_id: str) -> Tuple[int, int]:
+    """Turn a Redis stream id ('<ms>-<seq>') into a comparable tuple."""
+    milliseconds, _, sequence = event_id.partition("-")
+    return int(milliseconds), int(sequence or 0)
@@ -3,6 +3,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from ..models.notification_models import Notification
+from ..notifications import notification_manager
 from ..serializers import BulkUpdateNotificationsSerializer, NotificationSerializer
 from . import BaseModelViewSet
 
@@ -20,6 +21,14 @@ class NotificationViewSet(BaseModelViewSet):
             .order_by("-created_at")
         )
 
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        notification_manager.invalidate_unread_count(self.request.user)
+
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        notification_manager.invalidate_unread_count(self.request.user)
+
     @action(
         detail=False,
         methods=["patch"],
@@ -29,14 +38,26 @@ class NotificationViewSet(BaseModelViewSet):
     def bulk(self, request):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
+        seen = serializer.validated_data["seen"]
         queryset = self.get_queryset()
         if ids := serializer.validated_data.get("ids"):
             queryset = queryset.filter(id__in=ids)
 
-        queryset.update(seen=serializer.validated_data["seen"])
+        # Only rows whose flag actually changes move the unread counter.
+        changed = queryset.filter(seen=not seen).update(seen=seen)
+        notification_manager.adjust_unread_count(
+            request.user, -changed if seen else changed
+        )
 
         return Response(
             {
                 "message": f"Seen updated for all the notifications to {serializer.validated_data['seen']}"
             }
         )
+
+    @action(detail=False, methods=["get"], url_path="unread-count")
+    def unread_count(self, request):
+        """Unread notifications of the user, served from a Redis counter."""
+        return Response(
+            {"unread": notification_manager.get_unread_count(request.user)}
+        )
@@ -1,5 +1,5 @@
 import asyncio
-import contextlib
+from typing import Optional
 
 import redis.asyncio as redis
 from asgiref.sync import sync_to_async
@@ -9,7 +9,13 @@ from django.http import JsonResponse, StreamingHttpResponse
 from rest_framework import status
 from rest_framework.authtoken.models import Token
 
-from ..utils.redis import get_notifications_channel
+from ..sse_hub import sse_hub
+from ..utils.redis import (
+    decode_notification_message,
+    get_notifications_channel,
+    get_notifications_stream,
+    parse_stream_id,
+)
 
 redis_conn = redis.from_url(
     settings.CACHES["default"]["LOCATION"],
@@ -17,32 +23,58 @@ redis_conn = redis.from_url(
 )
 
 
-async def redis_event_stream(channel_name: str):
-    pubsub = redis_conn.pubsub()
-    await pubsub.subscribe(channel_name)
+def format_event(event_id: str, data: str) -> str:
+    return f"id: {event_id}\ndata: {data}\n\n"
+
+
+async def read_missed_events(stream_name: str, last_event_id: str):
+    """Events of a stream published after last_event_id, oldest first."""
+    try:
+        parse_stream_id(last_event_id)
+    except ValueError:
+        return []
 
     try:
+        entries = await redis_conn.xrange(
+            stream_name,
+            min=f"({last_event_id}",
+            max="+",
+            count=settings.NOTIFICATIONS_STREAM_MAXLEN,
+        )
+    except redis.ResponseError:
+        return []
+
+    return [(event_id, fields["data"]) for event_id, fields in entries]
+
+
+async def redis_event_stream(user: User, last_event_id: Optional[str] = None):
+    # Subscribe before replaying so nothing published in between is lost;
+    # events seen during the replay are skipped by id below.
+    async with sse_hub.subscribe(get_notifications_channel(user)) as queue:
+        last_seen = None
+
+        if last_event_id:
+            for event_id, data in await read_missed_events(
+                get_notifications_stream(user), last_event_id
+            ):
+                last_seen = parse_stream_id(event_id)
+                yield format_event(event_id, data)
+
         while True:
-            message = await pubsub.get_message(
-                ignore_subscribe_messages=True, timeout=1.0
-            )
+            try:
+                message = await asyncio.wait_for(
+                    queue.get(), timeout=settings.SSE_HEARTBEAT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                yield ": heartbeat\n\n"  # Keep the connection alive.
+                continue
 
-            if message:
-                data = message["data"]
-                yield f"data: {data}\n\n"
-                await asyncio.sleep(0)
-            else:
-                yield "\n\n"  # Heartbeat to keep the connection alive.
-                await asyncio.sleep(1)
+            event_id, data = decode_notification_message(message)
 
-    except asyncio.CancelledError:
-        raise
-    finally:
-        with contextlib.suppress(Exception):
-            await pubsub.unsubscribe(channel_name)
+            if last_seen is not None and parse_stream_id(event_id) <= last_seen:
+                continue
 
-        with contextlib.suppress(Exception):
-            await pubsub.close()
+            yield format_event(event_id, data)
 
 
 @sync_to_async
@@ -79,8 +111,14 @@ async def sse_view(request):
             {"error": "Invalid user"}, status=status.HTTP_400_BAD_REQUEST
         )
 
+    # Browsers resend the last received id when an EventSource reconnects;
+    # clients opening a new EventSource can pass it as a query parameter.
+    last_event_id = request.headers.get("Last-Event-ID") or request.GET.get(
+        "last_event_id"
+    )
+
     return StreamingHttpResponse(
-        redis_event_stream(get_notifications_channel(user)),
+        redis_event_stream(user, last_event_id),
         content_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -1,4 +1,4 @@
-from .base_operation import Operation
+from .base_operation import Operation, OperationCancelled
 from .base_workflow import Workflow
 
-__all__ = ["Operation", "Workflow"]
+__all__ = ["Operation", "OperationCancelled", "Workflow"]
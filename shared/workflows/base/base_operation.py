@@ -1,16 +1,35 @@
+import hashlib
+import json
+import logging
 from abc import ABC, abstractmethod
 from typing import ClassVar, Generic, TypeVar, get_args, get_origin
 
+from django.conf import settings
 from pydantic import BaseModel
 
+logger = logging.getLogger(__name__)
+
 PayloadT = TypeVar("PayloadT", bound=BaseModel)
 OutputT = TypeVar("OutputT")
 
 
+class OperationCancelled(RuntimeError):
+    """Raised inside an operation when its workflow has been cancelled."""
+
+
 class Operation(ABC, Generic[PayloadT, OutputT]):
     payload_model: ClassVar[type[BaseModel]]
     name = ""
 
+    # Opt-in result memoization, see run(). Cacheable operations identify their
+    # input through input_fingerprint(); payload fields that differ between
+    # otherwise identical runs (job ids, work dirs) go in cache_exclude.
+    cacheable = False
+    cache_exclude: ClassVar[frozenset[str]] = frozenset()
+    cache_ttl = 7 * 24 * 60 * 60
+    # Bump to invalidate entries written by an older implementation.
+    cache_version = 1
+
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
 
@@ -46,6 +65,94 @@ class Operation(ABC, Generic[PayloadT, OutputT]):
         self.payload = payload
         self.outputs = {}
         self.ctx = {}
+        self.cancel_event = None
+
+    def check_cancelled(self):
+        """Raise OperationCancelled if the owning workflow was cancelled."""
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise OperationCancelled(f"Operation {type(self).__name__} was cancelled.")
+
+    def run(self, *args, **kwargs) -> OutputT:
+        """Execute the operation, reusing a memoized result when one exists."""
+        from .result_cache import get_cached_result, set_cached_result
+
+        cache_key = self.cache_key() if self.cache_enabled() else None
+
+        if cache_key is None:
+            return self.execute(*args, **kwargs)
+
+        if (entry := get_cached_result(cache_key)) is not None:
+            try:
+                output = self.restore_cached(cache_key, entry)
+            except Exception:
+                logger.warning(
+                    "Discarding cached result of %s (%s).",
+                    self.name,
+                    cache_key,
+                    exc_info=True,
+                )
+            else:
+                self.ctx.setdefault("cache_hits", []).append(self.name)
+                return output
+
+        output = self.execute(*args, **kwargs)
+
+        try:
+            if (entry := self.cache_entry(cache_key, output)) is not None:
+                set_cached_result(cache_key, entry, self.cache_ttl)
+        except Exception:
+            logger.warning(
+                "Could not cache result of %s (%s).",
+                self.name,
+                cache_key,
+                exc_info=True,
+            )
+
+        return output
+
+    def cache_enabled(self) -> bool:
+        return self.cacheable and settings.WORKFLOW_RESULT_CACHE_ENABLED
+
+    def cache_key(self) -> str | None:
+        """Hash of the operation, its payload and its input; None disables caching."""
+        fingerprint = self.input_fingerprint()
+
+        if fingerprint is None:
+            return None
+
+        material = {
+            "operation": f"{type(self).__module__}.{type(self).__qualname__}",
+            "version": self.cache_version,
+            "payload": self.payload.model_dump(
+                mode="json", exclude=set(self.cache_exclude)
+            ),
+            "input": fingerprint,
+        }
+
+        return hashlib.sha256(json.dumps(material, sort_keys=True).encode()).hexdigest()
+
+    def input_fingerprint(self) -> str | None:
+        """Identify the operation's input data (e.g. an object etag)."""
+        return None
+
+    def cache_entry(self, cache_key: str, output: OutputT) -> dict:
+        """Build the JSON-serializable entry stored for a result.
+
+        Return None to store nothing here, e.g. when the entry is written once
+        a later operation has persisted the output.
+        """
+        return {"output": output}
+
+    def restore_cached(self, cache_key: str, entry: dict) -> OutputT:
+        """Turn a stored entry back into the operation's output."""
+        return entry["output"]
+
+    def checkpoint_valid(self, output: OutputT) -> bool:
+        """Whether a checkpointed output can be reused when a workflow resumes.
+
+        Operations that leave local files behind should check they still exist.
+        """
+        return True
 
     @abstractmethod
     def execute(self, *args, **kwargs) -> OutputT:
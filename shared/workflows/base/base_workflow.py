@@ -1,19 +1,54 @@
+import threading
 from abc import ABC
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import nullcontext
 
+from django.db import connections
 from pydantic import ValidationError
 
+from .instrumentation import measure_operation
+
 
 class Workflow(ABC):
-    """Base workflow that validates payloads and runs configured operations in order."""
+    """Base workflow that validates payloads and runs configured operations.
+
+    Operations run sequentially in declaration order unless `dependencies` is
+    set, in which case they run as a DAG: each operation starts on a thread
+    pool as soon as the operations it depends on have finished.
+
+    With a `checkpoint_key`, outputs and the JSON-serializable part of ctx are
+    saved after every operation. Running a workflow with the same key again
+    skips operations that completed before, as long as everything upstream
+    was skipped too and their artifacts are still valid. The checkpoint is
+    deleted once the workflow succeeds.
+    """
 
     operations = ()
+    # Operations that are skipped when no payload is given for them.
+    optional_operations = ()
+    # DAG mode: maps an operation to the operations whose outputs it needs.
+    # Operations missing from the mapping have no dependencies.
+    dependencies = {}
+    max_workers = 4
     name = ""
 
-    def __init__(self, payload: object):
+    def __init__(self, payload: object, checkpoint_key: str | None = None):
         """Create a workflow with name-keyed payloads."""
         self.payloads = self._build_payloads(payload)
+        self.active_operations = tuple(
+            operation
+            for operation in self.operations
+            if operation in self.payloads or operation not in self.optional_operations
+        )
         self.outputs = {}
         self.ctx = {}
+        # Per-operation wall/CPU time, peak RSS growth and I/O, by operation name.
+        self.metrics = {}
+        self.cancel_event = threading.Event()
+        self.checkpoint_key = checkpoint_key
+        self.checkpoint = None
+        self.resumed = set()
+        self._checkpoint_lock = threading.Lock()
 
     def _build_payloads(self, payload):
         """Build operation payloads from a name-keyed mapping."""
@@ -31,7 +66,15 @@ class Workflow(ABC):
 
             payload_models = {}
 
-            first_operation = self.operations[0] if self.operations else None
+            first_operation = next(
+                (
+                    operation
+                    for operation in self.operations
+                    if operation not in self.optional_operations
+                    or (operation.name or operation.__name__) in payload
+                ),
+                None,
+            )
 
             if first_operation is None:
                 raise ValueError("Workflow has no operations configured.")
@@ -67,9 +110,12 @@ class Workflow(ABC):
 
     def _run_operations(self, *args, **kwargs):
         """Run operations sequentially and store outputs by operation name."""
+        if self.dependencies:
+            return self._run_graph(*args, **kwargs)
+
         operation_output = None
 
-        for index, operation in enumerate(self.operations):
+        for index, operation in enumerate(self.active_operations):
             if operation in self.payloads:
                 payload = self.payloads[operation]
             elif index == 0:  # If first operation doesn't have payload then raise error
@@ -80,17 +126,204 @@ class Workflow(ABC):
                 previous_operation_output = operation_output
                 payload = self._validate_payload(operation, previous_operation_output)
 
-            operation_instance = operation(payload)
-            operation_instance.outputs = self.outputs
-            operation_instance.ctx = self.ctx
+            operation_output = self._run_operation(
+                operation,
+                payload,
+                *args,
+                upstream=set(self.active_operations[:index]),
+                **kwargs,
+            )
+
+        return operation_output
+
+    def _run_operation(self, operation, payload, *args, upstream=(), **kwargs):
+        """Execute a single operation against the shared outputs and ctx.
+
+        `upstream` lists the operations this one depends on; it is only resumed
+        from the checkpoint when all of them were resumed as well.
+        """
+        operation_instance = operation(payload)
+        operation_instance.outputs = self.outputs
+        operation_instance.ctx = self.ctx
+        operation_instance.cancel_event = self.cancel_event
+        operation_name = operation.name or operation.__name__
 
-            operation_output = operation_instance.execute(*args, **kwargs)
-            operation_name = operation.name or operation.__name__
+        if self._can_resume(operation_instance, upstream):
+            operation_output = self.checkpoint.outputs[operation_name]
+            self.resumed.add(operation)
+            self.metrics[operation_name] = {"status": "resumed"}
+        else:
+            operation_instance.check_cancelled()
 
-            self.outputs[operation_name] = operation_output
+            with measure_operation(
+                self.name or type(self).__name__, operation_name
+            ) as metrics:
+                self.metrics[operation_name] = metrics
+                operation_output = operation_instance.run(*args, **kwargs)
+
+            if operation_name in self.ctx.get("cache_hits", ()):
+                metrics["cache_hit"] = True
+
+        self.outputs[operation_name] = operation_output
+        self._save_checkpoint()
 
         return operation_output
 
+    def _can_resume(self, operation_instance, upstream):
+        """Whether an operation's checkpointed output can be reused."""
+        operation_name = operation_instance.name or type(operation_instance).__name__
+
+        if self.checkpoint is None or operation_name not in self.checkpoint.completed:
+            return False
+
+        if not set(upstream) <= self.resumed:
+            return False
+
+        return operation_instance.checkpoint_valid(
+            self.checkpoint.outputs[operation_name]
+        )
+
+    def _load_checkpoint(self):
+        """Load the saved checkpoint and seed ctx with its saved entries."""
+        from .checkpoint import load_checkpoint
+
+        self.checkpoint = load_checkpoint(self.checkpoint_key)
+
+        if self.checkpoint is None:
+            return
+
+        for name, value in self.checkpoint.ctx.items():
+            self.ctx.setdefault(name, value)
+
+    def _save_checkpoint(self):
+        """Persist completed operations; outputs that are not JSON cannot resume."""
+        if self.checkpoint_key is None:
+            return
+
+        from .checkpoint import json_safe, save_checkpoint
+
+        with self._checkpoint_lock:
+            outputs = json_safe(self.outputs)
+            save_checkpoint(
+                self.checkpoint_key,
+                workflow=self.name,
+                completed=list(outputs),
+                outputs=outputs,
+                ctx=json_safe(self.ctx),
+            )
+
+    def _run_graph(self, *args, **kwargs):
+        """Run operations as a DAG, executing ready operations concurrently.
+
+        The first failure cancels operations that have not started yet and
+        sets `cancel_event` for running ones; it is re-raised once every
+        running operation has returned.
+        """
+        remaining = {
+            operation: self._active_dependencies(operation)
+            for operation in self.active_operations
+        }
+        completed = set()
+        running = {}
+        error = None
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix=self.name or "workflow",
+        ) as executor:
+            while remaining or running:
+                if error is None:
+                    ready = [
+                        operation
+                        for operation, operation_dependencies in remaining.items()
+                        if operation_dependencies <= completed
+                    ]
+
+                    for operation in ready:
+                        del remaining[operation]
+                        future = executor.submit(
+                            self._run_graph_operation, operation, *args, **kwargs
+                        )
+                        running[future] = operation
+
+                if not running:
+                    break
+
+                finished, _pending = wait(running, return_when=FIRST_COMPLETED)
+
+                for future in finished:
+                    operation = running.pop(future)
+
+                    if future.cancelled():
+                        continue
+
+                    exc = future.exception()
+
+                    if exc is None:
+                        completed.add(operation)
+                    elif error is None:
+                        error = exc
+                        self.cancel_event.set()
+
+                        for pending_future in running:
+                            pending_future.cancel()
+
+        if error is not None:
+            raise error
+
+        last_operation = self.active_operations[-1]
+
+        return self.outputs.get(last_operation.name or last_operation.__name__)
+
+    def _run_graph_operation(self, operation, *args, **kwargs):
+        """Resolve the payload of a DAG operation and execute it on a pool thread."""
+        try:
+            with self.operation_context():
+                return self._run_operation(
+                    operation,
+                    self._graph_payload(operation),
+                    *args,
+                    upstream=self._active_dependencies(operation),
+                    **kwargs,
+                )
+        finally:
+            # Pool threads open their own database connections.
+            connections.close_all()
+
+    def operation_context(self):
+        """Context entered around each operation run on a DAG pool thread.
+
+        Thread-local state the caller set up, such as a GDAL environment, is
+        not visible on pool threads; workflows that need it re-create it here.
+        """
+        return nullcontext()
+
+    def _graph_payload(self, operation):
+        """Explicit payload, or the output of the single upstream operation."""
+        if operation not in self.payloads:
+            # Like sequential mode, a single upstream output can act as the payload.
+            upstream = self._active_dependencies(operation)
+
+            if len(upstream) != 1:
+                raise ValueError(
+                    f"Missing payload for operation: {operation.__name__}."
+                )
+
+            (dependency,) = upstream
+            return self._validate_payload(
+                operation, self.outputs[dependency.name or dependency.__name__]
+            )
+
+        return self.payloads[operation]
+
+    def _active_dependencies(self, operation):
+        """Dependencies of an operation, ignoring skipped optional operations."""
+        return {
+            dependency
+            for dependency in self.dependencies.get(operation, ())
+            if dependency in self.active_operations
+        }
+
     def execute(self, *args, **kwargs):
         """Execute the workflow and return the last operation result."""
         if not self.operations:
@@ -98,10 +331,51 @@ class Workflow(ABC):
 
         self.validate_payloads()
 
-        return self._run_operations(*args, **kwargs)
+        if self.checkpoint_key is None:
+            return self._run_operations(*args, **kwargs)
+
+        from .checkpoint import delete_checkpoint
+
+        self._load_checkpoint()
+        result = self._run_operations(*args, **kwargs)
+        delete_checkpoint(self.checkpoint_key)
+
+        return result
 
     def validate_payloads(self):
         """Validate that all provided payloads map to known operations."""
         for operation in self.payloads:
             if operation not in self.operations:
                 raise ValueError(f"Unknown operation payload: {operation.__name__}.")
+
+        self.validate_dependencies()
+
+    def validate_dependencies(self):
+        """Validate that the dependency graph only names known operations and is acyclic."""
+        for operation, operation_dependencies in self.dependencies.items():
+            for dependency in (operation, *operation_dependencies):
+                if dependency not in self.operations:
+                    raise ValueError(
+                        f"Unknown operation in dependencies: {dependency.__name__}."
+                    )
+
+        remaining = {
+            operation: self._active_dependencies(operation)
+            for operation in self.active_operations
+        }
+        resolved = set()
+
+        while remaining:
+            ready = [
+                operation
+                for operation, operation_dependencies in remaining.items()
+                if operation_dependencies <= resolved
+            ]
+
+            if not ready:
+                cycle = ", ".join(sorted(operation.__name__ for operation in remaining))
+                raise ValueError(f"Workflow dependencies contain a cycle: {cycle}.")
+
+            for operation in ready:
+                del remaining[operation]
+                resolved.add(operation)
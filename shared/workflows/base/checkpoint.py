@@ -0,0 +1,42 @@
+"""Persistence of workflow checkpoints (see Workflow checkpoint_key)."""
+
+import json
+
+from shared.models import WorkflowCheckpoint
+
+
+def json_safe(values: dict) -> dict:
+    """Keep the entries of a mapping that can be stored as JSON."""
+    safe = {}
+
+    for name, value in values.items():
+        try:
+            json.dumps(value)
+        except (TypeError, ValueError):
+            continue
+
+        safe[name] = value
+
+    return safe
+
+
+def load_checkpoint(key: str) -> WorkflowCheckpoint | None:
+    return WorkflowCheckpoint.objects.filter(key=key).first()
+
+
+def save_checkpoint(
+    key: str, workflow: str, completed: list, outputs: dict, ctx: dict
+) -> None:
+    WorkflowCheckpoint.objects.update_or_create(
+        key=key,
+        defaults={
+            "workflow": workflow,
+            "completed": completed,
+            "outputs": outputs,
+            "ctx": ctx,
+        },
+    )
+
+
+def delete_checkpoint(key: str) -> None:
+    WorkflowCheckpoint.objects.filter(key=key).delete()
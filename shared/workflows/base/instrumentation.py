@@ -0,0 +1,107 @@
+"""Per-operation resource measurements for workflows (see Workflow.metrics).
+
+CPU time, I/O counters and RSS are process-wide, so operations that overlap in
+a DAG workflow share them.
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+# Seconds between two RSS samples taken while an operation runs.
+RSS_SAMPLE_INTERVAL = 0.1
+
+
+def _io_counters(process):
+    try:
+        counters = process.io_counters()
+    except (AttributeError, psutil.Error):  # Not available on every platform.
+        return None
+
+    return counters.read_bytes, counters.write_bytes
+
+
+class _RssSampler:
+    """Track the highest current RSS of a process from a background thread.
+
+    ru_maxrss is a lifetime high-water mark, so it cannot show the memory an
+    operation used once an earlier one peaked higher.
+    """
+
+    def __init__(self, process, interval: float = RSS_SAMPLE_INTERVAL):
+        self._process = process
+        self._interval = interval
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="rss-sampler", daemon=True
+        )
+        self.start_rss = self.peak_rss = self._sample()
+
+    def _sample(self) -> int:
+        try:
+            return self._process.memory_info().rss
+        except psutil.Error:
+            return 0
+
+    def _run(self):
+        while not self._stopped.wait(self._interval):
+            self.peak_rss = max(self.peak_rss, self._sample())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stopped.set()
+        self._thread.join()
+        self.peak_rss = max(self.peak_rss, self._sample())
+
+
+@contextmanager
+def measure_operation(workflow_name: str, operation_name: str):
+    """Measure the enclosed block and yield the dict the metrics are written to.
+
+    The dict is filled in when the block exits, also when it raises.
+    """
+    process = psutil.Process()
+    metrics = {}
+    io_before = _io_counters(process)
+    rss = _RssSampler(process)
+    cpu_before = time.process_time()
+    started_at = time.monotonic()
+    status = "error"
+
+    try:
+        with rss:
+            yield metrics
+        status = "ok"
+    finally:
+        io_after = _io_counters(process)
+        metrics.update(
+            status=status,
+            wall_seconds=round(time.monotonic() - started_at, 3),
+            cpu_seconds=round(time.process_time() - cpu_before, 3),
+            peak_rss_bytes=rss.peak_rss,
+            peak_rss_delta_bytes=max(0, rss.peak_rss - rss.start_rss),
+            read_bytes=io_after[0] - io_before[0] if io_after and io_before else None,
+            write_bytes=io_after[1] - io_before[1] if io_after and io_before else None,
+        )
+
+        logger.info(
+            "Workflow operation %s.%s finished in %.3fs (%s).",
+            workflow_name,
+            operation_name,
+            metrics["wall_seconds"],
+            status,
+            extra={
+                "event": "workflow.operation",
+                "workflow": workflow_name,
+                "operation": operation_name,
+                **metrics,
+            },
+        )
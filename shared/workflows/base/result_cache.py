@@ -0,0 +1,43 @@
+"""Redis-backed store for memoized operation results (see Operation.run)."""
+
+import json
+import logging
+
+import redis
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+_redis = redis.from_url(
+    settings.CACHES["default"]["LOCATION"],
+    decode_responses=True,
+)
+
+RESULT_KEY_PREFIX = "workflow:result"
+
+
+def _result_key(cache_key: str) -> str:
+    return f"{RESULT_KEY_PREFIX}:{cache_key}"
+
+
+def get_cached_result(cache_key: str):
+    try:
+        raw = _redis.get(_result_key(cache_key))
+        return json.loads(raw) if raw else None
+    except Exception:
+        logger.exception("get_cached_result failed.")
+        return None
+
+
+def set_cached_result(cache_key: str, entry: dict, ttl: int) -> None:
+    try:
+        _redis.setex(_result_key(cache_key), ttl, json.dumps(entry))
+    except Exception:
+        logger.exception("set_cached_result failed.")
+
+
+def delete_cached_result(cache_key: str) -> None:
+    try:
+        _redis.delete(_result_key(cache_key))
+    except Exception:
+        logger.exception("delete_cached_result failed.")
@@ -4,6 +4,7 @@ from pathlib import Path
 import requests
 
 from shared.infrastructure import InfraManager
+from shared.infrastructure.storage import object_disk_cache
 from shared.utils import URIType, parse_uri
 
 from ...schemas import StrictPayload
@@ -13,11 +14,19 @@ from ..base.base_operation import Operation
 class DownloadPayload(StrictPayload):
     download_url: str
     download_to_path: str | None = None
+    # Ranged parallel download tuning for object storage (storage defaults if unset).
+    part_size: int | None = None
+    max_concurrency: int | None = None
+    # Serve S3 downloads from the worker-local object cache.
+    use_cache: bool = True
 
 
 class Download(Operation[DownloadPayload, object]):
     name = "download"
 
+    def checkpoint_valid(self, output):
+        return isinstance(output, str) and Path(output).exists()
+
     def execute(self, *args, **kwargs):
         download_url = self.payload.download_url
         download_to_path = self.payload.download_to_path
@@ -46,6 +55,33 @@ class Download(Operation[DownloadPayload, object]):
             key = components.get("key")
             if not isinstance(bucket, str) or not isinstance(key, str):
                 raise ValueError(f"Invalid S3 URL: {download_url}")
+            use_cache = self.payload.use_cache and object_disk_cache.enabled
+
+            if download_to_path and use_cache:
+                result = object_disk_cache.materialize(
+                    InfraManager.object_storage,
+                    key=key,
+                    path=download_to_path,
+                    bucket=bucket,
+                    part_size=self.payload.part_size,
+                    max_concurrency=self.payload.max_concurrency,
+                )
+                self.ctx.setdefault("transfer_metrics", []).append(
+                    {"operation": self.name, **result}
+                )
+                return result["path"]
+            if download_to_path:
+                result = InfraManager.object_storage.download_file(
+                    key=key,
+                    path=download_to_path,
+                    bucket=bucket,
+                    part_size=self.payload.part_size,
+                    max_concurrency=self.payload.max_concurrency,
+                )
+                self.ctx.setdefault("transfer_metrics", []).append(
+                    {"operation": self.name, **result}
+                )
+                return result["path"]
             fileobj = InfraManager.object_storage.download_object(
                 key=key, bucket=bucket
             )
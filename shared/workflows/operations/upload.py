@@ -11,6 +11,9 @@ class UploadPayload(StrictPayload):
     upload_url: str
     upload_from_path: str | None = None
     metadata: dict[str, str] | None = None
+    # Parallel multipart upload tuning for object storage (storage defaults if unset).
+    part_size: int | None = None
+    max_concurrency: int | None = None
 
 
 class Upload(Operation[UploadPayload, object]):
@@ -39,13 +42,31 @@ class Upload(Operation[UploadPayload, object]):
             key = components.get("key")
             if not bucket or not key:
                 raise ValueError(f"Invalid S3 URL: {upload_url}")
-            with open(src, "rb") as fh:
-                return InfraManager.object_storage.upload_object(
-                    file=fh,
+            cached = self.ctx.get("cached_artifacts", {}).get(upload_from_path)
+
+            if cached is not None:
+                # The file was restored from a stored artifact: copy it
+                # server-side instead of sending the same bytes again.
+                result = InfraManager.object_storage.copy_object(
+                    source_key=cached["key"],
+                    key=key,
+                    source_bucket=cached["bucket"],
+                    bucket=bucket,
+                )
+            else:
+                result = InfraManager.object_storage.upload_file(
+                    path=str(src),
                     key=key,
                     bucket=bucket,
                     metadata=metadata,
+                    part_size=self.payload.part_size,
+                    max_concurrency=self.payload.max_concurrency,
                 )
+            self.ctx.setdefault("transfer_metrics", []).append(
+                {"operation": self.name, **result}
+            )
+            self._store_pending_cache_entry(upload_from_path, result)
+            return result
 
         if uri_type == URIType.LOCAL:
             dst = Path(upload_url).expanduser()
@@ -66,3 +87,23 @@ class Upload(Operation[UploadPayload, object]):
             )
 
         raise ValueError(f"Unsupported or unknown upload URL type: {upload_url}")
+
+    def _store_pending_cache_entry(self, upload_from_path: str, result: dict):
+        """Cache an upstream op's result as the object this upload just wrote.
+
+        Cacheable ops that leave their output for this operation to upload put
+        their cache key under ctx["pending_artifact_cache"] instead of storing
+        a copy of the file themselves.
+        """
+        from ..base.result_cache import set_cached_result
+
+        pending = self.ctx.get("pending_artifact_cache", {}).pop(upload_from_path, None)
+
+        if pending is None:
+            return
+
+        set_cached_result(
+            pending["cache_key"],
+            {"artifact": {key: result[key] for key in ("bucket", "key", "etag")}},
+            pending["ttl"],
+        )
@@ -56,6 +56,8 @@ class ProcessingTool(TextChoices):
     CONTOUR = "contour"
     CLIP_RASTER = "clip_raster"
     RASTER_CALCULATOR = "raster_calculator"
+    ZONAL_STATS = "zonal_stats"
+    REPROJECT_RASTER = "reproject_raster"
 
     # Vector tools.
     BUFFER = "buffer"
@@ -64,6 +66,8 @@ class ProcessingTool(TextChoices):
     CENTROID = "centroid"
     SIMPLIFY = "simplify"
     CONVEX_HULL = "convex_hull"
+    SPATIAL_JOIN = "spatial_join"
+    NEAREST = "nearest"
 
 
 class ProcessingToolCategory(TextChoices):
@@ -1,9 +1,13 @@
 from dataclasses import dataclass
 
+import numpy as np
+import rasterio
 from pyproj import CRS
 from rio_tiler.io import Reader
 from rio_tiler.types import BBox
 
+from shared.infrastructure import InfraManager
+
 from .constants import FileFormat
 
 
@@ -46,6 +50,68 @@ def get_raster_info(path: str) -> RasterInfo:
         )
 
 
+# Longest side of the overview read for band statistics, and histogram bin count.
+BAND_STATS_MAX_SIZE = 1024
+BAND_STATS_BINS = 64
+
+
+def compute_band_stats(path: str) -> list[dict]:
+    """Per-band min/max/mean/std, 2nd/98th percentiles and histogram of a raster.
+
+    The bands are read decimated to at most BAND_STATS_MAX_SIZE pixels a side,
+    which GDAL serves from the overviews of a COG instead of the full image.
+    """
+    with rasterio.open(path) as src:
+        scale = min(1.0, BAND_STATS_MAX_SIZE / max(src.width, src.height))
+        out_shape = (
+            src.count,
+            max(1, round(src.height * scale)),
+            max(1, round(src.width * scale)),
+        )
+        data = src.read(out_shape=out_shape, masked=True)
+        dtypes = src.dtypes
+
+    band_stats = []
+
+    for index, band in enumerate(data):
+        values = band.compressed().astype("float64")
+        values = values[np.isfinite(values)]
+
+        if values.size == 0:
+            band_stats.append({"band": index + 1, "dtype": dtypes[index]})
+            continue
+
+        v_min, v_max = float(values.min()), float(values.max())
+        p2, p98 = np.percentile(values, [2, 98])
+        counts, edges = np.histogram(
+            values, bins=BAND_STATS_BINS, range=(v_min, max(v_max, v_min + 1e-9))
+        )
+
+        band_stats.append(
+            {
+                "band": index + 1,
+                "dtype": dtypes[index],
+                "min": v_min,
+                "max": v_max,
+                "mean": float(values.mean()),
+                "std": float(values.std()),
+                "p2": float(p2),
+                "p98": float(p98),
+                "histogram": {
+                    "counts": counts.tolist(),
+                    "edges": edges.tolist(),
+                },
+            }
+        )
+
+    return band_stats
+
+
+def object_storage_rio_env() -> rasterio.Env:
+    """rasterio environment that lets GDAL read object storage /vsis3/ paths."""
+    return rasterio.Env(**InfraManager.object_storage.get_gdal_config())
+
+
 def format_to_ext(format: str):
     mapping = {
         FileFormat.GEOPACKAGE.value: "gpkg",
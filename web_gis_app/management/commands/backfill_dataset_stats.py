@@ -0,0 +1,61 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Q
+
+from web_gis_app.constants import DatasetType
+from web_gis_app.models import Dataset
+from web_gis_app.services import DatasetStatsService
+
+# Advisory lock held while backfilling, so only one of the pods starting after a
+# deploy does the work.
+BACKFILL_LOCK_ID = 0x57A75
+
+
+class Command(BaseCommand):
+    help = (
+        "Compute the stats of vector datasets that have none, so layer lists do "
+        "not compute them on first read. Safe to run on every start."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--stale",
+            action="store_true",
+            help="Also recompute stats marked stale.",
+        )
+
+    def handle(self, *args, **options):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_try_advisory_lock(%s)", [BACKFILL_LOCK_ID])
+
+            if not cursor.fetchone()[0]:
+                self.stdout.write("Another process is backfilling dataset stats.")
+                return
+
+            try:
+                count = self._backfill(options["stale"])
+            finally:
+                cursor.execute("SELECT pg_advisory_unlock(%s)", [BACKFILL_LOCK_ID])
+
+        self.stdout.write(f"Computed stats of {count} datasets.")
+
+    def _backfill(self, include_stale: bool) -> int:
+        missing = Q(stats__isnull=True)
+
+        if include_stale:
+            missing |= Q(stats__is_stale=True)
+
+        dataset_ids = (
+            Dataset.objects.filter(missing, type=DatasetType.VECTOR)
+            .order_by("created_at")
+            .values_list("pk", flat=True)
+        )
+        count = 0
+
+        # Each dataset is committed on its own, so an interrupted run resumes
+        # where it stopped.
+        for dataset_id in dataset_ids.iterator():
+            DatasetStatsService.refresh(dataset_id=dataset_id)
+            count += 1
+
+        return count
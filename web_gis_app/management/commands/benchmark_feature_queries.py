@@ -0,0 +1,85 @@
+import json
+
+import mercantile
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from web_gis_app.models import Dataset
+from web_gis_app.services import DatasetStatsService
+from web_gis_app.views.vector_tile_view import build_vector_tile_sql
+
+# Per-dataset query of the vector operations (see ClipVectorOp, DissolveOp).
+OPERATION_SQL = """
+    SELECT ST_Union(geometry) FROM feature WHERE dataset_id = %s
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "EXPLAIN ANALYZE the vector tile and operation queries of a dataset. "
+        "Run before and after repack_features/partition_features to compare."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("dataset_id")
+        parser.add_argument(
+            "--zoom",
+            type=int,
+            default=14,
+            help="Zoom of the tile benchmarked, taken at the dataset's centre.",
+        )
+        parser.add_argument(
+            "--verbose-plans",
+            action="store_true",
+            help="Print the full query plans, not only the summary.",
+        )
+
+    def handle(self, *args, **options):
+        dataset = Dataset.objects.filter(pk=options["dataset_id"]).first()
+
+        if dataset is None:
+            raise CommandError(f"Dataset {options['dataset_id']} not found.")
+
+        stats = DatasetStatsService.get_fresh_stats(dataset=dataset)
+
+        if stats is None or stats.extent is None:
+            raise CommandError("Dataset has no features to benchmark.")
+
+        min_lng, min_lat, max_lng, max_lat = stats.extent
+        tile = mercantile.tile(
+            (min_lng + max_lng) / 2, (min_lat + max_lat) / 2, options["zoom"]
+        )
+        queries = {
+            f"tile {tile.z}/{tile.x}/{tile.y}": build_vector_tile_sql(
+                tile.z, tile.x, tile.y
+            ),
+            "operation (ST_Union)": OPERATION_SQL,
+        }
+
+        self.stdout.write(f"Dataset {dataset.pk}: {stats.feature_count} features.")
+
+        for label, sql in queries.items():
+            plan = self._explain(sql, str(dataset.pk))
+            root = plan["Plan"]
+            self.stdout.write(
+                f"{label}: planning {plan['Planning Time']:.1f} ms, "
+                f"execution {plan['Execution Time']:.1f} ms, "
+                f"buffers hit {root.get('Shared Hit Blocks', 0)}, "
+                f"read {root.get('Shared Read Blocks', 0)}"
+            )
+
+            if options["verbose_plans"]:
+                self.stdout.write(json.dumps(plan, indent=2))
+
+    @staticmethod
+    def _explain(sql: str, dataset_id: str) -> dict:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}", [dataset_id]
+            )
+            plan = cursor.fetchone()[0]
+
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        return plan[0]
@@ -0,0 +1,100 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+TABLE = "feature"
+OLD_TABLE = "feature_unpartitioned"
+
+
+class Command(BaseCommand):
+    help = (
+        "Convert the feature table to hash partitioning by dataset_id. Copies "
+        "every row under an exclusive lock: run it in a maintenance window."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--partitions", type=int, default=32)
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Print the statements instead of running them.",
+        )
+
+    def handle(self, *args, **options):
+        partitions = options["partitions"]
+
+        if partitions < 2:
+            raise CommandError("--partitions must be at least 2.")
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass",
+                [TABLE],
+            )
+
+            if cursor.fetchone():
+                raise CommandError(f"{TABLE} is already partitioned.")
+
+            statements = self._statements(cursor, partitions)
+
+            if options["dry_run"]:
+                self.stdout.write(";\n".join(statements) + ";")
+                transaction.set_rollback(True)
+                return
+
+            for statement in statements:
+                cursor.execute(statement)
+
+        self.stdout.write(f"Partitioned {TABLE} into {partitions} partitions.")
+
+    @staticmethod
+    def _statements(cursor, partitions: int) -> list[str]:
+        # Indexes and constraints are recreated under their Django names so
+        # later migrations keep finding them.
+        cursor.execute(
+            """
+            SELECT indexname, indexdef FROM pg_indexes
+            WHERE tablename = %s AND indexname <> %s
+            """,
+            [TABLE, f"{TABLE}_pkey"],
+        )
+        indexes = cursor.fetchall()
+        cursor.execute(
+            """
+            SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint
+            WHERE conrelid = %s::regclass AND contype IN ('f', 'c')
+            """,
+            [TABLE],
+        )
+        constraints = cursor.fetchall()
+
+        statements = [
+            f"LOCK TABLE {TABLE} IN ACCESS EXCLUSIVE MODE",
+            f"ALTER TABLE {TABLE} RENAME TO {OLD_TABLE}",
+            f"ALTER TABLE {OLD_TABLE} DROP CONSTRAINT {TABLE}_pkey",
+            *(f"DROP INDEX {name}" for name, _ in indexes),
+            *(
+                f"ALTER TABLE {OLD_TABLE} DROP CONSTRAINT {name}"
+                for name, _ in constraints
+            ),
+            f"CREATE TABLE {TABLE} (LIKE {OLD_TABLE} INCLUDING DEFAULTS "
+            f"INCLUDING STORAGE) PARTITION BY HASH (dataset_id)",
+            *(
+                f"CREATE TABLE {TABLE}_p{remainder} PARTITION OF {TABLE} "
+                f"FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})"
+                for remainder in range(partitions)
+            ),
+            # Load before indexing; each partition is filled in dataset order.
+            f"INSERT INTO {TABLE} SELECT * FROM {OLD_TABLE} ORDER BY dataset_id",
+            # The partition key has to be part of the primary key.
+            f"ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_pkey "
+            f"PRIMARY KEY (id, dataset_id)",
+            *(definition for _, definition in indexes),
+            *(
+                f"ALTER TABLE {TABLE} ADD CONSTRAINT {name} {definition}"
+                for name, definition in constraints
+            ),
+            f"DROP TABLE {OLD_TABLE}",
+            f"ANALYZE {TABLE}",
+        ]
+
+        return statements
@@ -0,0 +1,67 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+# Spatial sort key: geohash of the bounding box centre keeps nearby features
+# of a dataset on adjacent heap pages.
+SORT_KEY = (
+    "CASE WHEN ST_IsEmpty(geometry) THEN NULL "
+    "ELSE ST_GeoHash(ST_Centroid(ST_Envelope(geometry)), 12) END"
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Rewrite features in geohash order so a dataset's rows sit on adjacent "
+        "pages. Run after bulk ingestion."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dataset",
+            action="append",
+            default=[],
+            help="Dataset to repack; repeat for several datasets.",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help=(
+                "CLUSTER the whole table on its (dataset_id, geometry) index. "
+                "Takes an exclusive lock for the duration."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        if not options["dataset"] and not options["all"]:
+            raise CommandError("Pass --dataset <id> or --all.")
+
+        with connection.cursor() as cursor:
+            if options["all"]:
+                cursor.execute("CLUSTER feature USING feature_dataset_geom_gist")
+                self.stdout.write("Clustered the feature table.")
+
+            for dataset_id in options["dataset"]:
+                count = self._repack_dataset(cursor, dataset_id)
+                self.stdout.write(f"Repacked {count} features of dataset {dataset_id}.")
+
+            cursor.execute("ANALYZE feature")
+
+    @staticmethod
+    def _repack_dataset(cursor, dataset_id) -> int:
+        """Delete and re-insert a dataset's rows in spatial order."""
+        with transaction.atomic():
+            cursor.execute(
+                """
+                CREATE TEMP TABLE feature_repack ON COMMIT DROP AS
+                SELECT * FROM feature
+                WHERE dataset_id = %s
+                """,
+                [dataset_id],
+            )
+            cursor.execute("DELETE FROM feature WHERE dataset_id = %s", [dataset_id])
+            # The INSERT's own ORDER BY sets the order rows are written in.
+            cursor.execute(
+                f"INSERT INTO feature SELECT * FROM feature_repack ORDER BY {SORT_KEY}"
+            )
+
+            return cursor.rowcount
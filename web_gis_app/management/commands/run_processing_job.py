@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from web_gis_app.constants import ProcessingJobStatus
+from web_gis_app.models import ProcessingJob
+from web_gis_app.tasks import execute_processing_job
+
+
+class Command(BaseCommand):
+    help = "Run a ProcessingJob in this process (entrypoint of batch Jobs)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("job_id")
+
+    def handle(self, *args, **options):
+        job = (
+            ProcessingJob.objects.select_related("user")
+            .filter(pk=options["job_id"])
+            .first()
+        )
+
+        if job is None:
+            raise CommandError(f"ProcessingJob {options['job_id']} not found.")
+
+        execute_processing_job(job)
+        job.refresh_from_db(fields=["status"])
+
+        # A non-zero exit marks the batch Job as failed.
+        if job.status != ProcessingJobStatus.COMPLETED:
+            raise CommandError(f"ProcessingJob {job.pk} ended as {job.status}.")
@@ -0,0 +1,22 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("web_gis_app", "0013_alter_processingjob_id_alter_processingjob_user"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="processingjob",
+            name="metrics",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                help_text="Per-operation timing, memory and I/O measurements.",
+            ),
+        ),
+    ]
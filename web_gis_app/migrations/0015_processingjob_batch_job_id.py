@@ -0,0 +1,23 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("web_gis_app", "0014_processingjob_metrics"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="processingjob",
+            name="batch_job_id",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="Batch compute job running this job, if it was dispatched to one.",
+                max_length=255,
+            ),
+        ),
+    ]
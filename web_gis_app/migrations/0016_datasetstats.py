@@ -0,0 +1,80 @@
+# Generated by Django 6.0.1 on 2026-10-19 12:00
+
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("web_gis_app", "0015_processingjob_batch_job_id"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DatasetStats",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, primary_key=True, serialize=False
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "feature_count",
+                    models.BigIntegerField(
+                        default=0, help_text="Number of features in the dataset."
+                    ),
+                ),
+                (
+                    "extent",
+                    models.JSONField(
+                        blank=True,
+                        help_text="Extent [minLng, minLat, maxLng, maxLat] in EPSG:4326, null if empty.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "geometry_types",
+                    models.JSONField(
+                        blank=True,
+                        default=dict,
+                        help_text="Number of features per geometry type, e.g. {'Polygon': 12}.",
+                    ),
+                ),
+                (
+                    "property_schema",
+                    models.JSONField(
+                        blank=True,
+                        default=dict,
+                        help_text="JSON type of each feature property, e.g. {'name': 'string'}.",
+                    ),
+                ),
+                (
+                    "is_stale",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Set when features changed in a way that needs a full recompute.",
+                    ),
+                ),
+                (
+                    "dataset",
+                    models.OneToOneField(
+                        help_text="Dataset these statistics describe.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stats",
+                        to="web_gis_app.dataset",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Dataset statistics",
+                "verbose_name_plural": "Dataset statistics",
+                "db_table": "dataset_stats",
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.1 on 2026-10-19 12:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("web_gis_app", "0016_datasetstats"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="feature",
+            name="feature_dataset_ffe856_idx",
+        ),
+        migrations.AddIndex(
+            model_name="feature",
+            index=models.Index(
+                fields=["dataset", "id"], name="feature_dataset_c04bc2_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.0.1 on 2026-10-19 13:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("web_gis_app", "0017_feature_dataset_id_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dataset",
+            name="version",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="Incremented on every feature edit; keys downstream caches",
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 6.0.1 on 2026-10-19 13:30
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently, BtreeGistExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # The index is built concurrently so the feature table stays writable.
+    atomic = False
+
+    dependencies = [
+        ("web_gis_app", "0018_dataset_version"),
+    ]
+
+    operations = [
+        BtreeGistExtension(),
+        AddIndexConcurrently(
+            model_name="feature",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["dataset", "geometry"], name="feature_dataset_geom_gist"
+            ),
+        ),
+    ]
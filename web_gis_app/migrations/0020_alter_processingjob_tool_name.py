@@ -0,0 +1,35 @@
+# Generated by Django 6.0.1 on 2026-10-19 15:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("web_gis_app", "0019_feature_dataset_geom_gist"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="processingjob",
+            name="tool_name",
+            field=models.CharField(
+                choices=[
+                    ("hillshade", "Hillshade"),
+                    ("slope", "Slope"),
+                    ("contour", "Contour"),
+                    ("clip_raster", "Clip Raster"),
+                    ("raster_calculator", "Raster Calculator"),
+                    ("zonal_stats", "Zonal Stats"),
+                    ("buffer", "Buffer"),
+                    ("clip_vector", "Clip Vector"),
+                    ("dissolve", "Dissolve"),
+                    ("centroid", "Centroid"),
+                    ("simplify", "Simplify"),
+                    ("convex_hull", "Convex Hull"),
+                ],
+                help_text="Which processing tool is being run.",
+                max_length=50,
+            ),
+        ),
+    ]
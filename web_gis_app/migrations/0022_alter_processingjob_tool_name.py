@@ -0,0 +1,38 @@
+# Generated by Django 6.0.1 on 2026-10-19 19:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("web_gis_app", "0021_alter_processingjob_tool_name"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="processingjob",
+            name="tool_name",
+            field=models.CharField(
+                choices=[
+                    ("hillshade", "Hillshade"),
+                    ("slope", "Slope"),
+                    ("contour", "Contour"),
+                    ("clip_raster", "Clip Raster"),
+                    ("raster_calculator", "Raster Calculator"),
+                    ("zonal_stats", "Zonal Stats"),
+                    ("reproject_raster", "Reproject Raster"),
+                    ("buffer", "Buffer"),
+                    ("clip_vector", "Clip Vector"),
+                    ("dissolve", "Dissolve"),
+                    ("centroid", "Centroid"),
+                    ("simplify", "Simplify"),
+                    ("convex_hull", "Convex Hull"),
+                    ("spatial_join", "Spatial Join"),
+                    ("nearest", "Nearest"),
+                ],
+                help_text="Which processing tool is being run.",
+                max_length=50,
+            ),
+        ),
+    ]
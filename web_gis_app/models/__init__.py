@@ -1,4 +1,5 @@
 from .dataset_models import *
+from .dataset_stats_models import *
 from .feature_models import *
 from .layer_models import *
 from .processing_job_models import *
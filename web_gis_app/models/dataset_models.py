@@ -19,6 +19,46 @@ class DatasetNodeQuerySet(models.QuerySet["DatasetNode"]):
     def descendants_with_dataset(self, node: DatasetNode) -> DatasetNodeQuerySet:
         return self.descendants_of(node).with_dataset()
 
+    def tree_of(
+        self,
+        user,
+        parent: DatasetNode | None = None,
+        depth: int | None = None,
+    ) -> DatasetNodeQuerySet:
+        """
+        A user's nodes below `parent` (or from the roots) in a single query.
+
+        `depth` limits how many levels are returned: 1 is the direct children
+        of `parent`, or only the roots. Nodes come with their dataset and
+        tileset, and `has_children` tells whether unloaded children exist.
+        """
+        # One closure row per node: the one to `parent`, or to the node's root.
+        if parent is None:
+            closure_filter = {
+                "descendant_closures__ancestor__parent__isnull": True,
+            }
+            min_depth = 0
+        else:
+            closure_filter = {
+                "descendant_closures__ancestor": parent,
+                "descendant_closures__depth__gte": 1,
+            }
+            min_depth = 1
+
+        if depth is not None:
+            closure_filter["descendant_closures__depth__lt"] = min_depth + depth
+
+        return (
+            self.filter(user=user, **closure_filter)
+            .select_related("dataset", "dataset__tileset")
+            .annotate(
+                has_children=models.Exists(
+                    DatasetNode.objects.filter(parent=models.OuterRef("pk"))
+                )
+            )
+            .order_by("name")
+        )
+
 
 class DatasetNodeManager(models.Manager.from_queryset(DatasetNodeQuerySet)):
     def get_queryset(self) -> DatasetNodeQuerySet:
@@ -33,6 +73,14 @@ class DatasetNodeManager(models.Manager.from_queryset(DatasetNodeQuerySet)):
     def descendants_with_dataset(self, node: DatasetNode) -> DatasetNodeQuerySet:
         return self.get_queryset().descendants_with_dataset(node)
 
+    def tree_of(
+        self,
+        user,
+        parent: DatasetNode | None = None,
+        depth: int | None = None,
+    ) -> DatasetNodeQuerySet:
+        return self.get_queryset().tree_of(user, parent=parent, depth=depth)
+
 
 class DatasetNode(BaseModel):
     objects: DatasetNodeManager = DatasetNodeManager()
@@ -55,6 +103,16 @@ class DatasetNode(BaseModel):
     if TYPE_CHECKING:
         dataset: "Dataset"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Parent as stored in the database, so moves are detected without a
+        # SELECT before every save.
+        if "parent_id" in instance.__dict__:
+            instance._loaded_parent_id = instance.parent_id
+
+        return instance
+
 
 class DatasetClosure(BaseModelWithoutUser):
     ancestor = models.ForeignKey(
@@ -113,6 +171,11 @@ class Dataset(BaseModelWithoutUser):
         help_text="Upload status of the dataset file",
     )
 
+    version = models.PositiveIntegerField(
+        default=0,
+        help_text="Incremented on every feature edit; keys downstream caches",
+    )
+
     class Meta:
         db_table = "dataset"
         verbose_name = "Dataset"
@@ -0,0 +1,55 @@
+"""Materialized spatial statistics of a vector dataset's features."""
+
+from django.db import models
+
+from shared.models.base_models import BaseModelWithoutUser
+
+from .dataset_models import Dataset
+
+
+class DatasetStats(BaseModelWithoutUser):
+    """Extent, feature count, geometry types and property schema of a dataset.
+
+    Computed by the ingest and processing paths, extended on feature inserts and
+    marked stale on feature updates/deletes; stale stats are recomputed on read.
+    """
+
+    dataset = models.OneToOneField(
+        Dataset,
+        on_delete=models.CASCADE,
+        related_name="stats",
+        help_text="Dataset these statistics describe.",
+    )
+
+    feature_count = models.BigIntegerField(
+        default=0,
+        help_text="Number of features in the dataset.",
+    )
+
+    extent = models.JSONField(
+        null=True,
+        blank=True,
+        help_text="Extent [minLng, minLat, maxLng, maxLat] in EPSG:4326, null if empty.",
+    )
+
+    geometry_types = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Number of features per geometry type, e.g. {'Polygon': 12}.",
+    )
+
+    property_schema = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="JSON type of each feature property, e.g. {'name': 'string'}.",
+    )
+
+    is_stale = models.BooleanField(
+        default=False,
+        help_text="Set when features changed in a way that needs a full recompute.",
+    )
+
+    class Meta:
+        db_table = "dataset_stats"
+        verbose_name = "Dataset statistics"
+        verbose_name_plural = "Dataset statistics"
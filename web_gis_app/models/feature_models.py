@@ -1,4 +1,5 @@
 from django.contrib.gis.db import models as gis_models
+from django.contrib.postgres.indexes import GistIndex
 from django.db import models
 
 from shared.models.base_models import BaseModelWithoutUser
@@ -30,5 +31,8 @@ class Feature(BaseModelWithoutUser):
         verbose_name = "Feature"
         verbose_name_plural = "Features"
         indexes = [
-            models.Index(fields=["dataset"]),
+            # Serves dataset lookups and keyset pagination on (dataset, id).
+            models.Index(fields=["dataset", "id"]),
+            # Spatial filters within one dataset (tiles, ops); needs btree_gist.
+            GistIndex(fields=["dataset", "geometry"], name="feature_dataset_geom_gist"),
         ]
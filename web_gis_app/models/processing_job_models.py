@@ -72,6 +72,19 @@ class ProcessingJob(BaseModel):
         help_text="Celery task id for revocation.",
     )
 
+    batch_job_id = models.CharField(
+        max_length=255,
+        blank=True,
+        default="",
+        help_text="Batch compute job running this job, if it was dispatched to one.",
+    )
+
+    metrics = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Per-operation timing, memory and I/O measurements.",
+    )
+
     started_at = models.DateTimeField(
         null=True,
         blank=True,
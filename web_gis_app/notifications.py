@@ -1,6 +1,7 @@
 from functools import partial
 
 from shared.constants import AppName
-from shared.notifications import send_notification
+from shared.notifications import publish_notification, send_notification
 
 send_notification = partial(send_notification, app_name=AppName.WEB_GIS)
+publish_notification = partial(publish_notification, app_name=AppName.WEB_GIS)
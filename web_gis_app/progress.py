@@ -1,39 +1,116 @@
 """Progress reporter for processing jobs.
 
-Publishes throttled progress updates via the existing SSE notification pipeline
-and keeps the ProcessingJob.progress field in sync with the stream.
+Progress ticks are ephemeral: they are published to the user's SSE stream in
+the same Notification envelope as terminal events and kept in a short-lived
+Redis hash, throttled in time, and never written to Postgres. A throttled tick
+is not lost: the latest one goes out once the interval has passed. Only terminal
+events (complete/failed) create a persistent Notification;
+ProcessingJob.progress is saved with the job's state transitions.
 """
 
 import json
+import logging
+import threading
+import time
 from typing import Optional
 
+import redis
+from django.conf import settings
 from django.contrib.auth.models import User
 
 from .models import ProcessingJob
-from .notifications import send_notification
+from .notifications import publish_notification, send_notification
 
-PROGRESS_STEP = 5
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between two progress ticks of one job (at most 2/s).
+PROGRESS_MIN_INTERVAL = 0.5
+# How long the live progress of a job is kept after its last tick.
+PROGRESS_TTL = 24 * 60 * 60
+
+_redis_client = redis.from_url(
+    settings.CACHES["default"]["LOCATION"],
+    decode_responses=True,
+)
+
+
+def _progress_key(job_id) -> str:
+    return f"processing_job:{job_id}:progress"
+
+
+def get_live_progress(job_id) -> Optional[int]:
+    """Latest reported progress of a running job, or None when unknown."""
+    try:
+        progress = _redis_client.hget(_progress_key(job_id), "progress")
+    except redis.RedisError:
+        return None
+
+    return int(progress) if progress is not None else None
 
 
 class ProgressReporter:
-    """Throttled progress reporter for a single ProcessingJob."""
+    """Time-throttled progress reporter for a single ProcessingJob."""
 
     def __init__(self, job: ProcessingJob, user: User):
         self._job = job
         self._user = user
-        self._last_reported = -PROGRESS_STEP
+        self._last_reported = None
+        self._last_reported_at = 0.0
+        # Latest tick held back by the throttle, sent by _flush_timer.
+        self._pending = None
+        self._flush_timer = None
+        # Operations of a DAG workflow report from several threads.
+        self._lock = threading.Lock()
 
     def report(self, progress: int, message: str = "") -> None:
-        """Report progress 0-100; updates throttled to every PROGRESS_STEP percent."""
+        """Report progress 0-100, at most one tick per PROGRESS_MIN_INTERVAL.
+
+        A tick within the interval is held back and sent when it ends, unless a
+        later tick replaces it first.
+        """
 
         progress = max(0, min(100, int(progress)))
 
-        if progress - self._last_reported < PROGRESS_STEP and progress != 100:
-            return
+        with self._lock:
+            if progress == self._last_reported:
+                self._pending = None
+                return
 
-        self._last_reported = progress
+            wait = self._last_reported_at + PROGRESS_MIN_INTERVAL - time.monotonic()
+
+            if wait > 0 and progress != 100:
+                self._pending = (progress, message)
+
+                if self._flush_timer is None:
+                    self._flush_timer = threading.Timer(wait, self.flush)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+
+                return
 
-        ProcessingJob.objects.filter(pk=self._job.pk).update(progress=progress)
+            self._cancel_flush()
+            self._publish(progress, message)
+
+    def flush(self) -> None:
+        """Send the tick held back by the throttle, if any."""
+
+        with self._lock:
+            pending = self._pending
+            self._cancel_flush()
+
+            if pending is not None:
+                self._publish(*pending)
+
+    def _cancel_flush(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        self._pending = None
+
+    def _publish(self, progress: int, message: str) -> None:
+        self._last_reported = progress
+        self._last_reported_at = time.monotonic()
 
         payload = {
             "type": "processing_progress",
@@ -42,12 +119,22 @@ class ProgressReporter:
             "progress": progress,
             "message": message,
         }
-        send_notification(content=json.dumps(payload), user=self._user)
+
+        # Progress is best effort; a Redis hiccup must not fail the job.
+        try:
+            key = _progress_key(self._job.pk)
+            pipeline = _redis_client.pipeline(transaction=False)
+            pipeline.hset(key, mapping={"progress": progress, "message": message})
+            pipeline.expire(key, PROGRESS_TTL)
+            pipeline.execute()
+            publish_notification(content=json.dumps(payload), user=self._user)
+        except redis.RedisError:
+            logger.warning("Could not publish progress of job %s.", self._job.pk)
 
     def complete(self, output_dataset_id: Optional[str] = None) -> None:
         """Publish terminal completion event."""
 
-        ProcessingJob.objects.filter(pk=self._job.pk).update(progress=100)
+        self.flush()
 
         payload = {
             "type": "processing_complete",
@@ -56,10 +143,13 @@ class ProgressReporter:
             "outputDatasetId": output_dataset_id,
         }
         send_notification(content=json.dumps(payload), user=self._user)
+        self._clear()
 
     def fail(self, error_message: str) -> None:
         """Publish terminal failure event."""
 
+        self.flush()
+
         payload = {
             "type": "processing_failed",
             "jobId": str(self._job.pk),
@@ -67,3 +157,10 @@ class ProgressReporter:
             "error": error_message,
         }
         send_notification(content=json.dumps(payload), user=self._user)
+        self._clear()
+
+    def _clear(self) -> None:
+        try:
+            _redis_client.delete(_progress_key(self._job.pk))
+        except redis.RedisError:
+            pass
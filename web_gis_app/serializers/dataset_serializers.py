@@ -89,24 +89,52 @@ class DatasetUploadSerializer(DatasetUploadBaseSerializer):
         return value
 
 
+class DatasetNodeTreeListSerializer(serializers.ListSerializer):
+    """Nests a flat list of nodes into trees in one pass over the nodes."""
+
+    def to_representation(self, data):
+        nodes = super().to_representation(data)
+        nodes_by_id = {str(node["id"]): node for node in nodes}
+        roots = []
+
+        for node in nodes:
+            parent = nodes_by_id.get(str(node["parent"]))
+
+            if parent is None:
+                roots.append(node)
+            else:
+                parent["children"].append(node)
+
+        return roots
+
+
 class DatasetNodeTreeSerializer(BaseModelSerializer):
-    """Serializer for nested tree structure with children"""
+    """Serializer for nested tree structure with children.
+
+    Expects nodes from DatasetNode.objects.tree_of(); children are nested by
+    the list serializer instead of being queried per node.
+    """
 
     children = serializers.SerializerMethodField()
     dataset = DatasetSerializer(read_only=True)
+    has_children = serializers.BooleanField(read_only=True)
 
     class Meta:
         model = DatasetNode
-        fields = ["id", "type", "name", "parent", "children", "dataset", "created_at"]
+        fields = [
+            "id",
+            "type",
+            "name",
+            "parent",
+            "children",
+            "has_children",
+            "dataset",
+            "created_at",
+        ]
+        list_serializer_class = DatasetNodeTreeListSerializer
 
     def get_children(self, obj):
-        """Get direct children of this node"""
-        children = (
-            DatasetNode.objects.filter(parent=obj)
-            .select_related("dataset")
-            .order_by("name")
-        )
-        return DatasetNodeTreeSerializer(children, many=True).data
+        return []
 
 
 class DatasetMultipartInitSerializer(DatasetUploadBaseSerializer):
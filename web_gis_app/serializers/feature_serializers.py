@@ -1,11 +1,16 @@
 import json
 
-from django.contrib.gis.geos import GEOSGeometry
+from django.contrib.gis.gdal import GDALException
+from django.contrib.gis.geos import GEOSException, GEOSGeometry
+from rest_framework import serializers
+from rest_framework.generics import get_object_or_404
 from rest_framework_gis.fields import GeometryField
 from rest_framework_gis.serializers import GeoFeatureModelSerializer
 
 from shared.serializers import BaseModelSerializer
 
+from ..constants import DatasetType
+from ..models import Dataset
 from ..models.feature_models import Feature
 
 
@@ -44,3 +49,132 @@ class FeatureSerializer(GeoFeatureModelSerializer, BaseModelSerializer):
                 pass
 
         return parsed_data
+
+
+FEATURE_BATCH_MAX_EDITS = 10000
+
+
+class FeatureBatchEditSerializer(serializers.Serializer):
+    """
+    Validate a batch of feature edits for one dataset.
+
+    Each edit is {"op": "insert", "ref": <client id>, "geometry", "properties"},
+    {"op": "update", "id", "geometry"?, "properties"?} or {"op": "delete", "id"}.
+    Geometries are parsed and checked in one pass; validated_data holds the
+    request user's dataset and the inserts, updates and deletes ready to be
+    applied. Errors are keyed by the index of the offending edit.
+    """
+
+    dataset = serializers.UUIDField()
+    edits = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False,
+        max_length=FEATURE_BATCH_MAX_EDITS,
+    )
+
+    def validate_edits(self, edits):
+        inserts, updates, deletes, errors = [], {}, set(), {}
+        refs = set()
+        uuid_field = serializers.UUIDField()
+
+        for index, edit in enumerate(edits):
+            op = edit.get("op")
+
+            try:
+                if op == "insert":
+                    ref = str(edit.get("ref", index))
+
+                    if ref in refs:
+                        raise serializers.ValidationError(f"Duplicate ref {ref}.")
+
+                    refs.add(ref)
+                    inserts.append(
+                        {
+                            "ref": ref,
+                            "geometry": self._parse_geometry(edit.get("geometry")),
+                            "properties": self._parse_properties(
+                                edit.get("properties", {})
+                            ),
+                        }
+                    )
+                elif op == "update":
+                    update = {}
+
+                    if "geometry" in edit:
+                        update["geometry"] = self._parse_geometry(edit["geometry"])
+
+                    if "properties" in edit:
+                        update["properties"] = self._parse_properties(
+                            edit["properties"]
+                        )
+
+                    updates[uuid_field.to_internal_value(edit.get("id"))] = update
+                elif op == "delete":
+                    deletes.add(uuid_field.to_internal_value(edit.get("id")))
+                else:
+                    raise serializers.ValidationError(
+                        "op must be insert, update or delete."
+                    )
+            except serializers.ValidationError as e:
+                errors[index] = e.detail
+
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        return {"inserts": inserts, "updates": updates, "deletes": deletes}
+
+    def validate(self, attrs):
+        attrs["dataset"] = dataset = get_object_or_404(
+            Dataset.objects.filter(dataset_node__user=self.context["request"].user),
+            pk=attrs["dataset"],
+        )
+
+        if dataset.type != DatasetType.VECTOR:
+            raise serializers.ValidationError(
+                {"dataset": [f"Dataset {dataset.pk} is not a vector dataset."]}
+            )
+
+        edited_ids = attrs["edits"]["updates"].keys() | attrs["edits"]["deletes"]
+        existing = set(
+            Feature.objects.filter(dataset=dataset, id__in=edited_ids).values_list(
+                "id", flat=True
+            )
+        )
+        missing = edited_ids - existing
+
+        if missing:
+            uuid_field = serializers.UUIDField()
+            raise serializers.ValidationError(
+                {
+                    "edits": {
+                        index: [f"Feature {edit['id']} is not in this dataset."]
+                        for index, edit in enumerate(self.initial_data["edits"])
+                        if edit.get("op") in ("update", "delete")
+                        and uuid_field.to_internal_value(edit["id"]) in missing
+                    }
+                }
+            )
+
+        return attrs
+
+    @staticmethod
+    def _parse_geometry(geometry):
+        if not isinstance(geometry, dict):
+            raise serializers.ValidationError("geometry must be a GeoJSON object.")
+
+        try:
+            geom = GEOSGeometry(json.dumps(geometry), srid=4326)
+        except (GDALException, GEOSException, ValueError) as e:
+            raise serializers.ValidationError(f"Invalid geometry: {e}")
+
+        if not geom.valid:
+            raise serializers.ValidationError(f"Invalid geometry: {geom.valid_reason}")
+
+        return geom
+
+    @staticmethod
+    def _parse_properties(properties):
+        if not isinstance(properties, dict):
+            raise serializers.ValidationError("properties must be an object.")
+
+        return properties
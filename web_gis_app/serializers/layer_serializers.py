@@ -1,9 +1,9 @@
-from django.db import connection
 from rest_framework import serializers
 
 from shared.serializers import BaseModelSerializer
 
 from ..models import Layer
+from ..services import DatasetStatsService
 from .tileset_serializers import TileSetSerializer
 
 
@@ -13,6 +13,7 @@ class LayerSerializer(BaseModelSerializer):
     raster_kind = serializers.SerializerMethodField()
     band_count = serializers.SerializerMethodField()
     tileset = serializers.SerializerMethodField()
+    stats = serializers.SerializerMethodField()
 
     class Meta:
         model = Layer
@@ -26,8 +27,17 @@ class LayerSerializer(BaseModelSerializer):
             "raster_kind",
             "band_count",
             "tileset",
+            "stats",
+        )
+        read_only_fields = (
+            "id",
+            "bbox",
+            "dataset_type",
+            "raster_kind",
+            "band_count",
+            "tileset",
+            "stats",
         )
-        read_only_fields = ("id", "bbox", "dataset_type", "raster_kind", "band_count", "tileset")
 
     def get_bbox(self, obj):
         """
@@ -52,30 +62,26 @@ class LayerSerializer(BaseModelSerializer):
 
             return None
 
-        # Vector: compute from PostGIS ST_Extent so it works even without stored metadata.
-        try:
-            with connection.cursor() as cursor:
-                cursor.execute(
-                    """
-                    SELECT
-                        ST_XMin(extent), ST_YMin(extent),
-                        ST_XMax(extent), ST_YMax(extent)
-                    FROM (
-                        SELECT ST_Extent(ST_Transform(geometry, 4326)) AS extent
-                        FROM feature
-                        WHERE dataset_id = %s
-                    ) sub
-                    """,
-                    [str(obj.source_id)],
-                )
-                row = cursor.fetchone()
-
-            if row and row[0] is not None:
-                return [row[0], row[1], row[2], row[3]]
-        except Exception:
-            pass
+        # Vector: read the extent materialized in the dataset's stats.
+        stats = DatasetStatsService.get_fresh_stats(dataset=obj.source)
 
-        return None
+        return stats.extent if stats else None
+
+    def get_stats(self, obj):
+        """Feature count, geometry types and property schema of vector sources."""
+        if not obj.source:
+            return None
+
+        stats = DatasetStatsService.get_fresh_stats(dataset=obj.source)
+
+        if stats is None:
+            return None
+
+        return {
+            "feature_count": stats.feature_count,
+            "geometry_types": stats.geometry_types,
+            "property_schema": stats.property_schema,
+        }
 
     def get_dataset_type(self, obj):
         """Get the type of the source dataset (vector, raster, text)."""
@@ -7,8 +7,9 @@ from rest_framework import serializers
 
 from shared.serializers import BaseModelSerializer
 
-from ..constants import ProcessingTool
+from ..constants import ProcessingJobStatus, ProcessingTool
 from ..models import Dataset, DatasetNode, ProcessingJob
+from ..progress import get_live_progress
 from ..tool_registry import get_tool
 
 # Tools that require a single-band elevation raster (DEM).
@@ -23,6 +24,7 @@ class ProcessingJobSerializer(BaseModelSerializer):
     """Read serializer for ProcessingJob."""
 
     input_dataset_ids = serializers.SerializerMethodField()
+    progress = serializers.SerializerMethodField()
 
     class Meta:
         model = ProcessingJob
@@ -36,6 +38,7 @@ class ProcessingJobSerializer(BaseModelSerializer):
             "output_dataset",
             "output_node",
             "error_message",
+            "metrics",
             "started_at",
             "completed_at",
             "created_at",
@@ -46,6 +49,16 @@ class ProcessingJobSerializer(BaseModelSerializer):
     def get_input_dataset_ids(self, obj: ProcessingJob) -> list[str]:
         return [str(ds.id) for ds in obj.input_datasets.all()]
 
+    def get_progress(self, obj: ProcessingJob) -> int:
+        # Running jobs only persist progress on state transitions.
+        if obj.status == ProcessingJobStatus.PROCESSING:
+            live_progress = get_live_progress(obj.pk)
+
+            if live_progress is not None:
+                return live_progress
+
+        return obj.progress
+
 
 class ProcessingJobCreateSerializer(serializers.Serializer):
     """Validate a job submission."""
@@ -1,9 +1,14 @@
 import logging
+from collections import Counter
+
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
 
 from shared.infrastructure import InfraManager
 
 from .constants import DatasetNodeType, DatasetStatus, DatasetType, FileFormat
-from .models import Dataset, DatasetNode
+from .models import Dataset, DatasetNode, DatasetStats, Feature
 from .utils import detect_dataset_format
 
 logger = logging.getLogger(__name__)
@@ -19,18 +24,284 @@ class DatasetStorageService:
 
         return f"datasets/{dataset_id}/file"
 
+    @staticmethod
+    def build_tileset_storage_key(*, tileset_id):
+        return f"tilesets/{tileset_id}/processed.tif"
+
     @staticmethod
     def delete_dataset_files_from_object_storage(storage_paths):
-        for storage_path in storage_paths:
-            if not storage_path:
-                continue
+        storage_paths = [storage_path for storage_path in storage_paths if storage_path]
 
+        if storage_paths:
             try:
-                InfraManager.object_storage.delete_object(key=storage_path)
+                result = InfraManager.object_storage.delete_objects(keys=storage_paths)
             except Exception:
                 logger.exception(
-                    "Error deleting file from object storage: %s.", storage_path
+                    "Error deleting %d files from object storage.", len(storage_paths)
                 )
+            else:
+                for error in result["errors"]:
+                    logger.error(
+                        "Error deleting file from object storage: %s (%s).",
+                        error["key"],
+                        error["message"],
+                    )
+
+
+class DatasetStatsService:
+    @staticmethod
+    def get_fresh_stats(*, dataset):
+        """Stats of a vector dataset, computed first if missing or stale."""
+        if dataset.type != DatasetType.VECTOR:
+            return None
+
+        try:
+            stats = dataset.stats
+        except DatasetStats.DoesNotExist:
+            stats = None
+
+        if stats is None or stats.is_stale:
+            stats = DatasetStatsService.refresh(dataset_id=dataset.pk)
+            dataset.stats = stats
+
+        return stats
+
+    @staticmethod
+    def refresh(*, dataset_id):
+        """Recompute a dataset's stats from its features (a full scan)."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT
+                    feature_count,
+                    ST_XMin(extent), ST_YMin(extent),
+                    ST_XMax(extent), ST_YMax(extent)
+                FROM (
+                    SELECT COUNT(*) AS feature_count, ST_Extent(geometry) AS extent
+                    FROM feature
+                    WHERE dataset_id = %s
+                ) sub
+                """,
+                [str(dataset_id)],
+            )
+            feature_count, *extent = cursor.fetchone()
+
+            cursor.execute(
+                """
+                SELECT replace(ST_GeometryType(geometry), 'ST_', ''), COUNT(*)
+                FROM feature
+                WHERE dataset_id = %s
+                GROUP BY 1
+                """,
+                [str(dataset_id)],
+            )
+            geometry_types = dict(cursor.fetchall())
+
+            cursor.execute(
+                """
+                SELECT property.key, jsonb_typeof(property.value), COUNT(*)
+                FROM feature, jsonb_each(feature.properties) AS property
+                WHERE feature.dataset_id = %s
+                  AND jsonb_typeof(feature.properties) = 'object'
+                GROUP BY 1, 2
+                """,
+                [str(dataset_id)],
+            )
+            property_types = cursor.fetchall()
+
+        # A property's type is its most frequent non-null JSON type.
+        property_schema = {}
+        property_type_counts = {}
+
+        for key, json_type, count in property_types:
+            if json_type == "null":
+                property_schema.setdefault(key, "null")
+                continue
+
+            if count > property_type_counts.get(key, 0):
+                property_schema[key] = json_type
+                property_type_counts[key] = count
+
+        stats, _ = DatasetStats.objects.update_or_create(
+            dataset_id=dataset_id,
+            defaults={
+                "feature_count": feature_count,
+                "extent": extent if extent[0] is not None else None,
+                "geometry_types": geometry_types,
+                "property_schema": property_schema,
+                "is_stale": False,
+            },
+        )
+
+        return stats
+
+    @staticmethod
+    def record_features_added(*, dataset_id, features):
+        """Extend existing stats with newly inserted features, without a scan.
+
+        Datasets without stats (or with stale ones) are left to be computed on
+        their next read.
+        """
+        if not features:
+            return
+
+        with transaction.atomic():
+            stats = (
+                DatasetStats.objects.select_for_update()
+                .filter(dataset_id=dataset_id, is_stale=False)
+                .first()
+            )
+
+            if stats is None:
+                return
+
+            geometry_types = Counter(stats.geometry_types)
+            property_schema = dict(stats.property_schema)
+            extent = stats.extent
+
+            for feature in features:
+                geometry_types[feature.geometry.geom_type] += 1
+                extent = _merge_extents(extent, feature.geometry.extent)
+
+                for key, value in (feature.properties or {}).items():
+                    if property_schema.get(key, "null") == "null":
+                        property_schema[key] = _json_type(value)
+
+            stats.feature_count += len(features)
+            stats.extent = extent
+            stats.geometry_types = dict(geometry_types)
+            stats.property_schema = property_schema
+            stats.save(
+                update_fields=[
+                    "feature_count",
+                    "extent",
+                    "geometry_types",
+                    "property_schema",
+                    "updated_at",
+                ]
+            )
+
+    @staticmethod
+    def invalidate(*, dataset_ids):
+        """Mark stats stale after feature updates or deletes."""
+        DatasetStats.objects.filter(dataset_id__in=dataset_ids).update(is_stale=True)
+
+
+class FeatureEditService:
+    BATCH_SIZE = 1000
+
+    @staticmethod
+    def apply_batch(*, dataset, inserts, updates, deletes):
+        """
+        Apply validated inserts, updates and deletes to a dataset atomically.
+
+        Returns the client refs of inserted features mapped to their new ids,
+        the updated and deleted ids, and the new dataset version.
+        """
+        with transaction.atomic():
+            deleted = list(
+                Feature.objects.filter(dataset=dataset, id__in=deletes).values_list(
+                    "id", flat=True
+                )
+            )
+            Feature.objects.filter(dataset=dataset, id__in=deleted).delete()
+
+            features = Feature.objects.filter(dataset=dataset).in_bulk(
+                [feature_id for feature_id in updates if feature_id not in deletes]
+            )
+            now = timezone.now()
+
+            for feature_id, feature in features.items():
+                for field, value in updates[feature_id].items():
+                    setattr(feature, field, value)
+
+                feature.updated_at = now
+
+            Feature.objects.bulk_update(
+                features.values(),
+                fields=["geometry", "properties", "updated_at"],
+                batch_size=FeatureEditService.BATCH_SIZE,
+            )
+
+            inserted = Feature.objects.bulk_create(
+                [
+                    Feature(
+                        dataset=dataset,
+                        geometry=insert["geometry"],
+                        properties=insert["properties"],
+                    )
+                    for insert in inserts
+                ],
+                batch_size=FeatureEditService.BATCH_SIZE,
+            )
+
+            version = FeatureEditService.record_changes(
+                dataset_id=dataset.pk,
+                added=inserted,
+                modified=bool(deleted or features),
+            )
+
+        return {
+            "inserted": {
+                insert["ref"]: str(feature.id)
+                for insert, feature in zip(inserts, inserted)
+            },
+            "updated": [str(feature_id) for feature_id in features],
+            "deleted": [str(feature_id) for feature_id in deleted],
+            "version": version,
+        }
+
+    @staticmethod
+    def record_changes(*, dataset_id, added=(), modified=False):
+        """
+        Single bookkeeping point after a dataset's features changed: bump the
+        dataset version and keep its stats current. Returns the new version.
+        """
+        Dataset.objects.filter(pk=dataset_id).update(version=F("version") + 1)
+
+        if modified:
+            DatasetStatsService.invalidate(dataset_ids=[dataset_id])
+        else:
+            DatasetStatsService.record_features_added(
+                dataset_id=dataset_id, features=added
+            )
+
+        return (
+            Dataset.objects.filter(pk=dataset_id)
+            .values_list("version", flat=True)
+            .first()
+        )
+
+
+def _merge_extents(extent, other):
+    if extent is None:
+        return list(other)
+
+    return [
+        min(extent[0], other[0]),
+        min(extent[1], other[1]),
+        max(extent[2], other[2]),
+        max(extent[3], other[3]),
+    ]
+
+
+def _json_type(value) -> str:
+    if value is None:
+        return "null"
+
+    if isinstance(value, bool):
+        return "boolean"
+
+    if isinstance(value, (int, float)):
+        return "number"
+
+    if isinstance(value, str):
+        return "string"
+
+    if isinstance(value, dict):
+        return "object"
+
+    return "array"
 
 
 class DatasetCreateService:
@@ -1,3 +1,4 @@
+from django.db import connection, transaction
 from django.db.models.signals import post_save, pre_save
 from django.dispatch import receiver
 
@@ -5,8 +6,7 @@ from .constants import DatasetStatus, DatasetType, TileSetStatus
 from .models import Dataset, DatasetClosure, DatasetNode
 from .tasks import generate_cog_task
 
-# Cache to store old parent values before save
-_old_parent_cache = {}
+# Cache to store old values before save
 _old_dataset_status_cache = {}
 
 
@@ -15,14 +15,14 @@ def create_ancestor_closures(node):
     Create closure entries for a node based on its parent's ancestors.
     Returns the number of closures created.
     """
-    if not node.parent:
+    if not node.parent_id:
         return 0
 
-    parent_ancestors = DatasetClosure.objects.filter(descendant=node.parent)
+    parent_ancestors = DatasetClosure.objects.filter(descendant_id=node.parent_id)
 
     closures_to_create = [
         DatasetClosure(
-            ancestor=closure.ancestor,
+            ancestor_id=closure.ancestor_id,
             descendant=node,
             depth=closure.depth + 1,
         )
@@ -34,20 +34,58 @@ def create_ancestor_closures(node):
     return len(closures_to_create)
 
 
-@receiver(pre_save, sender=DatasetNode)
-def cache_old_parent(sender, instance, **kwargs):
+def move_subtree_closures(node):
     """
-    Cache the old parent value before the instance is saved.
-    This allows us to detect parent changes in post_save.
+    Re-attach the closures of a node's whole subtree to its current parent.
+
+    Two set-based statements regardless of the subtree size: drop every
+    (old ancestor, subtree node) pair, then insert the cross join of the new
+    parent's ancestors with the subtree, with the summed depths.
     """
-    if instance.pk:  # Only for existing instances
-        try:
-            old_instance = DatasetNode.objects.get(pk=instance.pk)
-            _old_parent_cache[instance.pk] = old_instance.parent_id
-        except DatasetNode.DoesNotExist:
-            _old_parent_cache[instance.pk] = None
-    else:
-        _old_parent_cache[instance.pk] = None
+    table = DatasetClosure._meta.db_table
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            DELETE FROM {table}
+            WHERE descendant_id IN (
+                SELECT descendant_id FROM {table} WHERE ancestor_id = %(node)s
+            )
+              AND ancestor_id NOT IN (
+                SELECT descendant_id FROM {table} WHERE ancestor_id = %(node)s
+            )
+            """,
+            {"node": node.pk},
+        )
+
+        if node.parent_id:
+            cursor.execute(
+                f"""
+                INSERT INTO {table}
+                    (id, ancestor_id, descendant_id, depth, created_at, updated_at)
+                SELECT
+                    gen_random_uuid(),
+                    supertree.ancestor_id,
+                    subtree.descendant_id,
+                    supertree.depth + subtree.depth + 1,
+                    NOW(),
+                    NOW()
+                FROM {table} AS supertree
+                CROSS JOIN {table} AS subtree
+                WHERE supertree.descendant_id = %(parent)s
+                  AND subtree.ancestor_id = %(node)s
+                """,
+                {"node": node.pk, "parent": node.parent_id},
+            )
+
+
+def _stored_parent_id(node):
+    """Parent the closure table currently records for a node."""
+    return (
+        DatasetClosure.objects.filter(descendant=node, depth=1)
+        .values_list("ancestor_id", flat=True)
+        .first()
+    )
 
 
 @receiver(pre_save, sender=Dataset)
@@ -71,10 +109,9 @@ def maintain_transitive_closure(sender, instance, created, **kwargs):
     """
     Maintain transitive closure for hierarchical dataset nodes.
 
-    When a node is created or its parent changes:
-    1. Create self-reference (depth 0)
-    2. Copy all ancestor relationships from parent
-    3. Update depth for all descendants
+    When a node is created: create its self-reference (depth 0) and copy the
+    ancestor relationships of its parent. When its parent changes: move the
+    closures of its whole subtree under the new parent.
     """
     if created:
         # Create self-reference closure (depth 0)
@@ -86,49 +123,26 @@ def maintain_transitive_closure(sender, instance, created, **kwargs):
 
         # If this node has a parent, establish transitive closures
         create_ancestor_closures(instance)
-
-        # Clean up cache
-        _old_parent_cache.pop(instance.pk, None)
     else:
-        # Handle parent change for existing nodes
-        old_parent_id = _old_parent_cache.get(instance.pk)
-        new_parent_id = instance.parent_id
-
-        if old_parent_id != new_parent_id:
-            # Parent has changed, rebuild closures
-
-            # Delete all closures where this node is descendant (except self-reference)
-            DatasetClosure.objects.filter(descendant=instance).exclude(
-                ancestor=instance
-            ).delete()
-
-            # If new parent exists, create new closures
-            create_ancestor_closures(instance)
-
-            # Update closures for all descendants of this node
-            rebuild_descendant_closures(instance)
-
-        # Clean up cache
-        _old_parent_cache.pop(instance.pk, None)
-
+        update_fields = kwargs.get("update_fields")
 
-def rebuild_descendant_closures(node):
-    """
-    Rebuild closure relationships for all descendants of a node.
-    This is needed when a node's parent changes.
-    """
-    # Get all direct children
-    children = DatasetNode.objects.filter(parent=node)
+        # save(update_fields=...) accepts the field name or its attname.
+        if update_fields is not None and update_fields.isdisjoint(
+            {"parent", "parent_id"}
+        ):
+            return
 
-    for child in children:
-        # Delete old ancestor closures (except self-reference)
-        DatasetClosure.objects.filter(descendant=child).exclude(ancestor=child).delete()
+        # Instances not loaded from the database (or with a deferred parent)
+        # fall back to the parent the closure table records.
+        if hasattr(instance, "_loaded_parent_id"):
+            old_parent_id = instance._loaded_parent_id
+        else:
+            old_parent_id = _stored_parent_id(instance)
 
-        # Create new closures based on current parent (node)
-        create_ancestor_closures(child)
+        if old_parent_id != instance.parent_id:
+            move_subtree_closures(instance)
 
-        # Recursively rebuild for this child's descendants
-        rebuild_descendant_closures(child)
+    instance._loaded_parent_id = instance.parent_id
 
 
 @receiver(post_save, sender=Dataset)
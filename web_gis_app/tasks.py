@@ -1,22 +1,41 @@
 """Celery tasks for the web_gis_app module."""
 
 import logging
+import os
+import shutil
 import tempfile
 
+from botocore.exceptions import BotoCoreError, ClientError
 from celery import shared_task
+from django.conf import settings
+from django.db import OperationalError
 from django.utils import timezone
+from redis.exceptions import RedisError
 
 from shared.infrastructure import InfraManager
+from shared.infrastructure.batch import JobAlreadyExistsError, JobStatus
+from shared.workflows.base.checkpoint import delete_checkpoint, load_checkpoint
 
 from .constants import DatasetType, FileFormat, ProcessingJobStatus, TileSetStatus
+from .helpers import object_storage_rio_env
 from .models import Dataset, ProcessingJob, TileSet
-from .progress import ProgressReporter
+from .progress import ProgressReporter, get_live_progress
+from .services import DatasetStorageService
 from .tool_registry import get_tool, load_workflow_class
 from .workflows.cog_workflow import COGWorkflow
+from .workflows.helpers import discard_staging_dataset
 
 logger = logging.getLogger(__name__)
 
-
+# Errors a processing job may get past by running again: object storage, Redis
+# and database hiccups, and I/O. Anything else fails the job right away.
+RETRYABLE_EXCEPTIONS = (
+    BotoCoreError,
+    ClientError,
+    RedisError,
+    OperationalError,
+    OSError,
+)
 
 
 @shared_task(bind=True, max_retries=2, default_retry_delay=60)
@@ -43,44 +62,64 @@ def generate_cog_task(self, dataset_id: str):
     )
     logger.info(f"TileSet {'created' if created else 'updated'} for processing: {tileset.id}")
 
+    # A stable work dir and checkpoint let a retry resume after the last
+    # completed operation instead of starting over from Download.
+    work_dir = os.path.join(tempfile.gettempdir(), f"cog_{tileset.id}")
+    checkpoint_key = f"cog_workflow:{tileset.id}"
+
     try:
-        with tempfile.TemporaryDirectory(prefix="cog_") as work_dir:
-            bucket = InfraManager.object_storage.default_bucket
-            upload_key = f"tilesets/{tileset.id}/processed.tif"
+        os.makedirs(work_dir, exist_ok=True)
 
-            # Construct S3 URIs
-            download_url = f"s3://{bucket}/{dataset.cloud_storage_path}"
-            upload_url = f"s3://{bucket}/{upload_key}"
+        bucket = InfraManager.object_storage.default_bucket
+        upload_key = DatasetStorageService.build_tileset_storage_key(
+            tileset_id=tileset.id
+        )
 
-            logger.info(f"Preparing COG workflow. Download: {download_url}, Upload: {upload_url}")
+        # Construct S3 URIs
+        download_url = f"s3://{bucket}/{dataset.cloud_storage_path}"
+        upload_url = f"s3://{bucket}/{upload_key}"
 
-            source_path = f"{work_dir}/source.tif"
+        logger.info(f"Preparing COG workflow. Download: {download_url}, Upload: {upload_url}")
 
-            workflow = COGWorkflow(
-                payload={
-                    # Shared Download operation payload.
-                    "download": {
-                        "download_url": download_url,
-                        "download_to_path": source_path,
-                    },
-                    # GenerateCOG uses the download output automatically.
-                    "generate_cog": {
-                        "input_path": source_path,
-                        "work_dir": work_dir,
-                    },
-                    # Shared Upload operation payload.
-                    "upload": {
-                        "upload_url": upload_url,
-                        "upload_from_path": f"{work_dir}/output.tif",
-                    },
-                    "update_tileset": {
-                        "tileset_id": str(tileset.id),
-                        "storage_path": upload_key,
-                    },
-                }
+        remote_read = settings.WEB_GIS_RASTER_REMOTE_READ
+
+        if remote_read:
+            # GenerateCOG streams the source through /vsis3/, no local copy.
+            source_path = InfraManager.object_storage.get_gdal_path(
+                key=dataset.cloud_storage_path, bucket=bucket
             )
+        else:
+            source_path = f"{work_dir}/source.tif"
+
+        payload = {
+            "generate_cog": {
+                "input_path": source_path,
+                "work_dir": work_dir,
+            },
+            # Shared Upload operation payload.
+            "upload": {
+                "upload_url": upload_url,
+                "upload_from_path": f"{work_dir}/output.tif",
+            },
+            "update_tileset": {
+                "tileset_id": str(tileset.id),
+                "storage_path": upload_key,
+            },
+        }
+
+        if not remote_read:
+            # Shared Download operation payload.
+            payload["download"] = {
+                "download_url": download_url,
+                "download_to_path": source_path,
+            }
+
+        workflow = COGWorkflow(payload=payload, checkpoint_key=checkpoint_key)
+
+        with object_storage_rio_env():
             workflow.execute()
 
+        shutil.rmtree(work_dir, ignore_errors=True)
         logger.info(f"COG generation complete for dataset {dataset_id}.")
 
     except Exception as exc:
@@ -89,7 +128,10 @@ def generate_cog_task(self, dataset_id: str):
         tileset.error_message = str(exc)[:2000]
         tileset.save(update_fields=["status", "error_message"])
 
-        # Retry on transient errors.
+        if self.request.retries >= self.max_retries:
+            _discard_checkpoint(checkpoint_key, work_dir)
+
+        # Retry on transient errors; the retry resumes from the checkpoint.
         raise self.retry(exc=exc)
 
 
@@ -98,7 +140,8 @@ def run_processing_tool(self, job_id: str):
     """Run a geoprocessing tool configured by a ProcessingJob.
 
     Loads the job, dispatches the matching workflow, and keeps the job
-    lifecycle + SSE progress stream in sync.
+    lifecycle + SSE progress stream in sync. Raster jobs with oversized inputs
+    are handed to batch compute and run in a dedicated Kubernetes Job instead.
     """
 
     logger.info("Starting processing job %s", job_id)
@@ -109,41 +152,238 @@ def run_processing_tool(self, job_id: str):
         logger.error("ProcessingJob %s not found.", job_id)
         return
 
+    job.celery_task_id = self.request.id or ""
+
+    try:
+        runs_as_batch_job = _runs_as_batch_job(job)
+
+        if runs_as_batch_job:
+            _submit_batch_job(job)
+    except Exception as exc:
+        logger.exception("Could not dispatch processing job %s: %s", job.pk, exc)
+        _fail_job(job, ProgressReporter(job=job, user=job.user), str(exc))
+        return
+
+    if runs_as_batch_job:
+        return
+
+    execute_processing_job(
+        job, retry=self.retry if self.request.retries < self.max_retries else None
+    )
+
+
+def execute_processing_job(job: ProcessingJob, retry=None) -> None:
+    """Run a job's workflow in this process, keeping status and progress in sync.
+
+    Used by run_processing_tool and, inside batch Jobs, by the
+    run_processing_job management command. When given, `retry` is called with
+    a transient error (see RETRYABLE_EXCEPTIONS) to schedule another attempt
+    instead of failing the job.
+    """
+
     job.status = ProcessingJobStatus.PROCESSING
     job.started_at = timezone.now()
-    job.celery_task_id = self.request.id or ""
     job.save(update_fields=["status", "started_at", "celery_task_id", "updated_at"])
 
     reporter = ProgressReporter(job=job, user=job.user)
     reporter.report(0, "Starting...")
 
+    work_dir = _job_work_dir(job)
+    checkpoint_key = f"processing_job:{job.pk}"
+    workflow = None
+
     try:
         tool = get_tool(job.tool_name)
         workflow_cls = load_workflow_class(job.tool_name)
         payload = _build_workflow_payload(job, tool)
 
-        workflow = workflow_cls(payload=payload)
+        workflow = workflow_cls(payload=payload, checkpoint_key=checkpoint_key)
         workflow.ctx["progress_reporter"] = reporter
-        workflow.execute()
+
+        with object_storage_rio_env():
+            workflow.execute()
+
+        shutil.rmtree(work_dir, ignore_errors=True)
 
         job.status = ProcessingJobStatus.COMPLETED
         job.completed_at = timezone.now()
         job.progress = 100
-        job.save(update_fields=["status", "completed_at", "progress", "updated_at"])
+        job.metrics = _workflow_metrics(workflow)
+        job.save(
+            update_fields=["status", "completed_at", "progress", "metrics", "updated_at"]
+        )
 
         output_id = str(job.output_dataset_id) if job.output_dataset_id else None
         reporter.complete(output_dataset_id=output_id)
 
-        logger.info("Processing job %s completed.", job_id)
+        logger.info("Processing job %s completed.", job.pk)
 
     except Exception as exc:
-        logger.exception("Processing job %s failed: %s", job_id, exc)
-        job.status = ProcessingJobStatus.FAILED
-        job.completed_at = timezone.now()
-        job.error_message = str(exc)[:2000]
-        job.save(update_fields=["status", "completed_at", "error_message", "updated_at"])
+        if retry is not None and isinstance(exc, RETRYABLE_EXCEPTIONS):
+            # Resume from the last completed operation instead of failing the job.
+            logger.warning("Processing job %s failed, retrying: %s", job.pk, exc)
+            _discard_unfinished_staging(workflow, checkpoint_key)
+            raise retry(exc=exc)
+
+        logger.exception("Processing job %s failed: %s", job.pk, exc)
+
+        if workflow and (staging_id := workflow.ctx.get("pending_feature_dataset_id")):
+            discard_staging_dataset(staging_id)
+
+        _discard_checkpoint(checkpoint_key, work_dir)
+        job.metrics = _workflow_metrics(workflow)
+        _fail_job(job, reporter, str(exc))
+
+
+@shared_task(bind=True, max_retries=None)
+def monitor_batch_job(self, job_id: str):
+    """Poll the batch Job running a ProcessingJob until it ends.
+
+    The Job updates the ProcessingJob itself; this only fails the job when the
+    Job ended (crashed, OOM-killed, deleted) without doing so.
+    """
+
+    job = ProcessingJob.objects.select_related("user").filter(pk=job_id).first()
+
+    if job is None or not job.batch_job_id:
+        return
+
+    if job.status in (ProcessingJobStatus.COMPLETED, ProcessingJobStatus.FAILED):
+        return
+
+    batch_status = InfraManager.batch_compute.get_job_status(job.batch_job_id)
+
+    if batch_status in (JobStatus.PENDING, JobStatus.RUNNING):
+        raise self.retry(countdown=settings.WEB_GIS_BATCH_JOB_POLL_SECONDS)
+
+    # The Job writes its final status before exiting, so re-read it.
+    job.refresh_from_db()
+
+    if job.status in (ProcessingJobStatus.COMPLETED, ProcessingJobStatus.FAILED):
+        return
+
+    try:
+        logs = InfraManager.batch_compute.get_job_logs(job.batch_job_id)
+    except Exception:
+        logger.exception("Could not read logs of batch job %s.", job.batch_job_id)
+        logs = ""
+
+    logger.error(
+        "Batch job %s of processing job %s ended as %s.",
+        job.batch_job_id,
+        job.pk,
+        batch_status.value,
+    )
+    _fail_job(
+        job,
+        ProgressReporter(job=job, user=job.user),
+        f"Batch job {batch_status.value}: {logs[-1000:]}".strip(),
+    )
+
+
+def _fail_job(job: ProcessingJob, reporter: ProgressReporter, error: str) -> None:
+    # Lets the live progress read below see a tick still held by the throttle.
+    reporter.flush()
+
+    job.status = ProcessingJobStatus.FAILED
+    job.completed_at = timezone.now()
+    job.error_message = error[:2000]
+    job.progress = get_live_progress(job.pk) or job.progress
+    job.save(
+        update_fields=[
+            "status",
+            "completed_at",
+            "error_message",
+            "progress",
+            "metrics",
+            "updated_at",
+        ]
+    )
+
+    reporter.fail(job.error_message)
 
-        reporter.fail(job.error_message)
+
+def _runs_as_batch_job(job: ProcessingJob) -> bool:
+    """Whether a job is big enough to get its own Kubernetes Job."""
+
+    if not settings.WEB_GIS_BATCH_JOB_IMAGE:
+        return False
+
+    if get_tool(job.tool_name).category.value != "raster":
+        return False
+
+    return _input_bytes(job.input_datasets.all()) > settings.WEB_GIS_BATCH_JOB_MIN_BYTES
+
+
+def _submit_batch_job(job: ProcessingJob) -> None:
+    """Run a job in a dedicated Kubernetes Job sized from its input.
+
+    The Job pod gets its environment (database, Redis and object storage
+    credentials) from the workers' Secret, see K8S_BATCH_ENV_SECRET, so no
+    credentials end up in the Job spec.
+    """
+
+    try:
+        batch_job_id = InfraManager.batch_compute.submit_job(
+            job_name=f"processing-job-{job.pk}",
+            image=settings.WEB_GIS_BATCH_JOB_IMAGE,
+            command=["python", "manage.py", "run_processing_job", str(job.pk)],
+            resources=_batch_job_resources(_input_bytes(job.input_datasets.all())),
+            labels={"processing-job": str(job.pk)},
+            active_deadline_seconds=settings.TASK_QUEUE_TIME_LIMITS[
+                settings.RASTER_TASK_QUEUE
+            ]["time_limit"],
+        )
+    except JobAlreadyExistsError as exc:
+        # A redelivered task: the Job was submitted before the worker died.
+        logger.info("Batch job %s already submitted, monitoring it.", exc.job_id)
+        batch_job_id = exc.job_id
+
+    job.batch_job_id = batch_job_id
+    job.save(update_fields=["celery_task_id", "batch_job_id", "updated_at"])
+
+    reporter = ProgressReporter(job=job, user=job.user)
+    reporter.report(0, "Waiting for a dedicated worker...")
+    monitor_batch_job.apply_async(
+        args=[str(job.pk)], countdown=settings.WEB_GIS_BATCH_JOB_POLL_SECONDS
+    )
+
+    logger.info("Processing job %s submitted as batch job %s.", job.pk, batch_job_id)
+
+
+def _batch_job_resources(input_bytes: int) -> dict:
+    """Memory scales with the input; requests equal limits so the pod is not evicted."""
+
+    memory_mb = int(input_bytes * settings.WEB_GIS_BATCH_JOB_MEMORY_FACTOR / 1024**2)
+    memory_mb = min(
+        max(memory_mb, settings.WEB_GIS_BATCH_JOB_MIN_MEMORY_MB),
+        settings.WEB_GIS_BATCH_JOB_MAX_MEMORY_MB,
+    )
+    resources = {"cpu": settings.WEB_GIS_BATCH_JOB_CPU, "memory": f"{memory_mb}Mi"}
+
+    return {"requests": resources, "limits": resources}
+
+
+def _input_bytes(datasets) -> int:
+    return sum(dataset.file_size or 0 for dataset in datasets)
+
+
+def processing_task_options(tool, datasets) -> dict:
+    """Celery routing options for a processing job, picked from its input size.
+
+    Vector ops mostly wait on PostGIS and go to the vector queue. Raster ops
+    go to the memory-heavy raster queue unless their inputs are small enough
+    for the light queue.
+    """
+
+    if tool.category.value == "vector":
+        queue = settings.VECTOR_TASK_QUEUE
+    elif _input_bytes(datasets) <= settings.WEB_GIS_LIGHT_JOB_MAX_BYTES:
+        queue = settings.LIGHT_TASK_QUEUE
+    else:
+        queue = settings.RASTER_TASK_QUEUE
+
+    return {"queue": queue, **settings.TASK_QUEUE_TIME_LIMITS[queue]}
 
 
 def _build_workflow_payload(job: ProcessingJob, tool) -> dict:
@@ -191,12 +431,20 @@ def _build_workflow_payload(job: ProcessingJob, tool) -> dict:
             "create_output_dataset": create_output_payload,
         }
 
-    # Raster workflows: Download -> <op> -> (ExtractRasterMetadata) -> (Upload) -> CreateOutputDataset.
+    # Raster workflows: (Download) -> <op> -> (ExtractRasterMetadata) -> (Upload) -> CreateOutputDataset.
     bucket = InfraManager.object_storage.default_bucket
     download_url = f"s3://{bucket}/{primary_input.cloud_storage_path}"
-    work_dir = tempfile.mkdtemp(prefix=f"job_{job.pk}_")
-    source_path = f"{work_dir}/source.tif"
+    work_dir = _job_work_dir(job)
+    os.makedirs(work_dir, exist_ok=True)
     output_path = f"{work_dir}/output.tif"
+    remote_read = tool.remote_read and settings.WEB_GIS_RASTER_REMOTE_READ
+
+    if remote_read:
+        source_path = InfraManager.object_storage.get_gdal_path(
+            key=_remote_source_key(primary_input), bucket=bucket
+        )
+    else:
+        source_path = f"{work_dir}/source.tif"
 
     first_op_name = tool.workflow_path.rsplit(".", 1)[-1].replace("Workflow", "Op")
     first_op_key = _camel_to_snake(first_op_name)
@@ -208,14 +456,16 @@ def _build_workflow_payload(job: ProcessingJob, tool) -> dict:
     }
 
     payload = {
-        "download": {
-            "download_url": download_url,
-            "download_to_path": source_path,
-        },
         first_op_key: first_op_payload,
         "create_output_dataset": create_output_payload,
     }
 
+    if not remote_read:
+        payload["download"] = {
+            "download_url": download_url,
+            "download_to_path": source_path,
+        }
+
     if output_type == DatasetType.RASTER.value:
         upload_key = f"processing/{job.pk}/output.tif"
         upload_url = f"s3://{bucket}/{upload_key}"
@@ -230,6 +480,63 @@ def _build_workflow_payload(job: ProcessingJob, tool) -> dict:
     return payload
 
 
+def _workflow_metrics(workflow) -> dict:
+    """Operation measurements of a workflow run, as stored on ProcessingJob.metrics."""
+
+    if workflow is None:
+        return {}
+
+    return {
+        "workflow": workflow.name,
+        "operations": workflow.metrics,
+        "transfers": workflow.ctx.get("transfer_metrics", []),
+    }
+
+
+def _job_work_dir(job: ProcessingJob) -> str:
+    """Stable per-job work dir, so a retried job finds the files of earlier attempts."""
+
+    return os.path.join(tempfile.gettempdir(), f"job_{job.pk}")
+
+
+def _discard_checkpoint(checkpoint_key: str, work_dir: str) -> None:
+    """Drop the resume state of a run that will not be retried."""
+
+    delete_checkpoint(checkpoint_key)
+    shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def _discard_unfinished_staging(workflow, checkpoint_key: str) -> None:
+    """Drop the staging dataset of an operation that failed before completing.
+
+    The retry runs that operation again with a new staging dataset. One that
+    is in the checkpoint belongs to a completed operation and is kept.
+    """
+
+    if workflow is None:
+        return
+
+    staging_id = workflow.ctx.get("pending_feature_dataset_id")
+    checkpoint = load_checkpoint(checkpoint_key)
+    checkpointed_ctx = checkpoint.ctx if checkpoint else {}
+
+    if staging_id and staging_id != checkpointed_ctx.get("pending_feature_dataset_id"):
+        discard_staging_dataset(staging_id)
+
+
+def _remote_source_key(dataset: Dataset) -> str:
+    """Prefer the dataset's COG tileset for remote reads; it is tiled and has overviews."""
+
+    tileset = TileSet.objects.filter(
+        dataset=dataset, status=TileSetStatus.READY
+    ).first()
+
+    if tileset and tileset.storage_path:
+        return tileset.storage_path
+
+    return dataset.cloud_storage_path
+
+
 def _camel_to_snake(name: str) -> str:
     import re
 
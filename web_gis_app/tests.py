@@ -1,2 +1,945 @@
+import json
+import tempfile
+import uuid
+from functools import partial
+from unittest.mock import MagicMock, patch
 
-# Create your tests here.
+import numpy as np
+import rasterio
+from django.contrib.auth.models import User
+from django.contrib.gis.geos import Point, Polygon
+from django.db import OperationalError
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from pydantic import ValidationError as PydanticValidationError
+from rasterio.transform import from_origin
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from shared.infrastructure import InfraManager
+from shared.infrastructure.batch import InProcessBatchCompute, JobStatus
+from shared.workflows.operations.upload import Upload, UploadPayload
+
+from .constants import (
+    DatasetNodeType,
+    DatasetStatus,
+    DatasetType,
+    FileFormat,
+    ProcessingJobStatus,
+    ProcessingTool,
+)
+from .models import Dataset, DatasetClosure, DatasetNode, Feature, ProcessingJob
+from .progress import PROGRESS_MIN_INTERVAL, ProgressReporter
+from .tasks import execute_processing_job, monitor_batch_job, run_processing_tool
+from .tool_registry import ReprojectRasterParams
+from .workflows.helpers import create_staging_dataset
+from .workflows.raster_workflows import raster_operations
+from .workflows.raster_workflows.raster_operations import (
+    HillshadeOp,
+    HillshadeOpPayload,
+    SlopeOp,
+    SlopeOpPayload,
+    ZonalStatsOp,
+    ZonalStatsOpPayload,
+    write_windowed,
+)
+from .workflows.vector_workflows.vector_operations import NearestOp, NearestOpPayload
+
+# ---------------------------------------------------------------------------
+# Factories
+# ---------------------------------------------------------------------------
+
+GB = 1024**3
+
+
+def make_user(username="gis-user", password="testpass"):
+    return User.objects.create_user(username=username, password=password)
+
+
+def make_node(user, name="Node", parent=None, **kwargs):
+    defaults = {"type": DatasetNodeType.DATASET.value}
+    defaults.update(kwargs)
+    return DatasetNode.objects.create(user=user, name=name, parent=parent, **defaults)
+
+
+def make_dataset(user, name="Dataset", **kwargs):
+    defaults = {
+        "type": DatasetType.VECTOR.value,
+        "format": FileFormat.GEOPACKAGE.value,
+        "file_name": f"{name}.gpkg",
+        "file_size": 0,
+        "cloud_storage_path": f"datasets/{name}",
+        # PENDING keeps raster datasets from triggering COG generation.
+        "status": DatasetStatus.PENDING,
+    }
+    defaults.update(kwargs)
+    return Dataset.objects.create(dataset_node=make_node(user, name), **defaults)
+
+
+def make_processing_job(user, tool=ProcessingTool.SLOPE, inputs=()):
+    job = ProcessingJob.objects.create(user=user, tool_name=tool.value)
+    job.input_datasets.set(inputs)
+    return job
+
+
+# ---------------------------------------------------------------------------
+# Batch compute dispatch
+# ---------------------------------------------------------------------------
+
+
+@override_settings(
+    WEB_GIS_BATCH_JOB_IMAGE="backend:test", WEB_GIS_BATCH_JOB_MIN_BYTES=GB
+)
+@patch("web_gis_app.tasks.get_live_progress", return_value=None)
+@patch("web_gis_app.tasks.monitor_batch_job.apply_async")
+@patch("web_gis_app.tasks.execute_processing_job")
+@patch("web_gis_app.tasks.ProgressReporter")
+class TestBatchJobDispatch(TestCase):
+    def setUp(self):
+        self.user = make_user()
+        self.compute = InProcessBatchCompute()
+        patcher = patch.object(InfraManager, "batch_compute", self.compute)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_raster_job(self, file_size):
+        dem = make_dataset(
+            self.user,
+            "dem",
+            type=DatasetType.RASTER.value,
+            format=FileFormat.GEOTIFF.value,
+            file_size=file_size,
+        )
+        return make_processing_job(self.user, inputs=[dem])
+
+    def test_small_input_runs_in_worker(
+        self, reporter, execute, apply_async, live_progress
+    ):
+        job = self.make_raster_job(file_size=GB)
+
+        run_processing_tool.apply(args=[str(job.pk)])
+
+        execute.assert_called_once()
+        self.assertEqual(self.compute.jobs, {})
+
+    def test_vector_job_runs_in_worker(
+        self, reporter, execute, apply_async, live_progress
+    ):
+        parcels = make_dataset(self.user, "parcels", file_size=10 * GB)
+        job = make_processing_job(
+            self.user, tool=ProcessingTool.BUFFER, inputs=[parcels]
+        )
+
+        run_processing_tool.apply(args=[str(job.pk)])
+
+        execute.assert_called_once()
+        self.assertEqual(self.compute.jobs, {})
+
+    def test_large_input_is_submitted_and_monitored(
+        self, reporter, execute, apply_async, live_progress
+    ):
+        job = self.make_raster_job(file_size=GB + 1)
+
+        run_processing_tool.apply(args=[str(job.pk)])
+
+        execute.assert_not_called()
+        job.refresh_from_db()
+        submitted = self.compute.jobs[job.batch_job_id]
+        self.assertEqual(submitted["image"], "backend:test")
+        self.assertEqual(
+            submitted["command"],
+            ["python", "manage.py", "run_processing_job", str(job.pk)],
+        )
+        # Credentials come from the env Secret, never from the Job spec.
+        self.assertEqual(submitted["environment"], {})
+        apply_async.assert_called_once()
+
+    def test_monitor_keeps_polling_while_running(
+        self, reporter, execute, apply_async, live_progress
+    ):
+        job = self.make_raster_job(file_size=2 * GB)
+        run_processing_tool.apply(args=[str(job.pk)])
+        job.refresh_from_db()
+        self.compute.set_job_status(job.batch_job_id, JobStatus.RUNNING)
+
+        result = monitor_batch_job.apply(args=[str(job.pk)])
+
+        self.assertEqual(result.state, "RETRY")
+        job.refresh_from_db()
+        self.assertEqual(job.status, ProcessingJobStatus.PENDING)
+
+    def test_monitor_keeps_status_written_by_the_job(
+        self, reporter, execute, apply_async, live_progress
+    ):
+        job = self.make_raster_job(file_size=2 * GB)
+        run_processing_tool.apply(args=[str(job.pk)])
+        job.refresh_from_db()
+        # The batch Job runs the workflow and records the result itself.
+        ProcessingJob.objects.filter(pk=job.pk).update(
+            status=ProcessingJobStatus.COMPLETED
+        )
+        self.compute.set_job_status(job.batch_job_id, JobStatus.SUCCEEDED)
+
+        monitor_batch_job.apply(args=[str(job.pk)])
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, ProcessingJobStatus.COMPLETED)
+        reporter.return_value.fail.assert_not_called()
+
+    def test_monitor_fails_job_when_batch_job_crashed(
+        self, reporter, execute, apply_async, live_progress
+    ):
+        job = self.make_raster_job(file_size=2 * GB)
+        run_processing_tool.apply(args=[str(job.pk)])
+        job.refresh_from_db()
+        self.compute.set_job_status(job.batch_job_id, JobStatus.FAILED, "OOMKilled")
+
+        monitor_batch_job.apply(args=[str(job.pk)])
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, ProcessingJobStatus.FAILED)
+        self.assertIn("OOMKilled", job.error_message)
+        reporter.return_value.fail.assert_called_once()
+
+    def test_submit_error_fails_job(
+        self, reporter, execute, apply_async, live_progress
+    ):
+        job = self.make_raster_job(file_size=2 * GB)
+
+        with patch.object(
+            self.compute, "submit_job", side_effect=RuntimeError("forbidden")
+        ):
+            run_processing_tool.apply(args=[str(job.pk)])
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, ProcessingJobStatus.FAILED)
+        self.assertIn("forbidden", job.error_message)
+        reporter.return_value.fail.assert_called_once()
+        apply_async.assert_not_called()
+
+    def test_redelivered_task_resumes_monitoring(
+        self, reporter, execute, apply_async, live_progress
+    ):
+        job = self.make_raster_job(file_size=2 * GB)
+        run_processing_tool.apply(args=[str(job.pk)])
+        job.refresh_from_db()
+        batch_job_id = job.batch_job_id
+
+        run_processing_tool.apply(args=[str(job.pk)])
+
+        job.refresh_from_db()
+        self.assertEqual(len(self.compute.jobs), 1)
+        self.assertEqual(job.batch_job_id, batch_job_id)
+        self.assertEqual(job.status, ProcessingJobStatus.PENDING)
+        self.assertEqual(apply_async.call_count, 2)
+
+
+# ---------------------------------------------------------------------------
+# Processing job retries
+# ---------------------------------------------------------------------------
+
+
+def make_failing_workflow(user, error):
+    """A workflow class that creates a staging dataset, then raises `error`."""
+
+    class FailingWorkflow:
+        name = "failing_workflow"
+
+        def __init__(self, payload, checkpoint_key=None):
+            self.ctx = {}
+            self.metrics = {}
+
+        def execute(self):
+            create_staging_dataset(self.ctx, user)
+            raise error
+
+    return FailingWorkflow
+
+
+@patch("web_gis_app.tasks.get_live_progress", return_value=None)
+@patch("web_gis_app.tasks.ProgressReporter")
+@patch("web_gis_app.tasks._build_workflow_payload", return_value={})
+class TestProcessingJobRetries(TestCase):
+    def setUp(self):
+        self.user = make_user()
+        self.job = make_processing_job(self.user)
+        self.retry = MagicMock(side_effect=RuntimeError("retry scheduled"))
+
+    def execute(self, error):
+        with patch(
+            "web_gis_app.tasks.load_workflow_class",
+            return_value=make_failing_workflow(self.user, error),
+        ):
+            execute_processing_job(self.job, retry=self.retry)
+
+    def test_permanent_error_fails_job_without_retrying(
+        self, build_payload, reporter, live_progress
+    ):
+        self.execute(ValueError("Invalid CRS"))
+
+        self.retry.assert_not_called()
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, ProcessingJobStatus.FAILED)
+        self.assertIn("Invalid CRS", self.job.error_message)
+        reporter.return_value.fail.assert_called_once()
+        self.assertFalse(Dataset.objects.filter(file_name="staging.gpkg").exists())
+
+    def test_transient_error_is_retried(self, build_payload, reporter, live_progress):
+        error = OperationalError("server closed the connection")
+
+        with self.assertRaisesMessage(RuntimeError, "retry scheduled"):
+            self.execute(error)
+
+        self.retry.assert_called_once_with(exc=error)
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, ProcessingJobStatus.PROCESSING)
+        reporter.return_value.fail.assert_not_called()
+        # The failed operation runs again on retry with a new staging dataset.
+        self.assertFalse(Dataset.objects.filter(file_name="staging.gpkg").exists())
+
+    def test_last_attempt_fails_job_on_transient_error(
+        self, build_payload, reporter, live_progress
+    ):
+        self.retry = None
+
+        self.execute(OperationalError("server closed the connection"))
+
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, ProcessingJobStatus.FAILED)
+        self.assertFalse(Dataset.objects.filter(file_name="staging.gpkg").exists())
+
+
+# ---------------------------------------------------------------------------
+# Processing progress
+# ---------------------------------------------------------------------------
+
+
+@patch("web_gis_app.progress.send_notification")
+@patch("web_gis_app.progress.publish_notification")
+@patch("web_gis_app.progress._redis_client")
+@patch("web_gis_app.progress.threading.Timer")
+@patch("web_gis_app.progress.time.monotonic", return_value=100.0)
+class TestProgressReporter(SimpleTestCase):
+    def setUp(self):
+        self.reporter = ProgressReporter(
+            job=MagicMock(pk=1, tool_name="hillshade"), user=MagicMock()
+        )
+
+    def published(self, publish_notification):
+        return [
+            json.loads(call.kwargs["content"])["progress"]
+            for call in publish_notification.call_args_list
+        ]
+
+    def test_throttled_tick_is_sent_when_the_interval_ends(
+        self, monotonic, timer, redis_client, publish_notification, send_notification
+    ):
+        self.reporter.report(10)
+        self.reporter.report(50)
+        self.reporter.report(85, "Hillshade written")
+
+        self.assertEqual(self.published(publish_notification), [10])
+        timer.assert_called_once_with(PROGRESS_MIN_INTERVAL, self.reporter.flush)
+
+        # The timer fires; only the latest held-back tick goes out.
+        self.reporter.flush()
+
+        self.assertEqual(self.published(publish_notification), [10, 85])
+        redis_client.pipeline.return_value.hset.assert_called_with(
+            "processing_job:1:progress",
+            mapping={"progress": 85, "message": "Hillshade written"},
+        )
+
+    def test_next_tick_after_the_interval_replaces_the_held_one(
+        self, monotonic, timer, redis_client, publish_notification, send_notification
+    ):
+        self.reporter.report(10)
+        self.reporter.report(50)
+        monotonic.return_value += PROGRESS_MIN_INTERVAL
+
+        self.reporter.report(60)
+
+        self.assertEqual(self.published(publish_notification), [10, 60])
+        timer.return_value.cancel.assert_called_once()
+
+    def test_held_tick_is_sent_before_completion(
+        self, monotonic, timer, redis_client, publish_notification, send_notification
+    ):
+        self.reporter.report(10)
+        self.reporter.report(85)
+
+        self.reporter.complete(output_dataset_id="abc")
+
+        self.assertEqual(self.published(publish_notification), [10, 85])
+        send_notification.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# Cached raster op artifacts
+# ---------------------------------------------------------------------------
+
+
+@patch("shared.workflows.base.result_cache.set_cached_result")
+class TestUploadCachedArtifacts(TestCase):
+    def setUp(self):
+        self.storage = MagicMock()
+        self.storage.upload_file.return_value = {
+            "bucket": "data",
+            "key": "processing/1/output.tif",
+            "etag": "new",
+        }
+        self.storage.copy_object.return_value = {
+            "bucket": "data",
+            "key": "processing/2/output.tif",
+            "etag": "old",
+        }
+        patcher = patch.object(InfraManager, "object_storage", self.storage)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_upload(self, path, key):
+        return Upload(
+            UploadPayload(upload_url=f"s3://data/{key}", upload_from_path=path)
+        )
+
+    def test_miss_caches_the_uploaded_job_output(self, set_cached_result):
+        with tempfile.NamedTemporaryFile(suffix=".tif") as output:
+            upload = self.make_upload(output.name, "processing/1/output.tif")
+            upload.ctx["pending_artifact_cache"] = {
+                output.name: {"cache_key": "abc", "ttl": 60}
+            }
+
+            upload.run()
+
+        self.storage.upload_file.assert_called_once()
+        set_cached_result.assert_called_once_with(
+            "abc",
+            {
+                "artifact": {
+                    "bucket": "data",
+                    "key": "processing/1/output.tif",
+                    "etag": "new",
+                }
+            },
+            60,
+        )
+        self.assertEqual(upload.ctx["pending_artifact_cache"], {})
+
+    def test_hit_copies_the_artifact_instead_of_uploading(self, set_cached_result):
+        with tempfile.NamedTemporaryFile(suffix=".tif") as output:
+            upload = self.make_upload(output.name, "processing/2/output.tif")
+            upload.ctx["cached_artifacts"] = {
+                output.name: {
+                    "bucket": "data",
+                    "key": "processing/1/output.tif",
+                    "etag": "old",
+                }
+            }
+
+            upload.run()
+
+        self.storage.upload_file.assert_not_called()
+        self.storage.copy_object.assert_called_once_with(
+            source_key="processing/1/output.tif",
+            key="processing/2/output.tif",
+            source_bucket="data",
+            bucket="data",
+        )
+        set_cached_result.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Windowed raster ops
+# ---------------------------------------------------------------------------
+
+
+class TestWriteWindowed(SimpleTestCase):
+    def setUp(self):
+        self.work_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.work_dir.cleanup)
+        self.dem_path = f"{self.work_dir.name}/dem.tif"
+
+        rows, cols = np.mgrid[0:10, 0:10]
+        elevation = (np.sin(rows / 2.0) * 40 + cols**2).astype("float32")
+        # A nodata gap on a window edge exercises the NaN fill.
+        elevation[3:5, 3:5] = -9999
+
+        with rasterio.open(
+            self.dem_path,
+            "w",
+            driver="GTiff",
+            width=10,
+            height=10,
+            count=1,
+            dtype="float32",
+            nodata=-9999,
+            crs="EPSG:32633",
+            transform=from_origin(500000, 1000, 30, 30),
+        ) as dst:
+            dst.write(elevation[np.newaxis])
+
+    def run_windowed(self, compute, halo, count, dtype, window_size):
+        output_path = f"{self.work_dir.name}/output-{window_size}.tif"
+        windows = partial(raster_operations.iter_windows, size=window_size)
+
+        with (
+            rasterio.open(self.dem_path) as dem,
+            patch.object(raster_operations, "iter_windows", windows),
+        ):
+            write_windowed(
+                dem,
+                output_path,
+                {
+                    "driver": "GTiff",
+                    "width": dem.width,
+                    "height": dem.height,
+                    "count": count,
+                    "dtype": dtype,
+                    "crs": dem.crs,
+                    "transform": dem.transform,
+                    "nodata": None,
+                },
+                lambda data: compute(data, *dem.res),
+                halo=halo,
+                cog=False,
+            )
+
+        with rasterio.open(output_path) as output:
+            return output.read()
+
+    def assert_seamless(self, compute, halo, count, dtype):
+        # 4 pixel windows split the DEM in 9; 10 pixels fit in one window.
+        windowed = self.run_windowed(compute, halo, count, dtype, window_size=4)
+        whole = self.run_windowed(compute, halo, count, dtype, window_size=10)
+
+        np.testing.assert_array_equal(windowed, whole)
+
+    def test_hillshade_windows_are_seamless(self):
+        op = HillshadeOp(
+            HillshadeOpPayload(
+                job_id="1", input_path=self.dem_path, work_dir=self.work_dir.name
+            )
+        )
+
+        self.assert_seamless(op._shade, halo=2, count=4, dtype="uint8")
+
+    def test_slope_windows_are_seamless(self):
+        op = SlopeOp(
+            SlopeOpPayload(
+                job_id="1", input_path=self.dem_path, work_dir=self.work_dir.name
+            )
+        )
+
+        self.assert_seamless(
+            lambda data, xres, yres: op._slope(data, xres, yres, [np.inf, -np.inf]),
+            halo=1,
+            count=1,
+            dtype="float32",
+        )
+
+
+class TestReprojectRasterParams(SimpleTestCase):
+    def test_accepts_known_crs(self):
+        params = ReprojectRasterParams.model_validate({"dst_crs": "EPSG:3857"})
+
+        self.assertEqual(params.dst_crs, "EPSG:3857")
+
+    def test_rejects_unknown_crs(self):
+        with self.assertRaisesMessage(PydanticValidationError, "Unknown CRS"):
+            ReprojectRasterParams.model_validate({"dst_crs": "EPSG:0"})
+
+
+# ---------------------------------------------------------------------------
+# Zonal statistics
+# ---------------------------------------------------------------------------
+
+
+class TestZonalStatsOp(TestCase):
+    def setUp(self):
+        self.user = make_user()
+        self.work_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.work_dir.cleanup)
+
+        # 4x4 raster of 0..15 over lon 0-4, lat 0-4.
+        self.raster_path = f"{self.work_dir.name}/source.tif"
+        with rasterio.open(
+            self.raster_path,
+            "w",
+            driver="GTiff",
+            width=4,
+            height=4,
+            count=1,
+            dtype="float32",
+            crs="EPSG:4326",
+            transform=from_origin(0, 4, 1, 1),
+        ) as dst:
+            dst.write(np.arange(16, dtype="float32").reshape(1, 4, 4))
+
+        self.dem = make_dataset(
+            self.user,
+            "dem",
+            type=DatasetType.RASTER.value,
+            format=FileFormat.GEOTIFF.value,
+        )
+        self.zones = make_dataset(self.user, "zones")
+        for name, bbox in (("west", (0, 0, 2, 4)), ("east", (2, 0, 4, 4))):
+            Feature.objects.create(
+                dataset=self.zones,
+                geometry=Polygon.from_bbox(bbox),
+                properties={"name": name},
+            )
+
+        self.job = make_processing_job(
+            self.user, tool=ProcessingTool.ZONAL_STATS, inputs=[self.dem]
+        )
+
+    def run_op(self, zone_dataset):
+        op = ZonalStatsOp(
+            ZonalStatsOpPayload(
+                job_id=str(self.job.pk),
+                input_path=self.raster_path,
+                work_dir=self.work_dir.name,
+                zone_dataset_id=str(zone_dataset.pk),
+            )
+        )
+        op.execute()
+        return op
+
+    def test_summarises_each_zone(self):
+        op = self.run_op(self.zones)
+
+        stats = {
+            feature.properties["name"]: feature.properties
+            for feature in Feature.objects.filter(
+                dataset_id=op.ctx["pending_feature_dataset_id"]
+            )
+        }
+        self.assertEqual(
+            stats["west"],
+            {
+                "name": "west",
+                "zonal_count": 8,
+                "zonal_min": 0.0,
+                "zonal_max": 13.0,
+                "zonal_mean": 6.5,
+                "zonal_sum": 52.0,
+            },
+        )
+        self.assertEqual(stats["east"]["zonal_count"], 8)
+        self.assertEqual(stats["east"]["zonal_min"], 2.0)
+        self.assertEqual(stats["east"]["zonal_max"], 15.0)
+        self.assertEqual(stats["east"]["zonal_sum"], 68.0)
+
+    def test_rejects_raster_zone_dataset(self):
+        with self.assertRaisesMessage(ValueError, "is not a vector dataset"):
+            self.run_op(self.dem)
+
+    def test_rejects_zone_dataset_of_another_user(self):
+        other = make_dataset(make_user("other-user"), "zones")
+
+        with self.assertRaisesMessage(ValueError, "not found"):
+            self.run_op(other)
+
+
+# ---------------------------------------------------------------------------
+# Vector join tools
+# ---------------------------------------------------------------------------
+
+
+class TestJoinDatasetValidation(TestCase):
+    def setUp(self):
+        self.user = make_user()
+        self.parcels = make_dataset(self.user, "parcels")
+        self.job = make_processing_job(
+            self.user, tool=ProcessingTool.NEAREST, inputs=[self.parcels]
+        )
+
+    def run_nearest(self, near_dataset):
+        NearestOp(
+            NearestOpPayload(
+                job_id=str(self.job.pk),
+                input_dataset_id=str(self.parcels.pk),
+                near_dataset_id=str(near_dataset.pk),
+            )
+        ).execute()
+
+    def test_rejects_raster_dataset(self):
+        dem = make_dataset(
+            self.user,
+            "dem",
+            type=DatasetType.RASTER.value,
+            format=FileFormat.GEOTIFF.value,
+        )
+
+        with self.assertRaisesMessage(ValueError, "is not a vector dataset"):
+            self.run_nearest(dem)
+
+    def test_rejects_dataset_of_another_user(self):
+        other = make_dataset(make_user("other-user"), "schools")
+
+        with self.assertRaisesMessage(ValueError, "not found"):
+            self.run_nearest(other)
+
+
+# ---------------------------------------------------------------------------
+# Dataset node closure table
+# ---------------------------------------------------------------------------
+
+
+class TestDatasetClosure(TestCase):
+    def setUp(self):
+        self.user = make_user()
+        self.root = make_node(self.user, "root", type=DatasetNodeType.FOLDER.value)
+        self.other = make_node(self.user, "other", type=DatasetNodeType.FOLDER.value)
+
+    def make_chain(self, parent, length):
+        nodes = []
+
+        for index in range(length):
+            parent = make_node(
+                self.user,
+                f"level {index}",
+                parent=parent,
+                type=DatasetNodeType.FOLDER.value,
+            )
+            nodes.append(parent)
+
+        return nodes
+
+    def ancestors(self, node):
+        return dict(
+            DatasetClosure.objects.filter(descendant=node).values_list(
+                "ancestor_id", "depth"
+            )
+        )
+
+    def test_create_copies_parent_ancestors(self):
+        child, grandchild = self.make_chain(self.root, 2)
+
+        self.assertEqual(
+            self.ancestors(grandchild),
+            {grandchild.pk: 0, child.pk: 1, self.root.pk: 2},
+        )
+
+    def test_move_reattaches_subtree(self):
+        child, grandchild = self.make_chain(self.root, 2)
+
+        child.parent = self.other
+        child.save()
+
+        self.assertEqual(
+            self.ancestors(grandchild),
+            {grandchild.pk: 0, child.pk: 1, self.other.pk: 2},
+        )
+        self.assertFalse(
+            DatasetClosure.objects.filter(
+                ancestor=self.root, descendant__in=[child, grandchild]
+            ).exists()
+        )
+
+    def test_move_with_parent_id_in_update_fields(self):
+        (child,) = self.make_chain(self.root, 1)
+
+        child.parent_id = self.other.pk
+        child.save(update_fields=["parent_id"])
+
+        self.assertEqual(self.ancestors(child), {child.pk: 0, self.other.pk: 1})
+
+    def test_move_to_root(self):
+        child, grandchild = self.make_chain(self.root, 2)
+
+        child.parent = None
+        child.save(update_fields=["parent"])
+
+        self.assertEqual(self.ancestors(child), {child.pk: 0})
+        self.assertEqual(self.ancestors(grandchild), {grandchild.pk: 0, child.pk: 1})
+
+    def test_move_deep_subtree(self):
+        chain = self.make_chain(self.root, 6)
+        branch = make_node(
+            self.user, "branch", parent=chain[2], type=DatasetNodeType.FOLDER.value
+        )
+        subtree = [*chain[1:], branch]
+
+        chain[1].parent = self.other
+        chain[1].save()
+
+        leaf_ancestors = self.ancestors(chain[-1])
+        self.assertEqual(leaf_ancestors[self.other.pk], 5)
+        self.assertNotIn(self.root.pk, leaf_ancestors)
+        self.assertNotIn(chain[0].pk, leaf_ancestors)
+        self.assertEqual(
+            self.ancestors(branch),
+            {branch.pk: 0, chain[2].pk: 1, chain[1].pk: 2, self.other.pk: 3},
+        )
+        # Every subtree node keeps exactly one row per ancestor.
+        for node in subtree:
+            depth = DatasetClosure.objects.get(ancestor=chain[1], descendant=node).depth
+            self.assertEqual(len(self.ancestors(node)), depth + 2)
+
+    def test_save_without_parent_change_keeps_closures(self):
+        (child,) = self.make_chain(self.root, 1)
+        before = self.ancestors(child)
+
+        child.name = "renamed"
+        child.save(update_fields=["name"])
+        child.save()
+
+        self.assertEqual(self.ancestors(child), before)
+
+
+# ---------------------------------------------------------------------------
+# Feature batch edits
+# ---------------------------------------------------------------------------
+
+
+def point(lng=0.0, lat=0.0):
+    return {"type": "Point", "coordinates": [lng, lat]}
+
+
+class TestFeatureBatchEdit(TestCase):
+    def setUp(self):
+        self.user = make_user()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.dataset = make_dataset(self.user, "roads")
+        self.feature = Feature.objects.create(
+            dataset=self.dataset, geometry=Point(1, 1, srid=4326), properties={}
+        )
+
+    def post_batch(self, edits, dataset=None):
+        return self.client.post(
+            reverse("features-batch"),
+            {"dataset": str((dataset or self.dataset).pk), "edits": edits},
+            format="json",
+        )
+
+    def tile_url(self):
+        return reverse(
+            "dataset-vector-tile",
+            kwargs={"pk": self.dataset.pk, "z": 0, "x": 0, "y": 0},
+        )
+
+    def test_applies_edits_and_bumps_version(self):
+        response = self.post_batch(
+            [
+                {"op": "insert", "ref": "a", "geometry": point(2, 2)},
+                {
+                    "op": "update",
+                    "id": str(self.feature.pk),
+                    "properties": {"name": "Main"},
+                },
+            ]
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()["data"]
+        self.assertEqual(list(data["inserted"]), ["a"])
+        self.assertEqual(data["updated"], [str(self.feature.pk)])
+        self.assertEqual(data["version"], self.dataset.version + 1)
+        self.feature.refresh_from_db()
+        self.assertEqual(self.feature.properties, {"name": "Main"})
+
+    def test_errors_are_keyed_by_edit_index(self):
+        response = self.post_batch(
+            [
+                {"op": "insert", "ref": "a", "geometry": point()},
+                {"op": "insert", "ref": "b", "geometry": {"type": "Point"}},
+                {"op": "rename"},
+            ]
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.json()["data"]["edits"]
+        self.assertEqual(set(errors), {"1", "2"})
+        self.assertIn("Invalid geometry", errors["1"][0])
+        self.assertEqual(Feature.objects.filter(dataset=self.dataset).count(), 1)
+
+    def test_rejects_duplicate_insert_refs(self):
+        response = self.post_batch(
+            [
+                {"op": "insert", "ref": "a", "geometry": point()},
+                {"op": "insert", "ref": "a", "geometry": point(1, 0)},
+            ]
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.json()["data"]["edits"]
+        self.assertEqual(errors, {"1": ["Duplicate ref a."]})
+
+    def test_rejects_updates_of_features_outside_the_dataset(self):
+        other_dataset = make_dataset(self.user, "rivers")
+        other_feature = Feature.objects.create(
+            dataset=other_dataset, geometry=Point(3, 3, srid=4326), properties={}
+        )
+        unknown_id = str(uuid.uuid4())
+
+        response = self.post_batch(
+            [
+                {"op": "update", "id": str(self.feature.pk), "properties": {}},
+                {"op": "update", "id": str(other_feature.pk), "properties": {}},
+                {"op": "update", "id": unknown_id, "properties": {}},
+            ]
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.json()["data"]["edits"]
+        self.assertEqual(set(errors), {"1", "2"})
+        self.assertIn(unknown_id, errors["2"][0])
+        other_dataset.refresh_from_db()
+        self.assertEqual(other_dataset.version, 0)
+
+    def test_rejects_deletes_of_features_outside_the_dataset(self):
+        unknown_id = str(uuid.uuid4())
+
+        response = self.post_batch(
+            [
+                {"op": "delete", "id": str(self.feature.pk)},
+                {"op": "delete", "id": unknown_id},
+            ]
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.json()["data"]["edits"]
+        self.assertEqual(set(errors), {"1"})
+        self.assertIn(unknown_id, errors["1"][0])
+        self.assertTrue(Feature.objects.filter(pk=self.feature.pk).exists())
+
+    def test_rejects_raster_dataset(self):
+        dem = make_dataset(
+            self.user,
+            "dem",
+            type=DatasetType.RASTER.value,
+            format=FileFormat.GEOTIFF.value,
+        )
+
+        response = self.post_batch(
+            [{"op": "insert", "ref": "a", "geometry": point()}], dataset=dem
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("not a vector dataset", response.json()["data"]["dataset"][0])
+        self.assertFalse(Feature.objects.filter(dataset=dem).exists())
+
+    def test_dataset_of_another_user_is_not_found(self):
+        other_dataset = make_dataset(make_user("other-user"), "rivers")
+
+        response = self.post_batch(
+            [{"op": "insert", "geometry": point()}], dataset=other_dataset
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_vector_tile_etag_follows_dataset_version(self):
+        first = self.client.get(self.tile_url())
+        etag = first.headers["ETag"]
+
+        cached = self.client.get(self.tile_url(), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.post_batch([{"op": "delete", "id": str(self.feature.pk)}])
+        changed = self.client.get(self.tile_url(), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(changed.headers["ETag"], etag)
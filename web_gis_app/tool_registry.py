@@ -11,7 +11,7 @@ from __future__ import annotations
 
 from typing import Literal, Optional
 
-from pydantic import Field
+from pydantic import Field, field_validator
 
 from shared.schemas import StrictPayload
 
@@ -46,6 +46,19 @@ class ConvexHullParams(StrictPayload):
     per_feature: bool = False
 
 
+class SpatialJoinParams(StrictPayload):
+    join_dataset_id: str
+    prefix: str = Field("join_", max_length=32)
+    keep_unmatched: bool = False
+
+
+class NearestParams(StrictPayload):
+    near_dataset_id: str
+    k: int = Field(1, ge=1, le=100)
+    max_distance: Optional[float] = Field(None, gt=0, description="Meters.")
+    prefix: str = Field("near_", max_length=32)
+
+
 # -- Raster tool params --
 
 
@@ -75,6 +88,32 @@ class RasterCalcParams(StrictPayload):
     band_mapping: dict = Field(default_factory=dict)
 
 
+class ReprojectRasterParams(StrictPayload):
+    dst_crs: str = Field(..., description="Target CRS, e.g. 'EPSG:3857'.")
+    resolution: Optional[float] = Field(None, gt=0)
+    resampling: Literal["nearest", "bilinear", "cubic", "average", "mode"] = "nearest"
+
+    @field_validator("dst_crs")
+    @classmethod
+    def _check_dst_crs(cls, value: str) -> str:
+        # Parsed like ReprojectRasterOp does, so a bad CRS fails the request.
+        from rasterio.crs import CRS
+        from rasterio.errors import CRSError
+
+        try:
+            CRS.from_user_input(value)
+        except CRSError as exc:
+            raise ValueError(f"Unknown CRS {value!r}.") from exc
+
+        return value
+
+
+class ZonalStatsParams(StrictPayload):
+    zone_dataset_id: str
+    band: int = Field(1, ge=1)
+    prefix: str = Field("zonal_", max_length=32)
+
+
 # -- Tool definition --
 
 
@@ -93,6 +132,7 @@ class ToolDefinition:
         input_types: tuple[str, ...],
         output_type: str,
         param_schema: list[dict],
+        remote_read: bool = False,
     ):
         self.tool = tool
         self.label = label
@@ -103,6 +143,9 @@ class ToolDefinition:
         self.input_types = input_types
         self.output_type = output_type
         self.param_schema = param_schema
+        # Whether the tool's op can read its raster input through /vsis3/
+        # instead of a local copy made by the Download operation.
+        self.remote_read = remote_read
 
     def to_frontend_dict(self) -> dict:
         return {
@@ -189,6 +232,58 @@ _CONVEX_HULL_SCHEMA = [
     },
 ]
 
+_SPATIAL_JOIN_SCHEMA = [
+    {
+        "name": "join_dataset_id",
+        "label": "Join layer",
+        "type": "dataset",
+        "datasetType": DatasetType.VECTOR.value,
+        "required": True,
+    },
+    {
+        "name": "prefix",
+        "label": "Joined field prefix",
+        "type": "string",
+        "default": "join_",
+    },
+    {
+        "name": "keep_unmatched",
+        "label": "Keep features without a match",
+        "type": "boolean",
+        "default": False,
+    },
+]
+
+_NEAREST_SCHEMA = [
+    {
+        "name": "near_dataset_id",
+        "label": "Near layer",
+        "type": "dataset",
+        "datasetType": DatasetType.VECTOR.value,
+        "required": True,
+    },
+    {
+        "name": "k",
+        "label": "Neighbours",
+        "type": "number",
+        "default": 1,
+        "min": 1,
+        "max": 100,
+    },
+    {
+        "name": "max_distance",
+        "label": "Max distance in meters (optional)",
+        "type": "number",
+        "min": 0,
+    },
+    {
+        "name": "prefix",
+        "label": "Joined field prefix",
+        "type": "string",
+        "default": "near_",
+    },
+]
+
 _HILLSHADE_SCHEMA = [
     {
         "name": "azimuth",
@@ -271,6 +366,58 @@ _RASTER_CALC_SCHEMA = [
     },
 ]
 
+_REPROJECT_RASTER_SCHEMA = [
+    {
+        "name": "dst_crs",
+        "label": "Target CRS",
+        "type": "string",
+        "required": True,
+        "default": "EPSG:3857",
+    },
+    {
+        "name": "resolution",
+        "label": "Resolution (target CRS units, optional)",
+        "type": "number",
+        "min": 0,
+    },
+    {
+        "name": "resampling",
+        "label": "Resampling",
+        "type": "select",
+        "options": [
+            {"value": "nearest", "label": "Nearest"},
+            {"value": "bilinear", "label": "Bilinear"},
+            {"value": "cubic", "label": "Cubic"},
+            {"value": "average", "label": "Average"},
+            {"value": "mode", "label": "Mode"},
+        ],
+        "default": "nearest",
+    },
+]
+
+_ZONAL_STATS_SCHEMA = [
+    {
+        "name": "zone_dataset_id",
+        "label": "Zone layer",
+        "type": "dataset",
+        "datasetType": DatasetType.VECTOR.value,
+        "required": True,
+    },
+    {
+        "name": "band",
+        "label": "Band",
+        "type": "number",
+        "default": 1,
+        "min": 1,
+    },
+    {
+        "name": "prefix",
+        "label": "Output field prefix",
+        "type": "string",
+        "default": "zonal_",
+    },
+]
+
 
 TOOL_REGISTRY: dict[str, ToolDefinition] = {
     ProcessingTool.BUFFER.value: ToolDefinition(
@@ -339,6 +486,28 @@ TOOL_REGISTRY: dict[str, ToolDefinition] = {
         output_type=DatasetType.VECTOR.value,
         param_schema=_CONVEX_HULL_SCHEMA,
     ),
+    ProcessingTool.SPATIAL_JOIN.value: ToolDefinition(
+        tool=ProcessingTool.SPATIAL_JOIN,
+        label="Spatial Join",
+        description="Add the attributes of intersecting features from another vector layer.",
+        category=ProcessingToolCategory.VECTOR,
+        params_model=SpatialJoinParams,
+        workflow_path="web_gis_app.workflows.processing_workflows.SpatialJoinWorkflow",
+        input_types=(DatasetType.VECTOR.value,),
+        output_type=DatasetType.VECTOR.value,
+        param_schema=_SPATIAL_JOIN_SCHEMA,
+    ),
+    ProcessingTool.NEAREST.value: ToolDefinition(
+        tool=ProcessingTool.NEAREST,
+        label="Nearest",
+        description="Find the nearest features of another vector layer, with distances.",
+        category=ProcessingToolCategory.VECTOR,
+        params_model=NearestParams,
+        workflow_path="web_gis_app.workflows.processing_workflows.NearestWorkflow",
+        input_types=(DatasetType.VECTOR.value,),
+        output_type=DatasetType.VECTOR.value,
+        param_schema=_NEAREST_SCHEMA,
+    ),
     ProcessingTool.HILLSHADE.value: ToolDefinition(
         tool=ProcessingTool.HILLSHADE,
         label="Hillshade",
@@ -382,6 +551,7 @@ TOOL_REGISTRY: dict[str, ToolDefinition] = {
         input_types=(DatasetType.RASTER.value,),
         output_type=DatasetType.RASTER.value,
         param_schema=_CLIP_RASTER_SCHEMA,
+        remote_read=True,
     ),
     ProcessingTool.RASTER_CALCULATOR.value: ToolDefinition(
         tool=ProcessingTool.RASTER_CALCULATOR,
@@ -393,6 +563,31 @@ TOOL_REGISTRY: dict[str, ToolDefinition] = {
         input_types=(DatasetType.RASTER.value,),
         output_type=DatasetType.RASTER.value,
         param_schema=_RASTER_CALC_SCHEMA,
+        remote_read=True,
+    ),
+    ProcessingTool.REPROJECT_RASTER.value: ToolDefinition(
+        tool=ProcessingTool.REPROJECT_RASTER,
+        label="Reproject (Raster)",
+        description="Reproject a raster to another CRS, optionally resampling it.",
+        category=ProcessingToolCategory.RASTER,
+        params_model=ReprojectRasterParams,
+        workflow_path="web_gis_app.workflows.processing_workflows.ReprojectRasterWorkflow",
+        input_types=(DatasetType.RASTER.value,),
+        output_type=DatasetType.RASTER.value,
+        param_schema=_REPROJECT_RASTER_SCHEMA,
+        remote_read=True,
+    ),
+    ProcessingTool.ZONAL_STATS.value: ToolDefinition(
+        tool=ProcessingTool.ZONAL_STATS,
+        label="Zonal Statistics",
+        description="Summarise raster values (count, min, max, mean, sum) per zone polygon.",
+        category=ProcessingToolCategory.RASTER,
+        params_model=ZonalStatsParams,
+        workflow_path="web_gis_app.workflows.processing_workflows.ZonalStatsWorkflow",
+        input_types=(DatasetType.RASTER.value,),
+        output_type=DatasetType.VECTOR.value,
+        param_schema=_ZONAL_STATS_SCHEMA,
+        remote_read=True,
     ),
 }
 
@@ -4,6 +4,7 @@ from django.db import transaction
 from django.http import FileResponse
 from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.generics import get_object_or_404
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
@@ -45,12 +46,36 @@ class DatasetNodeViewSet(ModelViewSet):
             return DatasetNodeTreeSerializer
         return DatasetNodeSerializer
 
+    def get_queryset(self):
+        return super().get_queryset().filter(user=self.request.user)
+
     def list(self, request):
-        """Get all root nodes with their children in a nested tree structure"""
-        root_nodes = DatasetNode.objects.filter(parent__isnull=True).select_related(
-            "dataset"
-        )
-        serializer = self.get_serializer(root_nodes, many=True)
+        """
+        Get the user's nodes as a nested tree structure.
+
+        Large trees can be expanded lazily: `?parent=<id>` returns the subtree
+        below a node and `?depth=<n>` limits it to n levels.
+        """
+        parent = None
+        depth = request.query_params.get("depth")
+
+        if parent_id := request.query_params.get("parent"):
+            parent = get_object_or_404(self.get_queryset(), pk=parent_id)
+
+        if depth is not None:
+            try:
+                depth = int(depth)
+            except ValueError:
+                depth = 0
+
+            if depth < 1:
+                return Response(
+                    {"error": "depth must be a positive integer"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        nodes = DatasetNode.objects.tree_of(request.user, parent=parent, depth=depth)
+        serializer = self.get_serializer(nodes, many=True)
         return Response(serializer.data)
 
     def _create_folder(self, request):
@@ -220,14 +245,21 @@ class DatasetNodeViewSet(ModelViewSet):
     def destroy(self, request, *args, **kwargs):
         """Delete node and cleanup associated files. If folder, deletes full hierarchy."""
         node = self.get_object()
+        datasets = DatasetNode.objects.descendants_with_dataset(node)
         storage_paths = list(
             dict.fromkeys(
-                DatasetNode.objects.descendants_with_dataset(node)
-                .filter(dataset__cloud_storage_path__isnull=False)
+                datasets.filter(dataset__cloud_storage_path__isnull=False)
                 .exclude(dataset__cloud_storage_path="")
                 .values_list("dataset__cloud_storage_path", flat=True)
             )
         )
+        # Tileset COGs go in the same batch delete as the dataset files.
+        storage_paths.extend(
+            DatasetStorageService.build_tileset_storage_key(tileset_id=tileset_id)
+            for tileset_id in datasets.filter(
+                dataset__tileset__isnull=False
+            ).values_list("dataset__tileset__id", flat=True)
+        )
 
         transaction.on_commit(
             partial(
@@ -1,9 +1,30 @@
+import json
+from collections import defaultdict
+from uuid import UUID
+
+from django.contrib.gis.db.models.functions import AsGeoJSON
+from django.contrib.gis.geos import Polygon
+from django.db.models import TextField
+from django.db.models.functions import Cast
+from django.http import StreamingHttpResponse
 from rest_framework import status, viewsets
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from ..models.feature_models import Feature
-from ..serializers.feature_serializers import FeatureSerializer
+from ..serializers.feature_serializers import (
+    FeatureBatchEditSerializer,
+    FeatureSerializer,
+)
+from ..services import FeatureEditService
+
+FEATURE_QUERY_DEFAULT_LIMIT = 1000
+FEATURE_QUERY_MAX_LIMIT = 10000
+# Rows fetched per round trip from the server-side cursor when streaming.
+FEATURE_STREAM_CHUNK_SIZE = 2000
+# Query parameters filtering on feature properties, e.g. ?properties.kind=road
+PROPERTY_FILTER_PREFIX = "properties."
 
 
 class FeatureViewSet(viewsets.ModelViewSet):
@@ -28,6 +49,190 @@ class FeatureViewSet(viewsets.ModelViewSet):
 
         serializer = self.get_serializer(data=request.data, many=True)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
+        features = serializer.save()
+        self._record_features_added(features)
 
         return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    def perform_create(self, serializer):
+        feature = serializer.save()
+        self._record_features_added([feature])
+
+    def perform_update(self, serializer):
+        old_dataset_id = serializer.instance.dataset_id
+        feature = serializer.save()
+
+        for dataset_id in {old_dataset_id, feature.dataset_id}:
+            FeatureEditService.record_changes(dataset_id=dataset_id, modified=True)
+
+    def perform_destroy(self, instance):
+        dataset_id = instance.dataset_id
+        super().perform_destroy(instance)
+        FeatureEditService.record_changes(dataset_id=dataset_id, modified=True)
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="batch",
+        serializer_class=FeatureBatchEditSerializer,
+    )
+    def batch(self, request):
+        """
+        Apply a mixed batch of inserts, updates and deletes to one dataset in a
+        single transaction; returns the ids given to inserted features by ref.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        result = FeatureEditService.apply_batch(
+            dataset=serializer.validated_data["dataset"],
+            **serializer.validated_data["edits"],
+        )
+
+        return Response(result)
+
+    @action(detail=False, methods=["get"], url_path="query")
+    def query(self, request):
+        """
+        Query a dataset's features as GeoJSON.
+
+        Parameters: dataset (required), bbox=minLng,minLat,maxLng,maxLat
+        (index-backed && test), properties.<key>=<value> (JSON containment),
+        limit and after (the `next` cursor of the previous page). With
+        stream=true the whole result is streamed from a server-side cursor as
+        a GeoJSON FeatureCollection instead of being paginated.
+        """
+        try:
+            features = self._filter_features(request.query_params)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Geometry and properties are encoded by PostGIS, not by serializers.
+        rows = (
+            features.order_by("id")
+            .annotate(
+                geometry_json=AsGeoJSON("geometry"),
+                properties_json=Cast("properties", output_field=TextField()),
+            )
+            .values_list("id", "geometry_json", "properties_json")
+        )
+
+        if request.query_params.get("stream", "").lower() == "true":
+            return StreamingHttpResponse(
+                _stream_feature_collection(
+                    rows.aiterator(chunk_size=FEATURE_STREAM_CHUNK_SIZE)
+                ),
+                content_type="application/geo+json",
+            )
+
+        try:
+            limit = int(request.query_params.get("limit", FEATURE_QUERY_DEFAULT_LIMIT))
+        except ValueError:
+            return Response(
+                {"error": "limit must be an integer"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        limit = max(1, min(limit, FEATURE_QUERY_MAX_LIMIT))
+        page = list(rows[: limit + 1])
+        next_cursor = str(page[limit - 1][0]) if len(page) > limit else None
+
+        return Response(
+            {
+                "type": "FeatureCollection",
+                "features": [
+                    {
+                        "type": "Feature",
+                        "id": str(feature_id),
+                        "geometry": json.loads(geometry_json),
+                        "properties": json.loads(properties_json),
+                    }
+                    for feature_id, geometry_json, properties_json in page[:limit]
+                ],
+                "next": next_cursor,
+            }
+        )
+
+    def _filter_features(self, params):
+        dataset_id = params.get("dataset")
+
+        if not dataset_id:
+            raise ValueError("dataset is required")
+
+        # Keyset pagination walks the (dataset_id, id) index.
+        features = self.get_queryset().filter(dataset_id=_parse_uuid(dataset_id))
+
+        if after := params.get("after"):
+            features = features.filter(id__gt=_parse_uuid(after))
+
+        if bbox := params.get("bbox"):
+            try:
+                min_lng, min_lat, max_lng, max_lat = map(float, bbox.split(","))
+            except ValueError:
+                raise ValueError("bbox must be minLng,minLat,maxLng,maxLat")
+
+            envelope = Polygon.from_bbox((min_lng, min_lat, max_lng, max_lat))
+            envelope.srid = 4326
+            features = features.filter(geometry__bboverlaps=envelope)
+
+        for param, value in params.items():
+            if param.startswith(PROPERTY_FILTER_PREFIX):
+                key = param.removeprefix(PROPERTY_FILTER_PREFIX)
+                features = features.filter(
+                    properties__contains={key: _parse_value(value)}
+                )
+
+        return features
+
+    @staticmethod
+    def _record_features_added(features):
+        features_by_dataset = defaultdict(list)
+
+        for feature in features:
+            features_by_dataset[feature.dataset_id].append(feature)
+
+        for dataset_id, dataset_features in features_by_dataset.items():
+            FeatureEditService.record_changes(
+                dataset_id=dataset_id, added=dataset_features
+            )
+
+
+def _parse_uuid(value: str) -> UUID:
+    try:
+        return UUID(value)
+    except ValueError:
+        raise ValueError(f"Invalid id: {value}")
+
+
+def _parse_value(value: str):
+    """Property filter values are JSON when they parse, strings otherwise."""
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+async def _stream_feature_collection(rows):
+    """Write a FeatureCollection from (id, geometry json, properties json) rows.
+
+    An async generator, so under ASGI each chunk is sent as soon as it is
+    fetched; Django would read a sync iterator into a list before sending.
+    """
+    yield '{"type":"FeatureCollection","features":['
+
+    chunk = []
+    separator = ""
+
+    async for feature_id, geometry_json, properties_json in rows:
+        chunk.append(
+            f'{separator}{{"type":"Feature","id":"{feature_id}",'
+            f'"geometry":{geometry_json},"properties":{properties_json}}}'
+        )
+        separator = ","
+
+        if len(chunk) >= FEATURE_STREAM_CHUNK_SIZE:
+            yield "".join(chunk)
+            chunk = []
+
+    chunk.append("]}")
+    yield "".join(chunk)
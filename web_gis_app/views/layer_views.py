@@ -10,3 +10,11 @@ class LayerViewSet(BaseModelViewSet):
     queryset = Layer.objects.all()
     permission_classes = [IsAuthenticated]
     serializer_class = LayerSerializer
+
+    def get_queryset(self):
+        # Stats and tileset are read for every listed layer.
+        return (
+            super()
+            .get_queryset()
+            .select_related("source", "source__stats", "source__tileset")
+        )
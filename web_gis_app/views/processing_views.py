@@ -9,13 +9,15 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
+from shared.infrastructure import InfraManager
+
 from ..constants import ProcessingJobStatus
 from ..models import ProcessingJob
 from ..serializers.processing_serializers import (
     ProcessingJobCreateSerializer,
     ProcessingJobSerializer,
 )
-from ..tasks import run_processing_tool
+from ..tasks import processing_task_options, run_processing_tool
 from ..tool_registry import list_tools
 
 
@@ -57,7 +59,10 @@ class ProcessingJobViewSet(ModelViewSet):
         )
         job.input_datasets.set(validated["_datasets"])
 
-        async_result = run_processing_tool.delay(str(job.id))
+        async_result = run_processing_tool.apply_async(
+            args=[str(job.id)],
+            **processing_task_options(validated["_tool"], validated["_datasets"]),
+        )
         job.celery_task_id = async_result.id
         job.save(update_fields=["celery_task_id", "updated_at"])
 
@@ -77,6 +82,9 @@ class ProcessingJobViewSet(ModelViewSet):
         if job.celery_task_id:
             AsyncResult(job.celery_task_id).revoke(terminate=True)
 
+        if job.batch_job_id:
+            InfraManager.batch_compute.cancel_job(job.batch_job_id)
+
         job.status = ProcessingJobStatus.FAILED
         job.error_message = "Cancelled by user."
         job.save(update_fields=["status", "error_message", "updated_at"])
@@ -10,7 +10,8 @@ from rest_framework import status
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rio_tiler.errors import TileOutsideBounds
+from rio_tiler.colormap import cmap
+from rio_tiler.errors import InvalidColorMapName, TileOutsideBounds
 from rio_tiler.io import Reader
 
 from shared.infrastructure import InfraManager
@@ -26,8 +27,15 @@ class DatasetTileView(APIView):
     Serve XYZ map tiles from a processed raster dataset.
 
     GET /datasets/<dataset_id>/tiles/<z>/<x>/<y>.png
+
+    Non-terrain tiles are stretched with the band statistics stored in the
+    dataset metadata; single-band tiles are coloured with ?colormap=<name>.
     """
 
+    # Colormaps applied to single-band rasters when ?colormap= is not given.
+    DEFAULT_COLORMAPS = {"elevation": "terrain"}
+    DEFAULT_COLORMAP = "viridis"
+
     permission_classes = [AllowAny]
 
     def get(self, request, pk, z, x, y):
@@ -55,6 +63,14 @@ class DatasetTileView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
+        try:
+            colormap = self._get_colormap(request, tileset)
+        except InvalidColorMapName:
+            return Response(
+                {"error": f"Unknown colormap: {request.query_params['colormap']}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
         try:
             # Build the full object storage URL for rio-tiler to read.
             storage_url = self._build_storage_url(tileset.storage_path)
@@ -124,7 +140,21 @@ class DatasetTileView(APIView):
                         content = rgb_tile.render(img_format="PNG")
                     else:
                         tile_data = src.tile(x, y, z)
-                        content = tile_data.render(img_format="PNG")
+                        in_range = self._get_rescale_range(tileset)
+
+                        if in_range:
+                            tile_data.rescale(in_range=in_range)
+
+                        # Colormaps index 8-bit values, so only stretched or
+                        # 8-bit single-band tiles can be coloured.
+                        colorable = (
+                            tile_data.data.shape[0] == 1
+                            and tile_data.data.dtype == "uint8"
+                        )
+                        content = tile_data.render(
+                            img_format="PNG",
+                            colormap=colormap if colorable else None,
+                        )
 
             return HttpResponse(content, content_type="image/png")
 
@@ -190,13 +220,58 @@ class DatasetTileView(APIView):
             "CPL_VSIL_CURL_ALLOWED_EXTENSIONS": ".tif,.tiff",
         }
 
+    @staticmethod
+    def _get_rescale_range(tileset: TileSet) -> Optional[list]:
+        """
+        Per-band (p2, p98) stretch from the stored band statistics.
+
+        8-bit imagery is rendered as is; None when there is nothing to rescale.
+        """
+        band_stats = (tileset.dataset.metadata or {}).get("band_stats") or []
+
+        if not band_stats or all(band.get("dtype") == "uint8" for band in band_stats):
+            return None
+
+        in_range = []
+
+        for band in band_stats:
+            if "p2" not in band:
+                return None
+
+            low, high = band["p2"], band["p98"]
+            in_range.append((low, high if high > low else low + 1))
+
+        return in_range
+
+    def _get_colormap(self, request, tileset: TileSet) -> Optional[dict]:
+        """
+        Resolve the colormap for single-band tiles.
+
+        Raises InvalidColorMapName for an unknown ?colormap= name.
+        """
+        name = request.query_params.get("colormap")
+
+        if name is None:
+            dataset_metadata = tileset.dataset.metadata or {}
+
+            # Without stored statistics the values can not be stretched to the
+            # colormap range, so keep rendering them in grayscale.
+            if not dataset_metadata.get("band_stats"):
+                return None
+
+            name = self.DEFAULT_COLORMAPS.get(
+                dataset_metadata.get("raster_kind"), self.DEFAULT_COLORMAP
+            )
+
+        return cmap.get(name.strip().lower())
+
     @staticmethod
     def _is_elevation_raster(tileset: TileSet) -> Optional[bool]:
         dataset_metadata = tileset.dataset.metadata or {}
         raster_kind = dataset_metadata.get("raster_kind")
         band_count = dataset_metadata.get("band_count")
 
-        if raster_kind in {"elevation", "ortho"}:
+        if raster_kind in {"elevation", "ortho", "raster"}:
             return raster_kind == "elevation"
 
         if isinstance(band_count, int):
@@ -15,6 +15,40 @@ from ..models import Dataset
 logger = logging.getLogger(__name__)
 
 
+def build_vector_tile_sql(z: int, x: int, y: int) -> str:
+    """SQL producing the MVT of one tile; takes the dataset id as parameter."""
+    # Convert tile coordinates to Web Mercator (EPSG:3857) bounds.
+    tile = mercantile.Tile(x=x, y=y, z=z)
+    bounds = mercantile.xy_bounds(tile)
+
+    tile_envelope = (
+        f"ST_MakeEnvelope({bounds.left}, {bounds.bottom}, "
+        f"{bounds.right}, {bounds.top}, 3857)"
+    )
+
+    return f"""
+        SELECT ST_AsMVT(tile_data, 'features', 4096, 'geom')
+        FROM (
+            SELECT
+                f.id::text AS id,
+                f.properties,
+                ST_AsMVTGeom(
+                    ST_Transform(f.geometry, 3857),
+                    {tile_envelope},
+                    4096,
+                    256,
+                    true
+                ) AS geom
+            FROM feature f
+            WHERE f.dataset_id = %s
+              -- Compare in the stored SRID so the (dataset_id, geometry) GiST
+              -- index can be used.
+              AND f.geometry && ST_Transform({tile_envelope}, 4326)
+        ) AS tile_data
+        WHERE geom IS NOT NULL
+    """
+
+
 class VectorTileView(APIView):
     """
     Serve MVT tiles for a vector dataset.
@@ -40,37 +74,13 @@ class VectorTileView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Convert tile coordinates to Web Mercator (EPSG:3857) bounds.
-        tile = mercantile.Tile(x=x, y=y, z=z)
-        bounds = mercantile.xy_bounds(tile)
-
-        tile_envelope = (
-            f"ST_MakeEnvelope({bounds.left}, {bounds.bottom}, "
-            f"{bounds.right}, {bounds.top}, 3857)"
-        )
-
-        sql = f"""
-            SELECT ST_AsMVT(tile_data, 'features', 4096, 'geom')
-            FROM (
-                SELECT
-                    f.id::text AS id,
-                    f.properties,
-                    ST_AsMVTGeom(
-                        ST_Transform(f.geometry, 3857),
-                        {tile_envelope},
-                        4096,
-                        256,
-                        true
-                    ) AS geom
-                FROM feature f
-                WHERE f.dataset_id = %s
-                  AND ST_Intersects(
-                      ST_Transform(f.geometry, 3857),
-                      {tile_envelope}
-                  )
-            ) AS tile_data
-            WHERE geom IS NOT NULL
-        """
+        # Tiles only change with the dataset's features, tracked by its version.
+        etag = f'"{dataset.pk}-{dataset.version}"'
+
+        if request.headers.get("If-None-Match") == etag:
+            return HttpResponse(status=304, headers={"ETag": etag})
+
+        sql = build_vector_tile_sql(z, x, y)
 
         try:
             with connection.cursor() as cursor:
@@ -83,6 +93,7 @@ class VectorTileView(APIView):
                 mvt_data,
                 content_type="application/x-protobuf",
                 status=200,
+                headers={"ETag": etag},
             )
 
         except Exception as e:
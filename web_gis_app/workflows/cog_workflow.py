@@ -11,7 +11,7 @@ from shared.workflows.operations.download import Download
 from shared.workflows.operations.upload import Upload
 
 from ..constants import TileSetStatus
-from ..helpers import get_raster_info, get_raster_kind
+from ..helpers import compute_band_stats, get_raster_info, get_raster_kind
 from ..models import TileSet
 from ..notifications import send_notification
 
@@ -29,28 +29,37 @@ class UpdateTileSetPayload(StrictPayload):
 class GenerateCOG(Operation[GenerateCOGPayload, dict]):
     name = "generate_cog"
 
+    def checkpoint_valid(self, output):
+        return os.path.exists(os.path.join(self.payload.work_dir, "output.tif"))
+
     def execute(self, *args, **kwargs):
         input_path = self.payload.input_path
         work_dir = self.payload.work_dir
         output_path = os.path.join(work_dir, "output.tif")
 
         import rasterio
-
-        # If the input TIFF lacks a CRS, assign EPSG:4326 iteratively to headers without loading massive arrays into RAM (which causes OOM crashes).
-        with rasterio.open(input_path, "r+") as src:
-            if not src.crs:
-                src.crs = "EPSG:4326"
+        from rasterio.vrt import WarpedVRT
 
         # Use LZW compression profile for COG.
         output_profile = cog_profiles.get("lzw")
 
-        cog_translate(
-            input_path,
-            output_path,
-            output_profile,
-            overview_level=6,
-            quiet=True,
-        )
+        # Inputs may be remote (/vsis3/) or hardlinked read-only from the worker
+        # object cache, so a missing CRS is assigned through a VRT instead of
+        # rewriting the source headers.
+        with rasterio.open(input_path) as src:
+            if src.crs:
+                cog_translate(
+                    src, output_path, output_profile, overview_level=6, quiet=True
+                )
+            else:
+                with WarpedVRT(src, src_crs="EPSG:4326") as vrt:
+                    cog_translate(
+                        vrt,
+                        output_path,
+                        output_profile,
+                        overview_level=6,
+                        quiet=True,
+                    )
 
         raster_info = get_raster_info(output_path)
 
@@ -73,6 +82,7 @@ class GenerateCOG(Operation[GenerateCOGPayload, dict]):
             "max_zoom": raster_info.maxzoom,
             "band_count": band_count,
             "raster_kind": raster_kind,
+            "band_stats": compute_band_stats(output_path),
         }
 
 
@@ -97,6 +107,7 @@ class UpdateTileSet(Operation[UpdateTileSetPayload, dict]):
         dataset_metadata = dict(dataset.metadata or {})
         dataset_metadata["band_count"] = tileset_metadata.get("band_count", 0)
         dataset_metadata["raster_kind"] = tileset_metadata.get("raster_kind", "raster")
+        dataset_metadata["band_stats"] = tileset_metadata.get("band_stats", [])
         dataset.metadata = dataset_metadata
         dataset.save(update_fields=["metadata"])
 
@@ -119,11 +130,13 @@ class COGWorkflow(Workflow):
     Workflow to process an orthomosaic raster into a tile-ready COG.
 
     Operations run sequentially:
-    1. Download — fetch source from object storage (shared operation).
+    1. Download — fetch source from object storage (shared operation). Optional;
+       skipped when GenerateCOG reads the source through /vsis3/.
     2. GenerateCOG — convert to Cloud Optimized GeoTIFF.
     3. Upload — push result back to object storage (shared operation).
     4. UpdateTileSet — update the TileSet record.
     """
 
     name = "cog_workflow"
+    optional_operations = (Download,)
     operations = (Download, GenerateCOG, Upload, UpdateTileSet)
@@ -1,3 +1,5 @@
+from shared.infrastructure import InfraManager
+
 from ..constants import DatasetNodeType, DatasetStatus, DatasetType, FileFormat
 from ..models import Dataset, DatasetNode
 
@@ -9,14 +11,61 @@ def report_progress(ctx: dict, progress: int, message: str = "") -> None:
         reporter.report(progress, message)
 
 
-def create_staging_dataset(user) -> Dataset:
+def input_object_fingerprint(ctx: dict, path: str) -> str | None:
+    """Identify a raster input by the object storage version it was read from.
+
+    Works for /vsis3/ paths and for files placed by the Download operation;
+    returns None for inputs with no known object version.
+    """
+    if path.startswith("/vsis3/"):
+        bucket, _, key = path.removeprefix("/vsis3/").partition("/")
+        info = InfraManager.object_storage.get_object_info(key=key, bucket=bucket)
+        etag = info.get("etag")
+    else:
+        transfer = next(
+            (
+                transfer
+                for transfer in ctx.get("transfer_metrics", [])
+                if transfer.get("operation") == "download"
+                and transfer.get("path") == path
+            ),
+            None,
+        )
+
+        if transfer is None:
+            return None
+
+        bucket, key, etag = transfer["bucket"], transfer["key"], transfer.get("etag")
+
+    return f"{bucket}/{key}@{etag}" if etag else None
+
+
+def require_vector_dataset(user, dataset_id: str) -> str:
+    """Check that a dataset an op reads features from is a vector dataset of `user`."""
+    dataset = Dataset.objects.filter(pk=dataset_id, dataset_node__user=user).first()
+
+    if dataset is None:
+        raise ValueError(f"Dataset {dataset_id} not found.")
+
+    if dataset.type != DatasetType.VECTOR:
+        raise ValueError(f"Dataset {dataset_id} is not a vector dataset.")
+
+    return dataset_id
+
+
+def create_staging_dataset(ctx: dict, user) -> Dataset:
+    """Create the dataset an op writes its features to until CreateOutputDataset.
+
+    It is recorded in ctx as soon as it exists, so a job that fails partway
+    through the op can still discard it.
+    """
     node = DatasetNode.objects.create(
         name="__processing_staging__",
         type=DatasetNodeType.DATASET.value,
         user=user,
     )
 
-    return Dataset.objects.create(
+    staging = Dataset.objects.create(
         dataset_node=node,
         type=DatasetType.VECTOR,
         format=FileFormat.GEOPACKAGE,
@@ -25,3 +74,11 @@ def create_staging_dataset(user) -> Dataset:
         cloud_storage_path="",
         status=DatasetStatus.PENDING,
     )
+    ctx["pending_feature_dataset_id"] = str(staging.id)
+
+    return staging
+
+
+def discard_staging_dataset(dataset_id: str) -> None:
+    """Delete a staging dataset and its features; its node cascades to both."""
+    DatasetNode.objects.filter(dataset__pk=dataset_id).delete()
@@ -3,7 +3,9 @@ from .raster_workflows.raster_workflows import (
     ContourWorkflow,
     HillshadeWorkflow,
     RasterCalcWorkflow,
+    ReprojectRasterWorkflow,
     SlopeWorkflow,
+    ZonalStatsWorkflow,
 )
 from .vector_workflows.vector_workflows import (
     BufferWorkflow,
@@ -11,7 +13,9 @@ from .vector_workflows.vector_workflows import (
     ClipVectorWorkflow,
     ConvexHullWorkflow,
     DissolveWorkflow,
+    NearestWorkflow,
     SimplifyWorkflow,
+    SpatialJoinWorkflow,
 )
 
 __all__ = [
@@ -21,9 +25,13 @@ __all__ = [
     "ConvexHullWorkflow",
     "DissolveWorkflow",
     "SimplifyWorkflow",
+    "SpatialJoinWorkflow",
+    "NearestWorkflow",
     "ClipRasterWorkflow",
     "ContourWorkflow",
     "HillshadeWorkflow",
     "RasterCalcWorkflow",
+    "ReprojectRasterWorkflow",
     "SlopeWorkflow",
+    "ZonalStatsWorkflow",
 ]
@@ -2,24 +2,249 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Optional
+from contextlib import contextmanager
+from typing import Callable, Optional
 
-import matplotlib.cm as cm
 import numpy as np
 import rasterio
+from django.conf import settings
 from django.contrib.gis.geos import GEOSGeometry
+from matplotlib import colormaps
 from pydantic import Field
 from rasterio.crs import CRS
 from rasterio.mask import mask as rio_mask
-from rasterio.warp import Resampling, reproject
+from rasterio.warp import Resampling
 from shapely.geometry import mapping, shape
 from shapely.ops import unary_union
 
+from shared.infrastructure import InfraManager
+from shared.infrastructure.storage import object_disk_cache
 from shared.schemas import StrictPayload
 from shared.workflows.base import Operation
 
+from ...helpers import compute_band_stats, get_raster_kind
 from ...models import Feature, ProcessingJob
-from ..helpers import create_staging_dataset, report_progress
+from ..helpers import (
+    create_staging_dataset,
+    input_object_fingerprint,
+    report_progress,
+    require_vector_dataset,
+)
+
+# Creation options for raster op outputs. Ops write straight through GDAL's COG
+# driver, so the file on disk is already tiled, compressed and has overviews and
+# ExtractRasterMetadata does not need to rewrite it.
+COG_WRITE_OPTIONS = {
+    "driver": "COG",
+    "compress": "DEFLATE",
+    "blocksize": 512,
+    "overview_resampling": "NEAREST",
+    "bigtiff": "IF_SAFER",
+}
+
+# Profile keys that are GTiff creation options and not understood by the COG driver.
+_GTIFF_ONLY_PROFILE_KEYS = (
+    "blockxsize",
+    "blockysize",
+    "tiled",
+    "interleave",
+    "compress",
+    "photometric",
+)
+
+
+def cog_profile(profile: dict, **overrides) -> dict:
+    """Build a COG driver write profile from a source raster profile."""
+    output_profile = {
+        key: value
+        for key, value in profile.items()
+        if key not in _GTIFF_ONLY_PROFILE_KEYS
+    }
+    output_profile.update(overrides)
+    output_profile.update(COG_WRITE_OPTIONS)
+
+    return output_profile
+
+
+# Creation options of intermediate files written window by window; finished
+# outputs are converted to COGs afterwards.
+TILED_WRITE_OPTIONS = {
+    "driver": "GTiff",
+    "tiled": True,
+    "blockxsize": 512,
+    "blockysize": 512,
+    "compress": "DEFLATE",
+    "bigtiff": "IF_SAFER",
+}
+
+# Side of the square windows raster ops stream over, a multiple of the block size.
+RASTER_WINDOW_SIZE = 2048
+
+
+def iter_windows(width: int, height: int, size: int = RASTER_WINDOW_SIZE):
+    """Yield square windows of at most `size` pixels covering a raster, row by row."""
+    from rasterio.windows import Window
+
+    for row_off in range(0, height, size):
+        for col_off in range(0, width, size):
+            yield Window(
+                col_off,
+                row_off,
+                min(size, width - col_off),
+                min(size, height - row_off),
+            )
+
+
+def tiled_profile(src, **overrides) -> dict:
+    """Write profile of a tiled GTiff on the grid of `src` (a dataset or a VRT)."""
+    profile = {
+        "width": src.width,
+        "height": src.height,
+        "count": src.count,
+        "dtype": src.dtypes[0],
+        "crs": src.crs,
+        "transform": src.transform,
+        "nodata": src.nodata,
+    }
+    profile.update(overrides)
+    profile.update(TILED_WRITE_OPTIONS)
+
+    return profile
+
+
+@contextmanager
+def warped_vrt(
+    src,
+    dst_crs,
+    *,
+    resolution: Optional[float] = None,
+    resampling: Resampling = Resampling.bilinear,
+    nodata: Optional[float] = None,
+    dtype: Optional[str] = None,
+):
+    """Reproject `src` on the fly with GDAL's multithreaded warper.
+
+    Only the windows read from the VRT are warped, so memory follows the
+    window size instead of the raster size.
+    """
+    from rasterio.vrt import WarpedVRT
+    from rasterio.warp import calculate_default_transform
+
+    transform, width, height = calculate_default_transform(
+        src.crs,
+        dst_crs,
+        src.width,
+        src.height,
+        *src.bounds,
+        resolution=resolution,
+    )
+
+    with WarpedVRT(
+        src,
+        crs=dst_crs,
+        transform=transform,
+        width=width,
+        height=height,
+        resampling=resampling,
+        nodata=nodata,
+        dtype=dtype,
+        num_threads=settings.WEB_GIS_WARP_THREADS,
+    ) as vrt:
+        yield vrt
+
+
+@contextmanager
+def open_metric_dem(path: str):
+    """Open a DEM in a metric CRS, warping geographic DEMs to EPSG:3857 on the fly.
+
+    Gradient units then match elevation units.
+    """
+    with rasterio.open(path) as src:
+        if src.crs and src.crs.is_geographic:
+            with warped_vrt(
+                src, CRS.from_epsg(3857), nodata=np.nan, dtype="float32"
+            ) as vrt:
+                yield vrt
+        else:
+            yield src
+
+
+def write_windowed(
+    src,
+    output_path: str,
+    profile: dict,
+    compute: Callable[[np.ma.MaskedArray], np.ndarray],
+    *,
+    halo: int = 0,
+    cog: bool = True,
+    ctx: Optional[dict] = None,
+    progress: tuple[int, int] = (20, 85),
+) -> None:
+    """Stream `src` through `compute` window by window into a tiled raster.
+
+    `compute` gets the masked bands of a window grown by `halo` pixels on each
+    side (less at the raster edges) and returns the output bands for that same
+    area. A masked result is written with the profile nodata, or as the dataset
+    mask when there is none. With `cog`, the file is converted to a COG at the
+    end.
+    """
+    from rasterio.windows import Window
+
+    write_path = f"{output_path}.part.tif" if cog else output_path
+    windows = list(iter_windows(src.width, src.height))
+    start, end = progress
+
+    with rasterio.open(write_path, "w", **profile) as dst:
+        for index, window in enumerate(windows):
+            col_off = max(0, window.col_off - halo)
+            row_off = max(0, window.row_off - halo)
+            padded = Window(
+                col_off,
+                row_off,
+                min(src.width, window.col_off + window.width + halo) - col_off,
+                min(src.height, window.row_off + window.height + halo) - row_off,
+            )
+
+            result = compute(src.read(window=padded, masked=True))
+            rows = slice(
+                window.row_off - row_off, window.row_off - row_off + window.height
+            )
+            cols = slice(
+                window.col_off - col_off, window.col_off - col_off + window.width
+            )
+            result = result[:, rows, cols]
+
+            if isinstance(result, np.ma.MaskedArray):
+                if dst.nodata is None:
+                    valid = ~np.ma.getmaskarray(result).all(axis=0)
+                    dst.write_mask(valid.astype("uint8") * 255, window=window)
+                    result = result.data
+                else:
+                    result = result.filled(dst.nodata)
+
+            dst.write(result, window=window)
+
+            if ctx is not None and index % 10 == 0:
+                report_progress(
+                    ctx,
+                    start + int((end - start) * (index + 1) / len(windows)),
+                    f"Processed {index + 1}/{len(windows)} raster windows",
+                )
+
+    if cog:
+        from rio_cogeo.cogeo import cog_translate
+        from rio_cogeo.profiles import cog_profiles
+
+        try:
+            cog_translate(
+                write_path,
+                output_path,
+                cog_profiles.get("deflate"),
+                overview_resampling="nearest",
+                quiet=True,
+            )
+        finally:
+            os.remove(write_path)
 
 
 class _RasterOpPayloadBase(StrictPayload):
@@ -28,59 +253,101 @@ class _RasterOpPayloadBase(StrictPayload):
     work_dir: str
 
 
+class _RasterOutputMixin:
+    """Raster op whose output file is reused on resume while it still exists."""
+
+    def checkpoint_valid(self, output):
+        return os.path.exists(output["output_path"])
+
+
+class _CachedRasterOutputMixin(_RasterOutputMixin):
+    """Memoize a raster op whose result is `work_dir/output.tif`.
+
+    Nothing is stored on a miss: the cache entry is written by Upload and
+    points at the job's own uploaded output (see ctx["pending_artifact_cache"]).
+    On a hit that object is placed in the work dir instead of recomputing it,
+    and Upload copies it server-side. ctx["operation_artifacts"] then maps the
+    output path to the stored object version so ExtractRasterMetadata can be
+    memoized downstream.
+    """
+
+    cacheable = True
+    cache_exclude = frozenset({"job_id", "input_path", "work_dir"})
+
+    def input_fingerprint(self):
+        return input_object_fingerprint(self.ctx, self.payload.input_path)
+
+    def cache_entry(self, cache_key, output):
+        self.ctx.setdefault("pending_artifact_cache", {})[output["output_path"]] = {
+            "cache_key": cache_key,
+            "ttl": self.cache_ttl,
+        }
+
+        return None
+
+    def restore_cached(self, cache_key, entry):
+        output_path = os.path.join(self.payload.work_dir, "output.tif")
+        artifact = entry["artifact"]
+        result = object_disk_cache.materialize(
+            InfraManager.object_storage,
+            key=artifact["key"],
+            path=output_path,
+            bucket=artifact["bucket"],
+        )
+
+        if result.get("etag") != artifact["etag"]:
+            raise ValueError(f"Cached artifact {artifact['key']} has changed.")
+
+        self._record_artifact(output_path, result)
+        self.ctx.setdefault("cached_artifacts", {})[output_path] = artifact
+        report_progress(self.ctx, 85, "Reused result of an identical earlier run")
+        self.ctx["raster_output_path"] = output_path
+
+        return {"output_path": output_path}
+
+    def _record_artifact(self, output_path, result):
+        self.ctx.setdefault("operation_artifacts", {})[output_path] = (
+            f"{result['bucket']}/{result['key']}@{result['etag']}"
+        )
+
+
 class HillshadeOpPayload(_RasterOpPayloadBase):
     azimuth: float = 315.0
     altitude: float = 45.0
     z_factor: float = 1.0
 
 
-class HillshadeOp(Operation[HillshadeOpPayload, dict]):
+class HillshadeOp(_CachedRasterOutputMixin, Operation[HillshadeOpPayload, dict]):
     """Compute a hillshade GeoTIFF from a DEM."""
 
     name = "hillshade_op"
 
     def execute(self, *args, **kwargs) -> dict:
-        report_progress(self.ctx, 20, "Reading DEM...")
+        report_progress(self.ctx, 20, "Computing hillshade...")
 
-        with rasterio.open(self.payload.input_path) as src:
-            nodata = src.nodata
-            profile = src.profile.copy()
-            crs = src.crs
+        output_path = os.path.join(self.payload.work_dir, "output.tif")
 
-            # Reproject to a metric CRS so gradient units match elevation units.
-            if crs and crs.is_geographic:
-                from rasterio.warp import calculate_default_transform
+        with open_metric_dem(self.payload.input_path) as dem:
+            xres, yres = dem.res
+            # The NaN fill reads 1 pixel around each pixel and the gradient
+            # reads 1 more, so a 2 pixel halo keeps windows seamless.
+            write_windowed(
+                dem,
+                output_path,
+                tiled_profile(dem, count=4, dtype="uint8", nodata=None),
+                lambda data: self._shade(data, xres, yres),
+                halo=2,
+                ctx=self.ctx,
+            )
 
-                dst_crs = CRS.from_epsg(3857)
-                transform, width, height = calculate_default_transform(
-                    crs, dst_crs, src.width, src.height, *src.bounds
-                )
-                metric_data = np.empty((height, width), dtype="float32")
-                reproject(
-                    source=rasterio.band(src, 1),
-                    destination=metric_data,
-                    src_transform=src.transform,
-                    src_crs=crs,
-                    dst_transform=transform,
-                    dst_crs=dst_crs,
-                    resampling=Resampling.bilinear,
-                    src_nodata=nodata,
-                    dst_nodata=np.nan,
-                )
-                elevation = metric_data
-                xres = transform.a
-                yres = abs(transform.e)
-                profile.update(
-                    crs=dst_crs, transform=transform, width=width, height=height
-                )
-            else:
-                elevation = src.read(1).astype("float32")
-                xres, yres = src.res
+        report_progress(self.ctx, 85, "Hillshade written")
+        self.ctx["raster_output_path"] = output_path
 
-                if nodata is not None:
-                    elevation = np.where(elevation == nodata, np.nan, elevation)
+        return {"output_path": output_path}
 
-        report_progress(self.ctx, 50, "Computing hillshade...")
+    def _shade(self, data, xres: float, yres: float) -> np.ndarray:
+        """RGBA hillshade of one window of elevation."""
+        elevation = data[0].astype("float32").filled(np.nan)
 
         # Fill small NaN gaps with interpolated values so the gradient is smooth.
         nan_mask = np.isnan(elevation)
@@ -110,29 +377,16 @@ class HillshadeOp(Operation[HillshadeOpPayload, dict]):
         shaded = np.clip(shaded * 255.0, 0, 255).astype("uint8")
 
         # Restore nodata areas as transparent (0).
-        if nan_mask.shape == shaded.shape:
-            shaded[nan_mask] = 0
+        shaded[nan_mask] = 0
 
         norm = shaded.astype("float32") / 255.0
-        colormap = cm.get_cmap("terrain")
+        colormap = colormaps["terrain"]
         rgba = (colormap(norm) * 255).astype("uint8")  # shape: (H, W, 4)
 
         # Mark nodata pixels as fully transparent.
-        if nan_mask.shape == shaded.shape:
-            rgba[nan_mask, 3] = 0
-
-        output_path = os.path.join(self.payload.work_dir, "output.tif")
-        profile.update(dtype="uint8", count=4, compress="lzw")
-        profile.pop("nodata", None)
-
-        with rasterio.open(output_path, "w", **profile) as dst:
-            for i in range(4):
-                dst.write(rgba[:, :, i], i + 1)
-
-        report_progress(self.ctx, 85, "Hillshade written")
-        self.ctx["raster_output_path"] = output_path
+        rgba[nan_mask, 3] = 0
 
-        return {"output_path": output_path}
+        return np.moveaxis(rgba, -1, 0)
 
 
 class SlopeOpPayload(_RasterOpPayloadBase):
@@ -140,93 +394,99 @@ class SlopeOpPayload(_RasterOpPayloadBase):
     z_factor: float = 1.0
 
 
-class SlopeOp(Operation[SlopeOpPayload, dict]):
+class SlopeOp(_CachedRasterOutputMixin, Operation[SlopeOpPayload, dict]):
     """Compute slope GeoTIFF from a DEM."""
 
     name = "slope_op"
 
     def execute(self, *args, **kwargs) -> dict:
-        report_progress(self.ctx, 20, "Reading DEM...")
+        report_progress(self.ctx, 20, "Computing slope...")
 
-        with rasterio.open(self.payload.input_path) as src:
-            nodata = src.nodata
-            profile = src.profile.copy()
-            crs = src.crs
+        slope_path = os.path.join(self.payload.work_dir, "slope.tif")
+        output_path = os.path.join(self.payload.work_dir, "output.tif")
+        value_range = [np.inf, -np.inf]
+
+        # First pass: slope values, tracking the range the colormap is stretched to.
+        with open_metric_dem(self.payload.input_path) as dem:
+            xres, yres = dem.res
+            write_windowed(
+                dem,
+                slope_path,
+                tiled_profile(dem, count=1, dtype="float32", nodata=np.nan),
+                lambda data: self._slope(data, xres, yres, value_range),
+                halo=1,
+                cog=False,
+                ctx=self.ctx,
+                progress=(20, 50),
+            )
 
-            if crs and crs.is_geographic:
-                from rasterio.warp import calculate_default_transform
+        vmax = 100.0 if self.payload.units == "percent" else 90.0
+        s_min, s_max = value_range
 
-                dst_crs = CRS.from_epsg(3857)
-                transform, width, height = calculate_default_transform(
-                    crs, dst_crs, src.width, src.height, *src.bounds
-                )
-                metric_data = np.empty((height, width), dtype="float32")
-                reproject(
-                    source=rasterio.band(src, 1),
-                    destination=metric_data,
-                    src_transform=src.transform,
-                    src_crs=crs,
-                    dst_transform=transform,
-                    dst_crs=dst_crs,
-                    resampling=Resampling.bilinear,
-                    src_nodata=nodata,
-                    dst_nodata=np.nan,
-                )
-                elevation = metric_data
-                xres = transform.a
-                yres = abs(transform.e)
-                profile.update(
-                    crs=dst_crs, transform=transform, width=width, height=height
+        if s_min > s_max:
+            s_min, s_max = 0.0, vmax
+
+        s_max = s_max if s_max > s_min else s_min + 1.0
+
+        report_progress(self.ctx, 50, "Colouring slope...")
+
+        # Second pass: normalise s_min→s_max and apply viridis colormap, output RGBA.
+        try:
+            with rasterio.open(slope_path) as slope_src:
+                write_windowed(
+                    slope_src,
+                    output_path,
+                    tiled_profile(slope_src, count=4, dtype="uint8", nodata=None),
+                    lambda data: self._colorize(data, s_min, s_max),
+                    ctx=self.ctx,
+                    progress=(50, 85),
                 )
-            else:
-                elevation = src.read(1).astype("float32")
-                xres, yres = src.res
+        finally:
+            os.remove(slope_path)
+
+        report_progress(self.ctx, 85, "Slope written")
+        self.ctx["raster_output_path"] = output_path
 
-                if nodata is not None:
-                    elevation = np.where(elevation == nodata, np.nan, elevation)
+        return {"output_path": output_path}
 
+    def _slope(self, data, xres: float, yres: float, value_range: list) -> np.ndarray:
+        """Slope of one window of elevation; widens `value_range` to its values."""
+        elevation = data[0].astype("float32").filled(np.nan)
         nan_mask = np.isnan(elevation)
         elevation_filled = np.where(nan_mask, 0.0, elevation)
 
-        report_progress(self.ctx, 50, "Computing slope...")
-
         dz_dx, dz_dy = np.gradient(elevation_filled * self.payload.z_factor, xres, yres)
         slope_rad = np.arctan(np.sqrt(dz_dx * dz_dx + dz_dy * dz_dy))
 
         if self.payload.units == "percent":
             slope_values = np.tan(slope_rad) * 100.0
-            vmax = 100.0
         else:
             slope_values = np.rad2deg(slope_rad)
-            vmax = 90.0
 
         slope_values[nan_mask] = np.nan
 
-        # Normalise 0→vmax and apply viridis colormap, output RGBA.
         valid_slope = slope_values[~nan_mask]
-        s_min = float(np.nanmin(valid_slope)) if valid_slope.size > 0 else 0.0
-        s_max = float(np.nanmax(valid_slope)) if valid_slope.size > 0 else vmax
-        s_max = s_max if s_max > s_min else s_min + 1.0
+
+        if valid_slope.size > 0:
+            value_range[0] = min(value_range[0], float(valid_slope.min()))
+            value_range[1] = max(value_range[1], float(valid_slope.max()))
+
+        return slope_values[np.newaxis].astype("float32")
+
+    @staticmethod
+    def _colorize(data, s_min: float, s_max: float) -> np.ndarray:
+        """RGBA viridis rendering of one window of slope values."""
+        slope_values = data[0].astype("float32").filled(np.nan)
+        nan_mask = np.isnan(slope_values)
 
         norm = np.clip((slope_values - s_min) / (s_max - s_min), 0.0, 1.0)
         norm = np.where(nan_mask, 0.0, norm)
 
-        colormap = cm.get_cmap("viridis")
+        colormap = colormaps["viridis"]
         rgba = (colormap(norm) * 255).astype("uint8")
         rgba[nan_mask, 3] = 0
 
-        output_path = os.path.join(self.payload.work_dir, "output.tif")
-        profile.update(dtype="uint8", count=4, compress="lzw")
-        profile.pop("nodata", None)
-
-        with rasterio.open(output_path, "w", **profile) as dst:
-            for i in range(4):
-                dst.write(rgba[:, :, i], i + 1)
-
-        report_progress(self.ctx, 85, "Slope written")
-        self.ctx["raster_output_path"] = output_path
-
-        return {"output_path": output_path}
+        return np.moveaxis(rgba, -1, 0)
 
 
 class ContourOpPayload(_RasterOpPayloadBase):
@@ -283,7 +543,7 @@ class ContourOp(Operation[ContourOpPayload, dict]):
         plt.close(fig)
 
         job = ProcessingJob.objects.get(pk=self.payload.job_id)
-        staging = create_staging_dataset(job.user)
+        staging = create_staging_dataset(self.ctx, job.user)
 
         features_batch = []
 
@@ -315,7 +575,6 @@ class ContourOp(Operation[ContourOpPayload, dict]):
         if features_batch:
             Feature.objects.bulk_create(features_batch)
 
-        self.ctx["pending_feature_dataset_id"] = str(staging.id)
         report_progress(self.ctx, 85, "Contours written")
 
         return {}
@@ -326,7 +585,7 @@ class ClipRasterOpPayload(_RasterOpPayloadBase):
     clip_geometry: Optional[dict] = None
 
 
-class ClipRasterOp(Operation[ClipRasterOpPayload, dict]):
+class ClipRasterOp(_RasterOutputMixin, Operation[ClipRasterOpPayload, dict]):
     """Clip a raster by a GeoJSON polygon or by the union of a vector dataset."""
 
     name = "clip_raster_op"
@@ -357,11 +616,11 @@ class ClipRasterOp(Operation[ClipRasterOpPayload, dict]):
             )
             profile = src.profile.copy()
 
-        profile.update(
+        profile = cog_profile(
+            profile,
             height=clipped.shape[1],
             width=clipped.shape[2],
             transform=clipped_transform,
-            compress="lzw",
         )
 
         output_path = os.path.join(self.payload.work_dir, "output.tif")
@@ -380,7 +639,7 @@ class RasterCalcOpPayload(_RasterOpPayloadBase):
     band_mapping: dict = Field(default_factory=dict)
 
 
-class RasterCalcOp(Operation[RasterCalcOpPayload, dict]):
+class RasterCalcOp(_RasterOutputMixin, Operation[RasterCalcOpPayload, dict]):
     """Evaluate a safe math expression across raster bands.
 
     `band_mapping` maps variable names to 1-based band indices, e.g.
@@ -426,13 +685,15 @@ class RasterCalcOp(Operation[RasterCalcOpPayload, dict]):
         result = np.asarray(result, dtype="float32")
 
         output_path = os.path.join(self.payload.work_dir, "output.tif")
-        profile.update(count=1, dtype="float32", compress="lzw")
+        profile = cog_profile(profile, count=1, dtype="float32")
 
         with rasterio.open(output_path, "w", **profile) as dst:
             dst.write(result, 1)
 
         report_progress(self.ctx, 85, "Result written")
         self.ctx["raster_output_path"] = output_path
+        # A single-band result is not a DEM, so it must not be served as terrain.
+        self.ctx["raster_output_kind"] = "raster"
 
         return {"output_path": output_path}
 
@@ -489,10 +750,217 @@ class RasterCalcOp(Operation[RasterCalcOpPayload, dict]):
                 raise ValueError("Only whitelisted functions may be called.")
 
 
+class ReprojectRasterOpPayload(_RasterOpPayloadBase):
+    dst_crs: str
+    resolution: Optional[float] = None
+    resampling: str = "nearest"
+
+
+class ReprojectRasterOp(
+    _CachedRasterOutputMixin, Operation[ReprojectRasterOpPayload, dict]
+):
+    """Reproject and/or resample a raster to a target CRS and resolution.
+
+    The source is warped through a WarpedVRT window by window, so memory
+    follows the window size and the warp runs on WEB_GIS_WARP_THREADS threads.
+    """
+
+    name = "reproject_raster_op"
+
+    def execute(self, *args, **kwargs) -> dict:
+        report_progress(self.ctx, 10, "Reprojecting raster...")
+
+        output_path = os.path.join(self.payload.work_dir, "output.tif")
+
+        with rasterio.open(self.payload.input_path) as src:
+            if not src.crs:
+                raise ValueError("The input raster has no CRS to reproject from.")
+
+            nodata = src.nodata
+
+            # Float rasters without nodata get NaN outside the source footprint;
+            # integer rasters without nodata are filled with 0 there.
+            if nodata is None and np.issubdtype(np.dtype(src.dtypes[0]), np.floating):
+                nodata = np.nan
+
+            with warped_vrt(
+                src,
+                CRS.from_user_input(self.payload.dst_crs),
+                resolution=self.payload.resolution,
+                resampling=Resampling[self.payload.resampling],
+                nodata=nodata,
+            ) as vrt:
+                write_windowed(
+                    vrt,
+                    output_path,
+                    tiled_profile(vrt, nodata=nodata),
+                    lambda data: data,
+                    ctx=self.ctx,
+                    progress=(10, 85),
+                )
+
+        report_progress(self.ctx, 85, "Reprojected raster written")
+        self.ctx["raster_output_path"] = output_path
+
+        return {"output_path": output_path}
+
+
+# Zone features written back per INSERT.
+ZONAL_STATS_WRITE_BATCH_SIZE = 5000
+
+
+class ZonalStatsOpPayload(_RasterOpPayloadBase):
+    zone_dataset_id: str
+    band: int = 1
+    prefix: str = "zonal_"
+
+
+class ZonalStatsOp(Operation[ZonalStatsOpPayload, dict]):
+    """Summarise a raster band per polygon of a zone dataset.
+
+    Zones are burned into each raster window as integer labels and reduced
+    with np.bincount, so memory stays proportional to the window size. A pixel
+    covered by overlapping zones counts towards the zone burned last. The zone
+    features are copied to the output with count/min/max/mean/sum added to
+    their properties.
+    """
+
+    name = "zonal_stats_op"
+
+    def execute(self, *args, **kwargs) -> dict:
+        from rasterio.features import rasterize
+        from rasterio.warp import transform_geom
+        from rasterio.windows import bounds as window_bounds
+        from rasterio.windows import transform as window_transform
+        from shapely.geometry import box
+        from shapely.strtree import STRtree
+
+        job = ProcessingJob.objects.get(pk=self.payload.job_id)
+        zone_dataset_id = require_vector_dataset(job.user, self.payload.zone_dataset_id)
+        staging = create_staging_dataset(self.ctx, job.user)
+
+        report_progress(self.ctx, 10, "Reading zones...")
+
+        zones = Feature.objects.filter(dataset_id=zone_dataset_id).values_list(
+            "id", "geometry"
+        )
+
+        with rasterio.open(self.payload.input_path) as src:
+            if not 1 <= self.payload.band <= src.count:
+                raise ValueError(
+                    f"Band {self.payload.band} does not exist; "
+                    f"the raster has {src.count} band(s)."
+                )
+
+            # Zone labels start at 1 so 0 can mark pixels outside every zone.
+            zone_ids = []
+            zone_geoms = []
+
+            for feature_id, geometry in zones.iterator():
+                geojson = json.loads(geometry.json)
+
+                if src.crs:
+                    geojson = transform_geom("EPSG:4326", src.crs, geojson)
+
+                zone_ids.append(str(feature_id))
+                zone_geoms.append(shape(geojson))
+
+            if not zone_ids:
+                return {"feature_count": 0}
+
+            label_count = len(zone_ids) + 1
+            counts = np.zeros(label_count, dtype="int64")
+            sums = np.zeros(label_count, dtype="float64")
+            minimums = np.full(label_count, np.inf)
+            maximums = np.full(label_count, -np.inf)
+
+            tree = STRtree(zone_geoms)
+            windows = list(iter_windows(src.width, src.height))
+
+            for index, window in enumerate(windows):
+                hits = tree.query(box(*window_bounds(window, src.transform)))
+
+                if len(hits):
+                    labels = rasterize(
+                        ((zone_geoms[hit], int(hit) + 1) for hit in hits),
+                        out_shape=(int(window.height), int(window.width)),
+                        transform=window_transform(window, src.transform),
+                        fill=0,
+                        dtype="int32",
+                    )
+                    band = src.read(self.payload.band, window=window, masked=True)
+                    valid = (labels > 0) & ~np.ma.getmaskarray(band)
+                    values = band.filled(0).astype("float64")
+                    valid &= np.isfinite(values)
+
+                    window_labels = labels[valid]
+                    window_values = values[valid]
+
+                    counts += np.bincount(window_labels, minlength=label_count)
+                    sums += np.bincount(
+                        window_labels, weights=window_values, minlength=label_count
+                    )
+                    np.minimum.at(minimums, window_labels, window_values)
+                    np.maximum.at(maximums, window_labels, window_values)
+
+                if index % 10 == 0:
+                    report_progress(
+                        self.ctx,
+                        10 + int(70 * (index + 1) / len(windows)),
+                        f"Processed {index + 1}/{len(windows)} raster windows",
+                    )
+
+        report_progress(self.ctx, 85, "Writing zone statistics...")
+
+        prefix = self.payload.prefix
+        stats = {}
+
+        for label, feature_id in enumerate(zone_ids, start=1):
+            count = int(counts[label])
+            stats[feature_id] = {
+                f"{prefix}count": count,
+                f"{prefix}min": float(minimums[label]) if count else None,
+                f"{prefix}max": float(maximums[label]) if count else None,
+                f"{prefix}mean": float(sums[label] / count) if count else None,
+                f"{prefix}sum": float(sums[label]),
+            }
+
+        self._write_zones(staging.id, stats)
+        report_progress(self.ctx, 90, "Zonal statistics complete")
+
+        return {"feature_count": len(zone_ids)}
+
+    @staticmethod
+    def _write_zones(staging_id, stats: dict) -> None:
+        """Copy the zone features to the staging dataset with their statistics."""
+        from django.db import connection
+
+        items = list(stats.items())
+
+        with connection.cursor() as cursor:
+            for start in range(0, len(items), ZONAL_STATS_WRITE_BATCH_SIZE):
+                batch = dict(items[start : start + ZONAL_STATS_WRITE_BATCH_SIZE])
+                cursor.execute(
+                    """
+                    INSERT INTO feature (id, dataset_id, geometry, properties, created_at, updated_at)
+                    SELECT
+                        gen_random_uuid(),
+                        %s,
+                        f.geometry,
+                        f.properties || s.stats,
+                        NOW(),
+                        NOW()
+                    FROM jsonb_each(%s::jsonb) AS s(id, stats)
+                    JOIN feature f ON f.id = s.id::uuid
+                    """,
+                    [str(staging_id), json.dumps(batch)],
+                )
+
+
 # -- Raster output metadata extraction --
 #
 # Runs after the raster op but before upload so we can enrich the output
-# dataset metadata (bounds, zoom levels, band count).
+# dataset metadata (bounds, zoom levels, band count, band statistics).
 
 
 class ExtractRasterMetadataPayload(StrictPayload):
@@ -502,12 +970,33 @@ class ExtractRasterMetadataPayload(StrictPayload):
 class ExtractRasterMetadata(Operation[ExtractRasterMetadataPayload, dict]):
     """Extract bounds / zoom / band metadata from the output raster.
 
-    Also converts the file to a Cloud Optimized GeoTIFF (COG) with overviews
-    in-place so that rio-tiler can serve tiles efficiently without reading the
-    full-resolution data at every zoom level.
+    Raster ops write their output through the COG driver, so this normally
+    only reads headers and the overviews used for the band statistics that
+    tiles are rescaled with. Outputs that are not valid COGs yet are converted
+    in-place as a fallback so rio-tiler can still serve them efficiently.
     """
 
     name = "extract_raster_metadata"
+    # Memoized when the input is a stored artifact of a cached upstream op.
+    cacheable = True
+    cache_version = 2
+    cache_exclude = frozenset({"path"})
+
+    def input_fingerprint(self):
+        return self.ctx.get("operation_artifacts", {}).get(self.payload.path)
+
+    def restore_cached(self, cache_key, entry):
+        path = self.payload.path
+
+        # A cached entry only covers the headers; a non-COG output still needs
+        # converting, so fall back to a full run.
+        if not self._is_cog(path):
+            raise ValueError(f"{path} is not a COG.")
+
+        self.ctx["raster_output_metadata"] = entry["output"]
+        self.ctx["raster_output_file_size"] = os.path.getsize(path)
+
+        return entry["output"]
 
     def execute(self, *args, **kwargs) -> dict:
         import math
@@ -516,7 +1005,9 @@ class ExtractRasterMetadata(Operation[ExtractRasterMetadataPayload, dict]):
         from rasterio.warp import transform_bounds
 
         path = self.payload.path
-        self._build_cog(path)
+
+        if not self._is_cog(path):
+            self._build_cog(path)
 
         with rasterio.open(path) as src:
             src_crs = src.crs
@@ -539,6 +1030,9 @@ class ExtractRasterMetadata(Operation[ExtractRasterMetadataPayload, dict]):
             "min_zoom": max(0, max_zoom - 10),
             "max_zoom": max_zoom,
             "band_count": band_count,
+            "raster_kind": self.ctx.get("raster_output_kind")
+            or get_raster_kind(band_count),
+            "band_stats": compute_band_stats(path),
         }
 
         self.ctx["raster_output_metadata"] = metadata
@@ -546,6 +1040,15 @@ class ExtractRasterMetadata(Operation[ExtractRasterMetadataPayload, dict]):
 
         return metadata
 
+    @staticmethod
+    def _is_cog(path: str) -> bool:
+        """Check the file layout (tiling, overviews, IFD order) from its headers."""
+        from rio_cogeo.cogeo import cog_validate
+
+        is_valid, _errors, _warnings = cog_validate(path, quiet=True)
+
+        return is_valid
+
     @staticmethod
     def _build_cog(path: str) -> None:
         """Convert the file at `path` to a COG with overviews in-place."""
@@ -1,5 +1,6 @@
 from shared.workflows import Download, Upload, Workflow
 
+from ...helpers import object_storage_rio_env
 from ..shared_operations import CreateOutputDataset
 from .raster_operations import (
     ClipRasterOp,
@@ -7,12 +8,36 @@ from .raster_operations import (
     ExtractRasterMetadata,
     HillshadeOp,
     RasterCalcOp,
+    ReprojectRasterOp,
     SlopeOp,
+    ZonalStatsOp,
 )
 
 
-class HillshadeWorkflow(Workflow):
+class _RasterWorkflow(Workflow):
+    """Raster workflow whose DAG operations can read object storage through GDAL."""
+
+    def operation_context(self):
+        return object_storage_rio_env()
+
+
+def _extract_and_upload_in_parallel(raster_op):
+    """DAG in which the output COG is uploaded while its metadata is extracted.
+
+    Only for ops that always write a COG, so ExtractRasterMetadata never
+    rewrites the file Upload is reading.
+    """
+    return {
+        raster_op: (Download,),
+        ExtractRasterMetadata: (raster_op,),
+        Upload: (raster_op,),
+        CreateOutputDataset: (ExtractRasterMetadata, Upload),
+    }
+
+
+class HillshadeWorkflow(_RasterWorkflow):
     name = "hillshade_workflow"
+    optional_operations = (Download,)
     operations = (
         Download,
         HillshadeOp,
@@ -20,20 +45,25 @@ class HillshadeWorkflow(Workflow):
         Upload,
         CreateOutputDataset,
     )
+    dependencies = _extract_and_upload_in_parallel(HillshadeOp)
 
 
-class SlopeWorkflow(Workflow):
+class SlopeWorkflow(_RasterWorkflow):
     name = "slope_workflow"
+    optional_operations = (Download,)
     operations = (Download, SlopeOp, ExtractRasterMetadata, Upload, CreateOutputDataset)
+    dependencies = _extract_and_upload_in_parallel(SlopeOp)
 
 
-class ContourWorkflow(Workflow):
+class ContourWorkflow(_RasterWorkflow):
     name = "contour_workflow"
+    optional_operations = (Download,)
     operations = (Download, ContourOp, CreateOutputDataset)
 
 
-class ClipRasterWorkflow(Workflow):
+class ClipRasterWorkflow(_RasterWorkflow):
     name = "clip_raster_workflow"
+    optional_operations = (Download,)
     operations = (
         Download,
         ClipRasterOp,
@@ -43,8 +73,9 @@ class ClipRasterWorkflow(Workflow):
     )
 
 
-class RasterCalcWorkflow(Workflow):
+class RasterCalcWorkflow(_RasterWorkflow):
     name = "raster_calc_workflow"
+    optional_operations = (Download,)
     operations = (
         Download,
         RasterCalcOp,
@@ -52,3 +83,21 @@ class RasterCalcWorkflow(Workflow):
         Upload,
         CreateOutputDataset,
     )
+
+
+class ReprojectRasterWorkflow(_RasterWorkflow):
+    name = "reproject_raster_workflow"
+    optional_operations = (Download,)
+    operations = (
+        Download,
+        ReprojectRasterOp,
+        ExtractRasterMetadata,
+        Upload,
+        CreateOutputDataset,
+    )
+
+
+class ZonalStatsWorkflow(_RasterWorkflow):
+    name = "zonal_stats_workflow"
+    optional_operations = (Download,)
+    operations = (Download, ZonalStatsOp, CreateOutputDataset)
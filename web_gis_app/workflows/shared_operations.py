@@ -17,6 +17,7 @@ from ..constants import (
 )
 from ..helpers import format_to_ext
 from ..models import Dataset, DatasetNode, Feature, ProcessingJob, TileSet
+from ..services import DatasetStatsService
 
 # -- Shared output operation --
 
@@ -103,6 +104,9 @@ class CreateOutputDataset(Operation[CreateOutputDatasetPayload, dict]):
                 if staging_dataset:
                     staging_dataset.dataset_node.delete()
 
+            if self.payload.output_type == DatasetType.VECTOR.value:
+                DatasetStatsService.refresh(dataset_id=dataset.id)
+
             job.output_dataset = dataset
             job.output_node = dataset_node
             job.save(update_fields=["output_dataset", "output_node", "updated_at"])
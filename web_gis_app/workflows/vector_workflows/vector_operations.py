@@ -7,7 +7,7 @@ from django.contrib.gis.geos import GEOSGeometry
 from shared.workflows import Operation
 
 from ...models import Feature, ProcessingJob
-from ..helpers import create_staging_dataset, report_progress
+from ..helpers import create_staging_dataset, report_progress, require_vector_dataset
 from .schemas import BasePayload, BufferOpPayload
 
 
@@ -18,7 +18,7 @@ class BufferOp(Operation[BufferOpPayload, dict]):
 
     def execute(self, *args, **kwargs) -> dict:
         job = ProcessingJob.objects.get(pk=self.payload.job_id)
-        staging = create_staging_dataset(job.user)
+        staging = create_staging_dataset(self.ctx, job.user)
 
         distance_meters = self._to_meters(self.payload.distance, self.payload.units)
 
@@ -28,7 +28,6 @@ class BufferOp(Operation[BufferOpPayload, dict]):
         total = features.count()
 
         if total == 0:
-            self.ctx["pending_feature_dataset_id"] = str(staging.id)
             return {"feature_count": 0}
 
         batch = []
@@ -57,8 +56,6 @@ class BufferOp(Operation[BufferOpPayload, dict]):
         if batch:
             Feature.objects.bulk_create(batch)
 
-        self.ctx["pending_feature_dataset_id"] = str(staging.id)
-
         return {"feature_count": total}
 
     @staticmethod
@@ -102,7 +99,7 @@ class ClipVectorOp(Operation[ClipVectorOpPayload, dict]):
 
     def execute(self, *args, **kwargs) -> dict:
         job = ProcessingJob.objects.get(pk=self.payload.job_id)
-        staging = create_staging_dataset(job.user)
+        staging = create_staging_dataset(self.ctx, job.user)
 
         report_progress(self.ctx, 10, "Clipping features...")
 
@@ -135,7 +132,6 @@ class ClipVectorOp(Operation[ClipVectorOpPayload, dict]):
                 ],
             )
 
-        self.ctx["pending_feature_dataset_id"] = str(staging.id)
         report_progress(self.ctx, 90, "Clip complete")
 
         return {}
@@ -152,7 +148,7 @@ class DissolveOp(Operation[DissolveOpPayload, dict]):
 
     def execute(self, *args, **kwargs) -> dict:
         job = ProcessingJob.objects.get(pk=self.payload.job_id)
-        staging = create_staging_dataset(job.user)
+        staging = create_staging_dataset(self.ctx, job.user)
 
         report_progress(self.ctx, 10, "Dissolving features...")
 
@@ -160,7 +156,6 @@ class DissolveOp(Operation[DissolveOpPayload, dict]):
             Feature.objects.filter(dataset_id=self.payload.input_dataset_id).count()
             == 0
         ):
-            self.ctx["pending_feature_dataset_id"] = str(staging.id)
             return {"feature_count": 0}
 
         from django.db import connection
@@ -209,7 +204,6 @@ class DissolveOp(Operation[DissolveOpPayload, dict]):
                     [str(staging.id), self.payload.input_dataset_id],
                 )
 
-        self.ctx["pending_feature_dataset_id"] = str(staging.id)
         report_progress(self.ctx, 90, "Dissolve complete")
 
         return {}
@@ -226,7 +220,7 @@ class CentroidOp(Operation[CentroidOpPayload, dict]):
 
     def execute(self, *args, **kwargs) -> dict:
         job = ProcessingJob.objects.get(pk=self.payload.job_id)
-        staging = create_staging_dataset(job.user)
+        staging = create_staging_dataset(self.ctx, job.user)
 
         report_progress(self.ctx, 10, "Computing centroids...")
 
@@ -249,7 +243,6 @@ class CentroidOp(Operation[CentroidOpPayload, dict]):
                 [str(staging.id), self.payload.input_dataset_id],
             )
 
-        self.ctx["pending_feature_dataset_id"] = str(staging.id)
         report_progress(self.ctx, 90, "Centroid complete")
 
         return {}
@@ -266,7 +259,7 @@ class SimplifyOp(Operation[SimplifyOpPayload, dict]):
 
     def execute(self, *args, **kwargs) -> dict:
         job = ProcessingJob.objects.get(pk=self.payload.job_id)
-        staging = create_staging_dataset(job.user)
+        staging = create_staging_dataset(self.ctx, job.user)
 
         report_progress(self.ctx, 10, "Simplifying geometries...")
 
@@ -295,7 +288,6 @@ class SimplifyOp(Operation[SimplifyOpPayload, dict]):
                 ],
             )
 
-        self.ctx["pending_feature_dataset_id"] = str(staging.id)
         report_progress(self.ctx, 90, "Simplify complete")
 
         return {}
@@ -312,7 +304,7 @@ class ConvexHullOp(Operation[ConvexHullOpPayload, dict]):
 
     def execute(self, *args, **kwargs) -> dict:
         job = ProcessingJob.objects.get(pk=self.payload.job_id)
-        staging = create_staging_dataset(job.user)
+        staging = create_staging_dataset(self.ctx, job.user)
 
         report_progress(self.ctx, 10, "Computing convex hull...")
 
@@ -320,7 +312,6 @@ class ConvexHullOp(Operation[ConvexHullOpPayload, dict]):
             Feature.objects.filter(dataset_id=self.payload.input_dataset_id).count()
             == 0
         ):
-            self.ctx["pending_feature_dataset_id"] = str(staging.id)
             return {"feature_count": 0}
 
         from django.db import connection
@@ -362,7 +353,210 @@ class ConvexHullOp(Operation[ConvexHullOpPayload, dict]):
                     [str(staging.id), self.payload.input_dataset_id],
                 )
 
-        self.ctx["pending_feature_dataset_id"] = str(staging.id)
         report_progress(self.ctx, 90, "Convex hull complete")
 
         return {}
+
+
+# Input features joined per INSERT ... SELECT by the join tools.
+JOIN_CHUNK_SIZE = 1000
+
+# Lower bound of the keyset walk over feature ids.
+_MIN_UUID = "00000000-0000-0000-0000-000000000000"
+
+
+class _ChunkedJoinMixin:
+    """Join the input features to a second dataset in keyset-ordered chunks.
+
+    Each chunk is one INSERT ... SELECT, so PostGIS plans the join against the
+    (dataset, geometry) GiST index and progress is reported between chunks.
+    """
+
+    def _insert_chunked(self, staging, select_sql: str, params: list) -> int:
+        """Insert the rows of `select_sql` for every chunk of input features.
+
+        `select_sql` reads the chunk as `chunk a` and yields geometry and
+        properties columns. Returns the number of inserted features.
+        """
+        from django.db import connection
+
+        total = Feature.objects.filter(dataset_id=self.payload.input_dataset_id).count()
+        sql = f"""
+            WITH chunk AS (
+                SELECT id, geometry, properties
+                FROM feature
+                WHERE dataset_id = %s AND id > %s
+                ORDER BY id
+                LIMIT %s
+            ),
+            inserted AS (
+                INSERT INTO feature (id, dataset_id, geometry, properties, created_at, updated_at)
+                SELECT gen_random_uuid(), %s, joined.geometry, joined.properties, NOW(), NOW()
+                FROM ({select_sql}) AS joined
+                RETURNING 1
+            )
+            SELECT
+                (SELECT id FROM chunk ORDER BY id DESC LIMIT 1),
+                (SELECT count(*) FROM inserted)
+        """
+        last_id = _MIN_UUID
+        processed = 0
+        inserted = 0
+
+        with connection.cursor() as cursor:
+            while True:
+                cursor.execute(
+                    sql,
+                    [
+                        self.payload.input_dataset_id,
+                        last_id,
+                        JOIN_CHUNK_SIZE,
+                        str(staging.id),
+                        *params,
+                    ],
+                )
+                last_id, chunk_inserted = cursor.fetchone()
+
+                if last_id is None:
+                    break
+
+                inserted += chunk_inserted
+                processed = min(total, processed + JOIN_CHUNK_SIZE)
+                report_progress(
+                    self.ctx,
+                    10 + int(80 * processed / max(total, 1)),
+                    f"Joined {processed}/{total} features",
+                )
+
+        return inserted
+
+
+class SpatialJoinOpPayload(BasePayload):
+    join_dataset_id: str
+    prefix: str = "join_"
+    keep_unmatched: bool = False
+
+
+class SpatialJoinOp(_ChunkedJoinMixin, Operation[SpatialJoinOpPayload, dict]):
+    """Add the properties of intersecting join features to every input feature.
+
+    An input feature is written once per intersecting join feature, and once
+    without join properties when nothing intersects and keep_unmatched is set.
+    """
+
+    name = "spatial_join_op"
+
+    def execute(self, *args, **kwargs) -> dict:
+        job = ProcessingJob.objects.get(pk=self.payload.job_id)
+        join_dataset_id = require_vector_dataset(job.user, self.payload.join_dataset_id)
+        staging = create_staging_dataset(self.ctx, job.user)
+
+        report_progress(self.ctx, 10, "Joining features...")
+
+        join_type = "LEFT JOIN" if self.payload.keep_unmatched else "JOIN"
+        feature_count = self._insert_chunked(
+            staging,
+            f"""
+            SELECT
+                a.geometry,
+                a.properties || COALESCE(
+                    (SELECT jsonb_object_agg(%s || key, value) FROM jsonb_each(b.properties)),
+                    '{{}}'::jsonb
+                ) AS properties
+            FROM chunk a
+            {join_type} feature b
+              ON b.dataset_id = %s
+             AND ST_Intersects(a.geometry, b.geometry)
+            """,
+            [self.payload.prefix, join_dataset_id],
+        )
+
+        report_progress(self.ctx, 90, "Spatial join complete")
+
+        return {"feature_count": feature_count}
+
+
+class NearestOpPayload(BasePayload):
+    near_dataset_id: str
+    k: int = 1
+    max_distance: Optional[float] = None
+    prefix: str = "near_"
+
+
+class NearestOp(_ChunkedJoinMixin, Operation[NearestOpPayload, dict]):
+    """Find the k nearest features of a second dataset for every input feature.
+
+    Candidates come from a KNN index scan (`<->`) per input feature in a
+    LATERAL subquery. An input feature is written once per neighbour, with the
+    neighbour's properties, its rank and its geodesic distance in meters.
+    """
+
+    name = "nearest_op"
+
+    def execute(self, *args, **kwargs) -> dict:
+        job = ProcessingJob.objects.get(pk=self.payload.job_id)
+        near_dataset_id = require_vector_dataset(job.user, self.payload.near_dataset_id)
+        staging = create_staging_dataset(self.ctx, job.user)
+
+        report_progress(self.ctx, 10, "Finding nearest features...")
+
+        prefix = self.payload.prefix
+        params = [prefix, f"{prefix}rank", f"{prefix}distance", near_dataset_id]
+        distance_filter = ""
+
+        if self.payload.max_distance is not None:
+            # The geography ST_DWithin cannot use the planar GiST index, so
+            # candidates are first limited to a box grown by an upper bound of
+            # max_distance in degrees: a degree of latitude is at least
+            # 110574 m, a degree of longitude at least 111319 m * cos(latitude)
+            # at the box's highest latitude.
+            distance_filter = """
+                AND b.geometry && ST_Expand(
+                    a.geometry,
+                    %s / (111319.0 * GREATEST(cos(radians(LEAST(90.0,
+                        GREATEST(abs(ST_YMin(a.geometry)), abs(ST_YMax(a.geometry)))
+                        + %s / 110574.0
+                    ))), 1e-6)),
+                    %s / 110574.0
+                )
+                AND ST_DWithin(a.geometry::geography, b.geometry::geography, %s)
+            """
+            params.extend([self.payload.max_distance] * 4)
+
+        params.append(self.payload.k)
+
+        # `<->` orders by planar distance in degrees; the reported distance is
+        # geodesic, so ranks far from the equator can differ slightly from it.
+        feature_count = self._insert_chunked(
+            staging,
+            f"""
+            SELECT
+                a.geometry,
+                a.properties
+                    || COALESCE(
+                        (SELECT jsonb_object_agg(%s || key, value) FROM jsonb_each(n.properties)),
+                        '{{}}'::jsonb
+                    )
+                    || jsonb_build_object(
+                        %s, row_number() OVER (PARTITION BY a.id ORDER BY n.knn),
+                        %s, n.distance
+                    ) AS properties
+            FROM chunk a
+            CROSS JOIN LATERAL (
+                SELECT
+                    b.properties,
+                    b.geometry <-> a.geometry AS knn,
+                    ST_Distance(a.geometry::geography, b.geometry::geography) AS distance
+                FROM feature b
+                WHERE b.dataset_id = %s
+                  {distance_filter}
+                ORDER BY b.geometry <-> a.geometry
+                LIMIT %s
+            ) AS n
+            """,
+            params,
+        )
+
+        report_progress(self.ctx, 90, "Nearest complete")
+
+        return {"feature_count": feature_count}
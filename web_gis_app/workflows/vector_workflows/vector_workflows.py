@@ -7,7 +7,9 @@ from .vector_operations import (
     ClipVectorOp,
     ConvexHullOp,
     DissolveOp,
+    NearestOp,
     SimplifyOp,
+    SpatialJoinOp,
 )
 
 
@@ -39,3 +41,13 @@ class SimplifyWorkflow(Workflow):
 class ConvexHullWorkflow(Workflow):
     name = "convex_hull_workflow"
     operations = (ConvexHullOp, CreateOutputDataset)
+
+
+class SpatialJoinWorkflow(Workflow):
+    name = "spatial_join_workflow"
+    operations = (SpatialJoinOp, CreateOutputDataset)
+
+
+class NearestWorkflow(Workflow):
+    name = "nearest_workflow"
+    operations = (NearestOp, CreateOutputDataset)